@@ -1,14 +1,19 @@
 import os
 import uuid
 import threading
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
 from flask_cors import CORS
+import json
 import logging
 from datetime import datetime
 
 from services.spotify_service import SpotifyService
 from services.graph_service import GraphService
 from services.search_service import SearchService
+from services.name_index import NameIndex
+from services.metadata_store import ArtistMetadataStore
+from services.frontier_crawler import FrontierCrawler
+from config import Config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -18,13 +23,23 @@ app = Flask(__name__)
 CORS(app)
 
 # Initialize services
-spotify_service = SpotifyService()
+name_index = NameIndex()
+metadata_store = ArtistMetadataStore()
+spotify_service = SpotifyService(name_index, metadata_store)
 graph_service = GraphService()
-search_service = SearchService(spotify_service, graph_service)
+frontier_crawler = FrontierCrawler(spotify_service, graph_service)
+search_service = SearchService(spotify_service, graph_service, frontier_crawler)
+
+if Config.FRONTIER_CRAWLER_ENABLED:
+    frontier_crawler.start()
 
 # Store for active searches
 active_searches = {}
 
+# Latest refresh job; only one runs at a time
+refresh_job = {}
+refresh_lock = threading.Lock()
+
 @app.route('/')
 def index():
     """Serve the main web interface."""
@@ -39,7 +54,16 @@ def start_search():
     {
         "artist1": "Artist Name 1",
         "artist2": "Artist Name 2", 
-        "algorithm": "bfs" or "dfs"
+        "algorithm": "bfs", "dfs", "iddfs", "astar" or "dijkstra",
+        "expand": true or false (optional, BFS only: crawl uncrawled artists during the search),
+        "paths": "all_shortest" or "k_shortest" (optional: also list alternative routes),
+        "paths_offset": 0, "paths_limit": 10 (optional: page of alternative routes),
+        "filters": {                       (optional, BFS only: constrain the artists on the path)
+            "exclude_artists": ["Artist Name"],
+            "genres": ["hip hop"],
+            "min_popularity": 50, "max_popularity": 100,
+            "include_unknown": true        (keep artists without recorded metadata)
+        }
     }
     """
     try:
@@ -51,12 +75,37 @@ def start_search():
         artist1 = data.get('artist1', '').strip()
         artist2 = data.get('artist2', '').strip()
         algorithm = data.get('algorithm', 'bfs').lower()
+        expand = bool(data.get('expand', Config.LAZY_EXPANSION_DEFAULT))
+        paths = data.get('paths')
         
         if not artist1 or not artist2:
             return jsonify({'error': 'Both artist names are required'}), 400
             
-        if algorithm not in ['bfs', 'dfs']:
-            return jsonify({'error': 'Algorithm must be "bfs" or "dfs"'}), 400
+        if algorithm not in ['bfs', 'dfs', 'iddfs', 'astar', 'dijkstra']:
+            return jsonify({'error': 'Algorithm must be "bfs", "dfs", "iddfs", "astar" or "dijkstra"'}), 400
+            
+        if expand and algorithm != 'bfs':
+            if 'expand' in data:
+                return jsonify({'error': 'On-demand crawling ("expand") is only supported with BFS'}), 400
+            expand = False
+        
+        filters, error = _parse_search_filters(data.get('filters'))
+        if error:
+            return jsonify({'error': error}), 400
+        if filters and (algorithm != 'bfs' or expand):
+            return jsonify({'error': 'Filters are only supported with BFS without on-demand crawling'}), 400
+        
+        if paths is not None and paths not in ['all_shortest', 'k_shortest']:
+            return jsonify({'error': 'Paths must be "all_shortest" or "k_shortest"'}), 400
+        
+        try:
+            paths_offset = int(data.get('paths_offset', 0))
+            paths_limit = int(data.get('paths_limit', Config.PATH_PAGE_SIZE))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'paths_offset and paths_limit must be integers'}), 400
+        
+        if paths_offset < 0 or paths_limit < 1 or paths_offset + paths_limit > Config.MAX_ENUMERATED_PATHS:
+            return jsonify({'error': f'paths_offset + paths_limit must be between 1 and {Config.MAX_ENUMERATED_PATHS}'}), 400
         
         # Generate unique search ID
         search_id = str(uuid.uuid4())
@@ -71,13 +120,16 @@ def start_search():
             'started_at': datetime.now().isoformat(),
             'artist1': artist1,
             'artist2': artist2,
-            'algorithm': algorithm
+            'algorithm': algorithm,
+            'expand': expand,
+            'paths': paths,
+            'filters': filters
         }
         
         # Start search in background thread
         thread = threading.Thread(
             target=_run_search,
-            args=(search_id, artist1, artist2, algorithm)
+            args=(search_id, artist1, artist2, algorithm, expand, paths, paths_offset, paths_limit, filters)
         )
         thread.daemon = True
         thread.start()
@@ -159,8 +211,8 @@ def search_artists():
         if len(query) < 2:
             return jsonify({'artists': []})
             
-        # Get artist suggestions from Spotify
-        artists = spotify_service.search_artists(query, limit=10)
+        # Get artist suggestions from the local index, falling back to Spotify
+        artists = search_service.suggest_artists(query, limit=10)
         
         return jsonify({'artists': artists})
         
@@ -168,7 +220,206 @@ def search_artists():
         logger.error(f"Error searching artists: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
-def _run_search(search_id, artist1, artist2, algorithm):
+@app.route('/api/artists/bounds', methods=['GET'])
+def get_separation_bounds():
+    """Get instant lower and upper bounds on the degrees of separation of two artists."""
+    try:
+        artist1 = request.args.get('artist1', '').strip()
+        artist2 = request.args.get('artist2', '').strip()
+        
+        if not artist1 or not artist2:
+            return jsonify({'error': 'Query parameters "artist1" and "artist2" are required'}), 400
+        if not search_service.index_ready():
+            return _index_pending()
+        
+        bounds = search_service.get_separation_bounds(artist1, artist2)
+        if bounds is None:
+            return jsonify({'error': 'Both artists must be in the indexed graph'}), 404
+        
+        return jsonify(bounds)
+        
+    except Exception as e:
+        logger.error(f"Error getting separation bounds: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/artists/walks', methods=['GET'])
+def get_walk_counts():
+    """Count the walks of length 1..k between two artists, or from one artist to its most connected artists."""
+    try:
+        artist1 = request.args.get('artist1', '').strip()
+        artist2 = request.args.get('artist2', '').strip()
+        
+        if not artist1:
+            return jsonify({'error': 'Query parameter "artist1" is required'}), 400
+        
+        try:
+            length = int(request.args.get('length', 3))
+            limit = int(request.args.get('limit', 10))
+        except ValueError:
+            return jsonify({'error': 'length and limit must be integers'}), 400
+        
+        if not 1 <= length <= Config.WALK_COUNT_MAX_LENGTH:
+            return jsonify({'error': f'length must be between 1 and {Config.WALK_COUNT_MAX_LENGTH}'}), 400
+        if not 1 <= limit <= 100:
+            return jsonify({'error': 'limit must be between 1 and 100'}), 400
+        if not search_service.index_ready():
+            return _index_pending()
+        
+        result = search_service.get_walk_counts(artist1, artist2 or None, length, limit)
+        if result is None:
+            return jsonify({'error': 'Artists must be in the indexed graph'}), 404
+        
+        return jsonify(result)
+        
+    except Exception as e:
+        logger.error(f"Error counting walks: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/artists/bridges', methods=['GET'])
+def get_bridge_artists():
+    """Get the artists with the highest betweenness centrality from the last betweenness job."""
+    try:
+        try:
+            limit = int(request.args.get('limit', 20))
+        except ValueError:
+            return jsonify({'error': 'limit must be an integer'}), 400
+        
+        if not 1 <= limit <= Config.BETWEENNESS_TOP_ARTISTS:
+            return jsonify({'error': f'limit must be between 1 and {Config.BETWEENNESS_TOP_ARTISTS}'}), 400
+        if not search_service.index_ready():
+            return _index_pending()
+        
+        bridges = search_service.get_bridge_artists(limit)
+        if bridges is None:
+            return jsonify({'error': 'No betweenness ranking yet; run "python manage.py betweenness"'}), 404
+        
+        return jsonify(bridges)
+        
+    except Exception as e:
+        logger.error(f"Error getting bridge artists: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/artists/<artist_id>/neighborhood', methods=['GET'])
+def get_artist_neighborhood(artist_id):
+    """Stream the artists within some degrees of an artist as newline-delimited JSON."""
+    try:
+        try:
+            hops = int(request.args.get('hops', Config.NEIGHBORHOOD_DEFAULT_HOPS))
+            limit = int(request.args.get('limit', Config.NEIGHBORHOOD_MAX_NODES))
+        except ValueError:
+            return jsonify({'error': 'hops and limit must be integers'}), 400
+        
+        if not 1 <= hops <= Config.NEIGHBORHOOD_MAX_HOPS:
+            return jsonify({'error': f'hops must be between 1 and {Config.NEIGHBORHOOD_MAX_HOPS}'}), 400
+        if not 1 <= limit <= Config.NEIGHBORHOOD_MAX_NODES:
+            return jsonify({'error': f'limit must be between 1 and {Config.NEIGHBORHOOD_MAX_NODES}'}), 400
+        
+        records = search_service.stream_neighborhood(f'https://open.spotify.com/artist/{artist_id}', hops, limit)
+        if records is None:
+            return jsonify({'error': 'Artist is not in the graph'}), 404
+        
+        lines = (json.dumps(record) + '\n' for record in records)
+        return Response(stream_with_context(lines), mimetype='application/x-ndjson')
+        
+    except Exception as e:
+        logger.error(f"Error getting neighborhood of {artist_id}: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/stats', methods=['GET'])
+def get_stats():
+    """Get graph statistics."""
+    try:
+        return jsonify(search_service.get_database_stats())
+        
+    except Exception as e:
+        logger.error(f"Error getting stats: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/crawler/status', methods=['GET'])
+def get_crawler_status():
+    """Get background frontier crawler status."""
+    try:
+        return jsonify(frontier_crawler.get_status())
+        
+    except Exception as e:
+        logger.error(f"Error getting crawler status: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/crawler/refresh', methods=['POST'])
+def start_refresh():
+    """Start a background job recrawling new releases of the stalest artists."""
+    try:
+        data = request.get_json(silent=True) or {}
+        try:
+            limit = int(data.get('limit', Config.CRAWL_REFRESH_BATCH))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'limit must be an integer'}), 400
+        
+        if limit < 1:
+            return jsonify({'error': 'limit must be at least 1'}), 400
+        limit = min(limit, Config.CRAWL_REFRESH_MAX_BATCH)
+        
+        with refresh_lock:
+            if refresh_job.get('status') == 'running':
+                return jsonify({'error': 'A refresh job is already running', **refresh_job}), 409
+            refresh_job.clear()
+            refresh_job.update({'status': 'running', 'limit': limit, 'started_at': datetime.now().isoformat()})
+        
+        thread = threading.Thread(target=_run_refresh, args=(limit,))
+        thread.daemon = True
+        thread.start()
+        
+        return jsonify({'status': 'started', 'limit': limit}), 202
+        
+    except Exception as e:
+        logger.error(f"Error starting refresh job: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+def _index_pending():
+    """Response for endpoints that need the compact graph while its first build is running."""
+    return jsonify({'error': 'The graph index is still being built, try again shortly'}), 503
+
+def _parse_search_filters(raw_filters):
+    """
+    Validate the "filters" object of a search request.
+    
+    Returns:
+        tuple: (filters dict or None, error message or None).
+    """
+    if raw_filters is None:
+        return None, None
+    if not isinstance(raw_filters, dict):
+        return None, '"filters" must be an object'
+    
+    filters = {}
+    for key in ['exclude_artists', 'genres']:
+        values = raw_filters.get(key)
+        if values is None:
+            continue
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            return None, f'"{key}" must be a list of strings'
+        values = [value.strip() for value in values if value.strip()]
+        if values:
+            filters[key] = values
+    
+    for key in ['min_popularity', 'max_popularity']:
+        if raw_filters.get(key) is None:
+            continue
+        try:
+            value = int(raw_filters[key])
+        except (TypeError, ValueError):
+            return None, f'"{key}" must be an integer'
+        if not 0 <= value <= 100:
+            return None, f'"{key}" must be between 0 and 100'
+        filters[key] = value
+    
+    if 'include_unknown' in raw_filters:
+        filters['include_unknown'] = bool(raw_filters['include_unknown'])
+    
+    return (filters or None), None
+
+def _run_search(search_id, artist1, artist2, algorithm, expand=False, paths=None, paths_offset=0, paths_limit=None,
+                filters=None):
     """Run the search in a background thread."""
     try:
         # Update status
@@ -179,7 +430,12 @@ def _run_search(search_id, artist1, artist2, algorithm):
         # Run the search
         result = search_service.find_connection(
             artist1, artist2, algorithm, 
-            progress_callback=lambda progress, message: _update_search_progress(search_id, progress, message)
+            progress_callback=lambda progress, message: _update_search_progress(search_id, progress, message),
+            expand=expand,
+            paths=paths,
+            paths_offset=paths_offset,
+            paths_limit=paths_limit,
+            filters=filters
         )
         
         if result:
@@ -202,6 +458,16 @@ def _run_search(search_id, artist1, artist2, algorithm):
         active_searches[search_id]['message'] = f'Search failed: {str(e)}'
         active_searches[search_id]['completed_at'] = datetime.now().isoformat()
 
+def _run_refresh(limit):
+    """Run the refresh job in a background thread."""
+    try:
+        result = search_service.refresh_stale_artists(limit)
+        refresh_job.update({'status': 'completed', 'result': result, 'completed_at': datetime.now().isoformat()})
+        
+    except Exception as e:
+        logger.error(f"Error in refresh job: {str(e)}")
+        refresh_job.update({'status': 'failed', 'error': str(e), 'completed_at': datetime.now().isoformat()})
+
 def _update_search_progress(search_id, progress, message):
     """Update search progress."""
     if search_id in active_searches:
@@ -14,28 +14,137 @@ class Config:
     # Spotify API configuration
     SPOTIFY_CLIENT_ID = os.environ.get('CLIENT_ID')
     SPOTIFY_CLIENT_SECRET = os.environ.get('CLIENT_SECRET')
+    SPOTIFY_CLIENT = os.environ.get('SPOTIFY_CLIENT', 'spotify').lower()  # "spotify" or "fake" for offline runs
     
     # Application configuration
     CSV_FILE = os.environ.get('CSV_FILE', 'adjacency_list.csv')
+    WEIGHTS_FILE = os.environ.get('WEIGHTS_FILE', 'adjacency_weights.csv')  # Shared track counts per connection
+    NAME_INDEX_FILE = os.environ.get('NAME_INDEX_FILE', 'artist_names.csv')
+    TRACK_INDEX_FILE = os.environ.get('TRACK_INDEX_FILE', 'artist_tracks.csv')
+    METADATA_FILE = os.environ.get('METADATA_FILE', 'artist_metadata.csv')
+    CRAWL_METADATA_FILE = os.environ.get('CRAWL_METADATA_FILE', 'crawl_metadata.csv')
     REQUEST_TIMEOUT = int(os.environ.get('REQUEST_TIMEOUT', '10'))
     RATE_LIMIT_DELAY = float(os.environ.get('RATE_LIMIT_DELAY', '0.333'))  # 3 requests per second
+    RATE_LIMIT_BURST = int(os.environ.get('RATE_LIMIT_BURST', '3'))
+    CRAWLER_CONCURRENCY = int(os.environ.get('CRAWLER_CONCURRENCY', '4'))  # Requests in flight while crawling
     MAX_RETRIES = int(os.environ.get('MAX_RETRIES', '3'))
     RETRY_DELAY = int(os.environ.get('RETRY_DELAY', '10'))
     
+    # Artist name resolution cache
+    RESOLUTION_CACHE_SIZE = int(os.environ.get('RESOLUTION_CACHE_SIZE', '10000'))
+    RESOLUTION_CACHE_TTL = int(os.environ.get('RESOLUTION_CACHE_TTL', '86400'))  # 1 day
+    RESOLUTION_CACHE_NEGATIVE_TTL = int(os.environ.get('RESOLUTION_CACHE_NEGATIVE_TTL', '600'))  # 10 minutes
+    
+    # Artist autocomplete
+    TYPEAHEAD_MIN_RESULTS = int(os.environ.get('TYPEAHEAD_MIN_RESULTS', '5'))  # Fall back to Spotify below this
+    TYPEAHEAD_SHORT_PREFIX = int(os.environ.get('TYPEAHEAD_SHORT_PREFIX', '3'))  # Longest prefix with precomputed top matches
+    TYPEAHEAD_PREFIX_TOP_K = int(os.environ.get('TYPEAHEAD_PREFIX_TOP_K', '50'))  # Top matches kept per short prefix
+    TYPEAHEAD_REBUILD_INTERVAL = int(os.environ.get('TYPEAHEAD_REBUILD_INTERVAL', '60'))
+    
+    # Fuzzy artist name matching
+    FUZZY_MIN_SCORE = float(os.environ.get('FUZZY_MIN_SCORE', '0.8'))  # Trigram similarity needed to skip Spotify
+    FUZZY_MIN_MARGIN = float(os.environ.get('FUZZY_MIN_MARGIN', '0.1'))  # Lead over the runner-up needed to skip Spotify
+    FUZZY_FALLBACK_SCORE = float(os.environ.get('FUZZY_FALLBACK_SCORE', '0.55'))  # Used only when Spotify fails
+    FUZZY_REBUILD_INTERVAL = int(os.environ.get('FUZZY_REBUILD_INTERVAL', '60'))
+    
+    # Background frontier crawler
+    FRONTIER_CRAWLER_ENABLED = os.environ.get('FRONTIER_CRAWLER_ENABLED', 'False').lower() in ['true', '1', 'yes']
+    FRONTIER_CHECKPOINT_FILE = os.environ.get('FRONTIER_CHECKPOINT_FILE', 'frontier_checkpoint.json')
+    FRONTIER_MAX_EXPANSIONS_PER_HOUR = int(os.environ.get('FRONTIER_MAX_EXPANSIONS_PER_HOUR', '120'))
+    FRONTIER_MAX_QUEUE_SIZE = int(os.environ.get('FRONTIER_MAX_QUEUE_SIZE', '100000'))
+    FRONTIER_CHECKPOINT_EVERY = int(os.environ.get('FRONTIER_CHECKPOINT_EVERY', '10'))  # Expansions between checkpoints
+    FRONTIER_RESEED_INTERVAL = int(os.environ.get('FRONTIER_RESEED_INTERVAL', '1800'))  # 30 minutes
+    FRONTIER_IDLE_SLEEP = int(os.environ.get('FRONTIER_IDLE_SLEEP', '30'))
+    FRONTIER_WEIGHT_IN_DEGREE = float(os.environ.get('FRONTIER_WEIGHT_IN_DEGREE', '1.0'))
+    FRONTIER_WEIGHT_POPULARITY = float(os.environ.get('FRONTIER_WEIGHT_POPULARITY', '0.1'))
+    FRONTIER_WEIGHT_SEARCHES = float(os.environ.get('FRONTIER_WEIGHT_SEARCHES', '10.0'))
+    
+    # On-disk Spotify response cache
+    RESPONSE_CACHE_ENABLED = os.environ.get('RESPONSE_CACHE_ENABLED', 'True').lower() in ['true', '1', 'yes']
+    RESPONSE_CACHE_DIR = os.environ.get('RESPONSE_CACHE_DIR', 'response_cache')
+    RESPONSE_CACHE_COMPRESSION = int(os.environ.get('RESPONSE_CACHE_COMPRESSION', '6'))  # zlib level
+    RESPONSE_CACHE_REVALIDATE_AFTER = int(os.environ.get('RESPONSE_CACHE_REVALIDATE_AFTER', '86400'))  # 1 day
+    RESPONSE_CACHE_PROBE_TTL = int(os.environ.get('RESPONSE_CACHE_PROBE_TTL', '300'))  # 5 minutes
+    
+    # Incremental recrawls
+    CRAWL_REFRESH_MAX_AGE = int(os.environ.get('CRAWL_REFRESH_MAX_AGE', '604800'))  # 1 week
+    CRAWL_REFRESH_BATCH = int(os.environ.get('CRAWL_REFRESH_BATCH', '50'))  # Artists per refresh job
+    CRAWL_REFRESH_MAX_BATCH = int(os.environ.get('CRAWL_REFRESH_MAX_BATCH', '500'))  # Largest requested limit
+    
+    # Graph persistence (group commit)
+    GRAPH_FLUSH_SIZE = int(os.environ.get('GRAPH_FLUSH_SIZE', '100'))  # Artist updates per write
+    GRAPH_FLUSH_INTERVAL = float(os.environ.get('GRAPH_FLUSH_INTERVAL', '5'))  # Max seconds before pending updates are written
+    
+    # Alternative path enumeration
+    PATH_PAGE_SIZE = int(os.environ.get('PATH_PAGE_SIZE', '10'))  # Default paths per page
+    MAX_ENUMERATED_PATHS = int(os.environ.get('MAX_ENUMERATED_PATHS', '200'))  # Deepest path a page may reach (offset + limit)
+    
+    # Compact graph index (landmark bounds for A*, exact distance labels)
+    LANDMARK_COUNT = int(os.environ.get('LANDMARK_COUNT', '8'))
+    GRAPH_INDEX_REBUILD_INTERVAL = int(os.environ.get('GRAPH_INDEX_REBUILD_INTERVAL', '60'))  # Min seconds between rebuilds
+    DISTANCE_LABELS_ENABLED = os.environ.get('DISTANCE_LABELS_ENABLED', 'True').lower() in ['true', '1', 'yes']
+    DISTANCE_LABELS_FILE = os.environ.get('DISTANCE_LABELS_FILE', 'distance_labels.bin')
+    
+    # Neighborhood listing (/api/artists/<id>/neighborhood)
+    NEIGHBORHOOD_DEFAULT_HOPS = int(os.environ.get('NEIGHBORHOOD_DEFAULT_HOPS', '2'))
+    NEIGHBORHOOD_MAX_HOPS = int(os.environ.get('NEIGHBORHOOD_MAX_HOPS', '3'))
+    NEIGHBORHOOD_MAX_NODES = int(os.environ.get('NEIGHBORHOOD_MAX_NODES', '5000'))  # Artists listed per request
+    
+    # Graph analytics (worker processes in manage.py, rate-limited background builds in the server)
+    GRAPH_ANALYTICS_WORKERS = int(os.environ.get('GRAPH_ANALYTICS_WORKERS', '0'))  # Worker processes, 0 = one per CPU
+    GRAPH_ANALYTICS_INTERVAL = int(os.environ.get('GRAPH_ANALYTICS_INTERVAL', '1800'))  # Min seconds between rebuilds
+    STATS_TOP_ARTISTS = int(os.environ.get('STATS_TOP_ARTISTS', '10'))  # Most connected artists in /api/stats
+    SEPARATION_STATS_ENABLED = os.environ.get('SEPARATION_STATS_ENABLED', 'True').lower() in ['true', '1', 'yes']
+    SEPARATION_SAMPLE_SIZE = int(os.environ.get('SEPARATION_SAMPLE_SIZE', '200'))  # BFS sources per graph version
+    SEPARATION_STATS_FILE = os.environ.get('SEPARATION_STATS_FILE', 'separation_stats.json')
+    BETWEENNESS_SAMPLE_SIZE = int(os.environ.get('BETWEENNESS_SAMPLE_SIZE', '500'))  # Brandes passes per job
+    BETWEENNESS_TOP_ARTISTS = int(os.environ.get('BETWEENNESS_TOP_ARTISTS', '1000'))  # Ranked artists kept in the file
+    BETWEENNESS_FILE = os.environ.get('BETWEENNESS_FILE', 'betweenness.json')
+    COMMUNITIES_ENABLED = os.environ.get('COMMUNITIES_ENABLED', 'True').lower() in ['true', '1', 'yes']
+    COMMUNITY_MAX_ROUNDS = int(os.environ.get('COMMUNITY_MAX_ROUNDS', '20'))  # Label propagation rounds
+    
+    # Walk counting (connection strength without enumerating paths)
+    WALK_COUNT_MAX_LENGTH = int(os.environ.get('WALK_COUNT_MAX_LENGTH', '6'))  # Longest walk a request may count
+    
+    # On-demand crawling during BFS searches
+    LAZY_EXPANSION_DEFAULT = os.environ.get('LAZY_EXPANSION_DEFAULT', 'False').lower() in ['true', '1', 'yes']
+    LAZY_EXPANSION_BATCH = int(os.environ.get('LAZY_EXPANSION_BATCH', '16'))  # Uncrawled artists fetched together
+    LAZY_EXPANSION_MAX_REQUESTS = int(os.environ.get('LAZY_EXPANSION_MAX_REQUESTS', '300'))  # Per search
+    LAZY_EXPANSION_TIME_BUDGET = int(os.environ.get('LAZY_EXPANSION_TIME_BUDGET', '60'))  # Seconds per search
+    
+    # Offline fake Spotify client (SPOTIFY_CLIENT=fake)
+    FAKE_SPOTIFY_ARTISTS = int(os.environ.get('FAKE_SPOTIFY_ARTISTS', '2000'))
+    FAKE_SPOTIFY_ALBUMS_PER_ARTIST = int(os.environ.get('FAKE_SPOTIFY_ALBUMS_PER_ARTIST', '6'))
+    FAKE_SPOTIFY_TRACKS_PER_ALBUM = int(os.environ.get('FAKE_SPOTIFY_TRACKS_PER_ALBUM', '10'))
+    FAKE_SPOTIFY_FEATURE_RATE = float(os.environ.get('FAKE_SPOTIFY_FEATURE_RATE', '0.3'))
+    FAKE_SPOTIFY_SEED = int(os.environ.get('FAKE_SPOTIFY_SEED', '0'))
+    FAKE_SPOTIFY_CATALOG_FILE = os.environ.get('FAKE_SPOTIFY_CATALOG_FILE', '')  # Recorded catalog JSON
+    FAKE_SPOTIFY_LATENCY = float(os.environ.get('FAKE_SPOTIFY_LATENCY', '0.05'))  # Seconds per request
+    FAKE_SPOTIFY_JITTER = float(os.environ.get('FAKE_SPOTIFY_JITTER', '0.0'))
+    FAKE_SPOTIFY_RATE_LIMIT = float(os.environ.get('FAKE_SPOTIFY_RATE_LIMIT', '0'))  # Requests per second, 0 = unlimited
+    FAKE_SPOTIFY_ERROR_RATE = float(os.environ.get('FAKE_SPOTIFY_ERROR_RATE', '0.0'))  # Fraction answered with 429
+    FAKE_SPOTIFY_RETRY_AFTER = int(os.environ.get('FAKE_SPOTIFY_RETRY_AFTER', '1'))
+    
     # Search configuration
     MAX_SEARCH_TIME = int(os.environ.get('MAX_SEARCH_TIME', '300'))  # 5 minutes max
     CLEANUP_INTERVAL = int(os.environ.get('CLEANUP_INTERVAL', '3600'))  # 1 hour
+    IDDFS_MAX_DEPTH = int(os.environ.get('IDDFS_MAX_DEPTH', '8'))  # Deepest iteration of iterative deepening DFS
     
     @classmethod
     def validate_config(cls):
         """Validate required configuration values."""
         errors = []
         
-        if not cls.SPOTIFY_CLIENT_ID:
-            errors.append("SPOTIFY_CLIENT_ID (CLIENT_ID) is required")
-            
-        if not cls.SPOTIFY_CLIENT_SECRET:
-            errors.append("SPOTIFY_CLIENT_SECRET (CLIENT_SECRET) is required")
+        if cls.SPOTIFY_CLIENT not in ['spotify', 'fake']:
+            errors.append('SPOTIFY_CLIENT must be "spotify" or "fake"')
+        
+        # The offline fake client needs no credentials
+        if cls.SPOTIFY_CLIENT != 'fake':
+            if not cls.SPOTIFY_CLIENT_ID:
+                errors.append("SPOTIFY_CLIENT_ID (CLIENT_ID) is required")
+                
+            if not cls.SPOTIFY_CLIENT_SECRET:
+                errors.append("SPOTIFY_CLIENT_SECRET (CLIENT_SECRET) is required")
             
         if errors:
             raise ValueError("Configuration errors:\n" + "\n".join(errors))
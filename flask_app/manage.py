@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Management commands for the Degrees of Spotify Flask application.
+
+Usage:
+    python manage.py build-distance-labels [options]
+    python manage.py count-walks ARTIST [--to ARTIST] [options]
+    python manage.py separation-stats [options]
+    python manage.py betweenness [options]
+    python manage.py benchmark-crawl [options]
+    python manage.py benchmark-search [options]
+
+build-distance-labels indexes the application's graph so the server can
+answer shortest-path queries from the labels right after it starts.
+count-walks scores how strongly artists are connected by counting the walks
+between them. separation-stats samples the degrees of separation of the
+application's graph in worker processes, and betweenness ranks its bridge
+artists the same way for /api/artists/bridges. The benchmarks run against the in-process fake Spotify client with data
+files in a scratch directory, so they need no credentials or network and
+never touch the application's data.
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import tempfile
+import argparse
+from config import Config
+
+# Data files redirected into the scratch directory while benchmarking
+DATA_FILE_SETTINGS = [
+    'CSV_FILE', 'WEIGHTS_FILE', 'NAME_INDEX_FILE', 'TRACK_INDEX_FILE', 'METADATA_FILE',
+    'CRAWL_METADATA_FILE', 'FRONTIER_CHECKPOINT_FILE', 'RESPONSE_CACHE_DIR', 'DISTANCE_LABELS_FILE',
+    'SEPARATION_STATS_FILE', 'BETWEENNESS_FILE'
+]
+
+def _percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def _configure_fake_client(args, data_dir):
+    """Point the configuration at the fake client and the scratch directory."""
+    Config.SPOTIFY_CLIENT = 'fake'
+    Config.FAKE_SPOTIFY_ARTISTS = args.catalog_artists
+    Config.FAKE_SPOTIFY_SEED = args.seed
+    Config.FAKE_SPOTIFY_CATALOG_FILE = args.catalog_file or ''
+    Config.FAKE_SPOTIFY_LATENCY = args.latency
+    Config.FAKE_SPOTIFY_JITTER = args.jitter
+    Config.FAKE_SPOTIFY_RATE_LIMIT = args.server_rate_limit
+    Config.FAKE_SPOTIFY_ERROR_RATE = args.error_rate
+    Config.CRAWLER_CONCURRENCY = args.concurrency
+    Config.RATE_LIMIT_DELAY = args.rate_limit_delay
+    Config.RESPONSE_CACHE_ENABLED = args.cache
+    Config.FRONTIER_CRAWLER_ENABLED = False
+    
+    for setting in DATA_FILE_SETTINGS:
+        setattr(Config, setting, os.path.join(data_dir, os.path.basename(getattr(Config, setting))))
+
+def _print_settings(args):
+    print(f"Catalog: {args.catalog_file or f'{args.catalog_artists} synthetic artists (seed {args.seed})'}")
+    print(f"Latency: {args.latency * 1000:.0f} ms (+{args.jitter * 1000:.0f} ms jitter)")
+    print(f"Server rate limit: {args.server_rate_limit or 'none'} req/s, injected 429s: {args.error_rate:.1%}")
+    print(f"Client rate limit delay: {args.rate_limit_delay} s, concurrency: {args.concurrency}, "
+          f"response cache: {'on' if args.cache else 'off'}")
+
+def _seed_graph(spotify_service, graph_service, artist_names):
+    """Crawl artists into the graph and return the ones that got connections."""
+    seeded = []
+    for artist_name in artist_names:
+        artist_url = spotify_service.get_artist_url(artist_name)
+        related_urls = spotify_service.find_related_artists(artist_url) if artist_url else []
+        if related_urls and graph_service.add_artist_connections(artist_url, related_urls):
+            seeded.append(artist_name)
+    return seeded
+
+def build_distance_labels(args):
+    """Build the exact distance labels of the application's graph."""
+    from services.graph_service import GraphService
+    from services.compact_graph import CompactGraph
+    from services.distance_labels import DistanceLabels
+    
+    graph_service = GraphService()
+    print("=" * 50)
+    print("🏷  Building distance labels")
+    print("=" * 50)
+    
+    started = time.perf_counter()
+    compact = CompactGraph.from_snapshot(graph_service.snapshot())
+    print(f"Graph:             {compact.node_count} artists, {compact.edge_count} connections "
+          f"({time.perf_counter() - started:.2f} s)")
+    
+    started = time.perf_counter()
+    labels = DistanceLabels.build(compact, Config.DISTANCE_LABELS_FILE)
+    elapsed = time.perf_counter() - started
+    description = labels.describe()
+    print(f"Labels:            {description['entries']} entries, "
+          f"{description['average_label_size']:.1f} per artist and direction, {description['bytes']} bytes")
+    print(f"Build time:        {elapsed:.2f} s -> {Config.DISTANCE_LABELS_FILE}")
+    
+    if args.verify and compact.node_count:
+        # Compare label distances with BFS from random crawled artists
+        rng = random.Random(args.seed)
+        crawled = [node for node in range(compact.node_count) if compact.neighbors(node)]
+        query_times = []
+        mismatches = 0
+        for source in rng.sample(crawled, min(args.verify, len(crawled))):
+            expected = compact.distances(source)
+            for target in rng.sample(range(compact.node_count), min(100, compact.node_count)):
+                query_started = time.perf_counter()
+                distance = labels.distance(source, target)
+                query_times.append(time.perf_counter() - query_started)
+                mismatches += (distance if distance is not None else 255) != expected[target]
+        print(f"Verified:          {len(query_times)} queries, {mismatches} mismatches")
+        print(f"Query p50 / p95:   {_percentile(query_times, 0.50) * 1e6:.1f} / "
+              f"{_percentile(query_times, 0.95) * 1e6:.1f} µs")
+        if mismatches:
+            sys.exit(1)
+    labels.close()
+    graph_service.close()
+
+def _artist_url(value, name_index):
+    """Resolve an artist URL, Spotify artist ID or locally indexed name to an artist URL."""
+    from services.name_index import ARTIST_URL_PREFIX
+    
+    if value.startswith(ARTIST_URL_PREFIX):
+        return value
+    lowered = value.lower()
+    for artist_id, name in name_index.items():
+        if name.lower() == lowered:
+            return ARTIST_URL_PREFIX + artist_id
+    return ARTIST_URL_PREFIX + value
+
+def count_walks(args):
+    """Count the walks of length 1..k from an artist in the application's graph."""
+    from services.graph_service import GraphService
+    from services.compact_graph import CompactGraph
+    from services.name_index import NameIndex
+    
+    graph_service = GraphService()
+    name_index = NameIndex()
+    compact = CompactGraph.from_snapshot(graph_service.snapshot())
+    source_url = _artist_url(args.artist, name_index)
+    target_url = _artist_url(args.to, name_index) if args.to else None
+    
+    started = time.perf_counter()
+    result = graph_service.walk_counts(source_url, args.length, target_url, args.top, compact=compact)
+    elapsed = time.perf_counter() - started
+    graph_service.close()
+    if result is None:
+        print("❌ Artist not in the graph")
+        sys.exit(1)
+    
+    print("=" * 50)
+    print(f"🔢 Walks from {name_index.get_name(source_url) or source_url}")
+    print("=" * 50)
+    print(f"Graph:             {compact.node_count} artists, {compact.edge_count} connections")
+    print(f"Counted in:        {elapsed * 1000:.0f} ms")
+    for length, (reached, total) in enumerate(zip(result['reached'], result['total_walks']), start=1):
+        print(f"Length {length}:          {total} walks reaching {reached} artists")
+    print("-" * 50)
+    if target_url:
+        print(f"To {name_index.get_name(target_url) or target_url}: {result['total']} walks "
+              f"(by length: {', '.join(str(walks) for walks in result['walks'])})")
+        return
+    for artist in result['top']:
+        print(f"{artist['total']:>16}  {name_index.get_name(artist['url']) or artist['url']}")
+
+def separation_stats(args):
+    """Sample the degrees of separation of the application's graph."""
+    from services.graph_service import GraphService
+    from services.compact_graph import CompactGraph
+    from services.separation_stats import SeparationStats
+    from services.graph_workers import worker_count
+    
+    graph_service = GraphService()
+    print("=" * 50)
+    print("📏 Sampling degrees of separation")
+    print("=" * 50)
+    
+    compact = CompactGraph.from_snapshot(graph_service.snapshot())
+    graph_service.close()
+    print(f"Graph:             {compact.node_count} artists, {compact.edge_count} connections")
+    
+    stats = SeparationStats.build(compact, args.samples, args.workers, args.seed)
+    stats.save(Config.SEPARATION_STATS_FILE)
+    description = stats.describe()
+    print(f"Sampled:           {description['sampled_artists']} artists, {description['sampled_pairs']} reachable pairs "
+          f"({worker_count(args.workers)} workers, {stats.elapsed:.2f} s) -> {Config.SEPARATION_STATS_FILE}")
+    print(f"Average:           {description['average_separation']} degrees")
+    print(f"Eff. diameter:     {description['effective_diameter']} (90% of pairs)")
+    print(f"Max observed:      {description['max_observed_distance']}")
+    print("-" * 50)
+    for distance, pairs in description['distance_distribution'].items():
+        print(f"{distance:>3} degrees:       {pairs / description['sampled_pairs']:6.1%}  ({pairs})")
+
+def betweenness(args):
+    """Estimate the betweenness centrality of the application's graph and save the ranking."""
+    from services.graph_service import GraphService
+    from services.compact_graph import CompactGraph
+    from services.betweenness import Betweenness
+    from services.graph_workers import worker_count
+    from services.name_index import NameIndex
+    
+    graph_service = GraphService()
+    print("=" * 50)
+    print("🌉 Estimating betweenness centrality")
+    print("=" * 50)
+    
+    compact = CompactGraph.from_snapshot(graph_service.snapshot())
+    graph_service.close()
+    print(f"Graph:             {compact.node_count} artists, {compact.edge_count} connections")
+    
+    estimate = Betweenness.estimate(compact, args.samples, args.workers, args.seed)
+    estimate.save(Config.BETWEENNESS_FILE, args.top)
+    print(f"Brandes passes:    {estimate.samples} ({worker_count(args.workers)} workers, "
+          f"{estimate.elapsed:.2f} s) -> {Config.BETWEENNESS_FILE}")
+    print("-" * 50)
+    name_index = NameIndex()
+    for artist in estimate.ranking(args.show):
+        print(f"{artist['score']:>16.0f}  {name_index.get_name(artist['url']) or artist['url']}")
+
+def benchmark_crawl(args):
+    """Measure crawler throughput against the fake client."""
+    from services.spotify_service import SpotifyService
+    from services.graph_service import GraphService
+    
+    spotify_service = SpotifyService()
+    graph_service = GraphService()
+    client = spotify_service.sp
+    artist_names = client.artist_names(args.artists)
+    
+    print("=" * 50)
+    print("🕷  Crawl benchmark")
+    print("=" * 50)
+    _print_settings(args)
+    
+    started = time.perf_counter()
+    seeded = _seed_graph(spotify_service, graph_service, artist_names)
+    elapsed = time.perf_counter() - started
+    stats = client.stats()
+    
+    print("-" * 50)
+    print(f"Artists crawled:   {len(seeded)}/{len(artist_names)}")
+    print(f"Elapsed:           {elapsed:.2f} s")
+    print(f"Artists/second:    {len(artist_names) / elapsed:.2f}")
+    print(f"API requests:      {stats['requests']} ({stats['requests'] / elapsed:.1f} req/s)")
+    print(f"429 responses:     {stats['throttled']}")
+    if spotify_service.response_cache:
+        print(f"Cache:             {spotify_service.response_cache.stats()}")
+    if spotify_service.crawler:
+        spotify_service.crawler.shutdown()
+    graph_service.close()
+
+def benchmark_search(args):
+    """Measure end-to-end /api/search latency against the fake client."""
+    # The app builds its services at import time, after the configuration is set
+    from app import app, spotify_service, graph_service
+    
+    client = spotify_service.sp
+    print("=" * 50)
+    print("🔎 Search benchmark")
+    print("=" * 50)
+    _print_settings(args)
+    
+    print(f"Seeding graph with {args.seed_artists} artists...")
+    seeded = _seed_graph(spotify_service, graph_service, client.artist_names(args.seed_artists))
+    if len(seeded) < 2:
+        print("❌ Not enough connected artists to search between")
+        sys.exit(1)
+    
+    rng = random.Random(args.seed)
+    http = app.test_client()
+    requests_before = client.stats()['requests']
+    latencies = []
+    found = 0
+    for _ in range(args.searches):
+        artist1, artist2 = rng.sample(seeded, 2)
+        started = time.perf_counter()
+        response = http.post('/api/search', json={'artist1': artist1, 'artist2': artist2,
+                                                  'algorithm': args.algorithm, 'expand': args.expand})
+        search_id = response.get_json()['search_id']
+        while True:
+            status = http.get(f'/api/search/{search_id}/status').get_json()['status']
+            if status in ['completed', 'failed']:
+                break
+            time.sleep(args.poll_interval)
+        latencies.append(time.perf_counter() - started)
+        
+        if status == 'completed':
+            result = http.get(f'/api/search/{search_id}/result').get_json()['result']
+            found += bool(result and result['found'])
+    
+    print("-" * 50)
+    print(f"Searches:          {len(latencies)} ({found} connected{', with on-demand crawling' if args.expand else ''})")
+    print(f"Latency mean:      {sum(latencies) / len(latencies) * 1000:.1f} ms")
+    print(f"Latency p50:       {_percentile(latencies, 0.50) * 1000:.1f} ms")
+    print(f"Latency p95:       {_percentile(latencies, 0.95) * 1000:.1f} ms")
+    print(f"Latency max:       {max(latencies) * 1000:.1f} ms")
+    print(f"API requests:      {client.stats()['requests'] - requests_before} during searches")
+    graph_service.close()
+
+def _add_fake_client_arguments(parser):
+    parser.add_argument('--catalog-artists', type=int, default=Config.FAKE_SPOTIFY_ARTISTS,
+                        help='Number of synthetic artists')
+    parser.add_argument('--catalog-file', help='Recorded catalog JSON to serve instead of a synthetic one')
+    parser.add_argument('--seed', type=int, default=Config.FAKE_SPOTIFY_SEED, help='Catalog and sampling seed')
+    parser.add_argument('--latency', type=float, default=Config.FAKE_SPOTIFY_LATENCY,
+                        help='Seconds per fake API request')
+    parser.add_argument('--jitter', type=float, default=Config.FAKE_SPOTIFY_JITTER,
+                        help='Maximum extra random latency in seconds')
+    parser.add_argument('--server-rate-limit', type=float, default=Config.FAKE_SPOTIFY_RATE_LIMIT,
+                        help='Requests per second the fake server allows before answering 429 (0 = unlimited)')
+    parser.add_argument('--error-rate', type=float, default=Config.FAKE_SPOTIFY_ERROR_RATE,
+                        help='Fraction of requests randomly answered with 429')
+    parser.add_argument('--rate-limit-delay', type=float, default=Config.RATE_LIMIT_DELAY,
+                        help='Client-side seconds between requests (0 disables the rate limiter)')
+    parser.add_argument('--concurrency', type=int, default=Config.CRAWLER_CONCURRENCY,
+                        help='Crawler requests in flight')
+    parser.add_argument('--cache', action='store_true', help='Enable the on-disk response cache')
+    parser.add_argument('--data-dir', help='Directory for data files (default: a temporary directory)')
+
+def main():
+    """Main function to run management commands."""
+    parser = argparse.ArgumentParser(description='Degrees of Spotify management commands')
+    commands = parser.add_subparsers(dest='command')
+    
+    labels = commands.add_parser('build-distance-labels', help="Build the exact distance labels of the application's graph")
+    labels.add_argument('--verify', type=int, default=0, metavar='N',
+                        help='Check label distances against BFS from N random artists')
+    labels.add_argument('--seed', type=int, default=0, help='Sampling seed for --verify')
+    labels.set_defaults(handler=build_distance_labels, benchmark=False)
+    
+    walks = commands.add_parser('count-walks', help='Count the walks of length 1..k from an artist')
+    walks.add_argument('artist', help='Artist URL, Spotify artist ID or indexed name')
+    walks.add_argument('--to', help='Count walks to this artist only')
+    walks.add_argument('--length', type=int, default=3, help='Longest walk to count')
+    walks.add_argument('--top', type=int, default=10, help='Artists with the most walks to list')
+    walks.set_defaults(handler=count_walks, benchmark=False)
+    
+    separation = commands.add_parser('separation-stats', help="Sample the degrees of separation of the application's graph")
+    separation.add_argument('--samples', type=int, default=Config.SEPARATION_SAMPLE_SIZE, help='BFS source artists')
+    separation.add_argument('--workers', type=int, default=Config.GRAPH_ANALYTICS_WORKERS,
+                            help='Worker processes (0 = one per CPU)')
+    separation.add_argument('--seed', type=int, help="Sampling seed (default: derived from the graph)")
+    separation.set_defaults(handler=separation_stats, benchmark=False)
+    
+    bridges = commands.add_parser('betweenness', help="Rank the bridge artists of the application's graph")
+    bridges.add_argument('--samples', type=int, default=Config.BETWEENNESS_SAMPLE_SIZE, help='Brandes passes')
+    bridges.add_argument('--workers', type=int, default=Config.GRAPH_ANALYTICS_WORKERS,
+                         help='Worker processes (0 = one per CPU)')
+    bridges.add_argument('--top', type=int, default=Config.BETWEENNESS_TOP_ARTISTS, help='Ranked artists to save')
+    bridges.add_argument('--show', type=int, default=10, help='Ranked artists to print')
+    bridges.add_argument('--seed', type=int, help="Sampling seed (default: derived from the graph)")
+    bridges.set_defaults(handler=betweenness, benchmark=False)
+    
+    crawl = commands.add_parser('benchmark-crawl', help='Measure crawler throughput against the fake client')
+    crawl.add_argument('--artists', type=int, default=50, help='Number of artists to crawl')
+    _add_fake_client_arguments(crawl)
+    crawl.set_defaults(handler=benchmark_crawl, benchmark=True)
+    
+    search = commands.add_parser('benchmark-search', help='Measure end-to-end /api/search latency')
+    search.add_argument('--searches', type=int, default=20, help='Number of searches to run')
+    search.add_argument('--seed-artists', type=int, default=100, help='Artists crawled into the graph first')
+    search.add_argument('--algorithm', default='bfs', help='Search algorithm')
+    search.add_argument('--expand', action='store_true', help='Crawl uncrawled artists during searches')
+    search.add_argument('--poll-interval', type=float, default=0.005, help='Seconds between status polls')
+    _add_fake_client_arguments(search)
+    search.set_defaults(handler=benchmark_search, benchmark=True)
+    
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+    
+    if not args.benchmark:
+        args.handler(args)
+        return
+    
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix='degrees-of-spotify-')
+    try:
+        _configure_fake_client(args, data_dir)
+        args.handler(args)
+    except KeyboardInterrupt:
+        print("\n\n🛑 Benchmark stopped by user")
+        sys.exit(0)
+    finally:
+        if not args.data_dir:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -65,7 +65,7 @@ class Connection:
     from_artist_url: str
     to_artist_url: str
     connection_type: str = "collaboration"  # collaboration, feature, etc.
-    strength: float = 1.0  # Connection strength (could be based on number of collaborations)
+    strength: float = 1.0  # Connection strength: number of shared tracks (1 when unknown)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -137,9 +137,15 @@ class GraphStats:
     average_connections: float
     most_connected_artist: Optional[str] = None
     most_connections_count: Optional[int] = None
+    most_connected_artists: Optional[List[Dict[str, Any]]] = None  # {"url", "connections"}, most connected first
+    degree_distribution: Optional[Dict[int, int]] = None  # Number of connections -> number of artists
     timestamp: Optional[datetime] = None
     
     def __post_init__(self):
+        if self.most_connected_artists is None:
+            self.most_connected_artists = []
+        if self.degree_distribution is None:
+            self.degree_distribution = {}
         if self.timestamp is None:
             self.timestamp = datetime.now()
     
@@ -156,6 +162,8 @@ class GraphStats:
             "average_connections": self.average_connections,
             "most_connected_artist": self.most_connected_artist,
             "most_connections_count": self.most_connections_count,
+            "most_connected_artists": self.most_connected_artists,
+            "degree_distribution": {str(degree): count for degree, count in self.degree_distribution.items()},
             "timestamp": self.timestamp.isoformat() if self.timestamp else None
         }
 
@@ -38,6 +38,13 @@ def main():
         print("   GET  /api/search/<id>/status - Get search status")
         print("   GET  /api/search/<id>/result - Get search result")
         print("   GET  /api/artists/search - Search for artists")
+        print("   GET  /api/artists/bounds - Degrees of separation bounds")
+        print("   GET  /api/artists/walks - Walk counts between artists")
+        print("   GET  /api/artists/bridges - Bridge artists by betweenness")
+        print("   GET  /api/artists/<id>/neighborhood - Artists within some degrees (streamed)")
+        print("   GET  /api/stats - Graph statistics")
+        print("   GET  /api/crawler/status - Background crawler status")
+        print("   POST /api/crawler/refresh - Recrawl new releases of stale artists")
         print("\n🛑 Press Ctrl+C to stop the server")
         print("="*50 + "\n")
         
@@ -55,6 +62,7 @@ def main():
         print("\n💡 Make sure you have a .env file with:")
         print("   CLIENT_ID=your_spotify_client_id")
         print("   CLIENT_SECRET=your_spotify_client_secret")
+        print("   (or SPOTIFY_CLIENT=fake to run offline against a synthetic catalog)")
         sys.exit(1)
     except KeyboardInterrupt:
         print("\n\n🛑 Server stopped by user")
@@ -0,0 +1,135 @@
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .compact_graph import CompactGraph
+from .metadata_store import ArtistMetadataStore
+
+# Popularity is 0-100; this value marks artists without recorded metadata
+UNKNOWN_POPULARITY = 255
+
+class AttributeColumns:
+    """
+    Per-artist attribute columns aligned with the node IDs of a CompactGraph.
+    
+    Popularity is a byte array and genres are one integer bitset per
+    artist (bit i set when the artist has genre i), so a whole filter is
+    evaluated once per search into a node mask and the search itself never
+    looks at artist metadata. Only artists the metadata store has seen
+    (searched or looked up) have attributes; the others are "unknown".
+    """
+    
+    def __init__(self, graph: CompactGraph, metadata_store: ArtistMetadataStore):
+        """
+        Build the columns from the metadata store.
+        
+        Args:
+            graph (CompactGraph): Graph whose node IDs the columns follow.
+            metadata_store (ArtistMetadataStore): Source of popularity and genres.
+        """
+        self.metadata_version = metadata_store.version
+        self.popularity = array("B", [UNKNOWN_POPULARITY]) * graph.node_count
+        self.genres: List[int] = [0] * graph.node_count
+        self.genre_ids: Dict[str, int] = {}
+        
+        for node, artist_url in enumerate(graph.urls):
+            metadata = metadata_store.get(artist_url)
+            if not metadata:
+                continue
+            self.popularity[node] = min(max(metadata["popularity"], 0), 100)
+            bits = 0
+            for genre in metadata["genres"]:
+                bits |= 1 << self.genre_ids.setdefault(genre.lower(), len(self.genre_ids))
+            self.genres[node] = bits
+    
+    def genre_bits(self, genres: Iterable[str]) -> int:
+        """
+        Get the bitset of every known genre containing one of the given terms.
+        
+        Args:
+            genres (iterable): Genre terms, e.g. "hip hop" (matches "canadian hip hop").
+        
+        Returns:
+            int: Bitset of matching genre IDs.
+        """
+        terms = [genre.lower().strip() for genre in genres if genre and genre.strip()]
+        bits = 0
+        for genre, genre_id in self.genre_ids.items():
+            if any(term in genre for term in terms):
+                bits |= 1 << genre_id
+        return bits
+    
+    def mask(self, genres: Optional[Iterable[str]] = None, min_popularity: Optional[int] = None,
+             max_popularity: Optional[int] = None, exclude: Iterable[int] = (),
+             include_unknown: bool = True) -> bytearray:
+        """
+        Evaluate a filter for every artist.
+        
+        Args:
+            genres (iterable): Keep artists with at least one matching genre.
+            min_popularity (int): Keep artists at least this popular.
+            max_popularity (int): Keep artists at most this popular.
+            exclude (iterable): Node IDs to drop.
+            include_unknown (bool): Keep artists without metadata when a genre
+                or popularity filter is set.
+        
+        Returns:
+            bytearray: 1 for every node ID that passes, 0 otherwise.
+        """
+        node_count = len(self.popularity)
+        allowed = bytearray(b"\x01") * node_count
+        if genres or min_popularity is not None or max_popularity is not None:
+            wanted = self.genre_bits(genres) if genres else None
+            low = min_popularity if min_popularity is not None else 0
+            high = max_popularity if max_popularity is not None else 100
+            unknown = 1 if include_unknown else 0
+            popularity, genre_sets = self.popularity, self.genres
+            for node in range(node_count):
+                value = popularity[node]
+                if value == UNKNOWN_POPULARITY:
+                    allowed[node] = unknown
+                elif not low <= value <= high or (wanted is not None and not genre_sets[node] & wanted):
+                    allowed[node] = 0
+        for node in exclude:
+            allowed[node] = 0
+        return allowed
+
+def artist_filter(metadata_store: ArtistMetadataStore, genres: Optional[Iterable[str]] = None,
+                  min_popularity: Optional[int] = None, max_popularity: Optional[int] = None,
+                  exclude: Iterable[str] = (), include_unknown: bool = True) -> Callable[[str], bool]:
+    """
+    Build a per-artist check of the same filter AttributeColumns.mask evaluates.
+    
+    For searching graph versions no compact graph has been built for yet:
+    each artist's metadata is looked up when the search reaches it.
+    
+    Args:
+        metadata_store (ArtistMetadataStore): Source of popularity and genres.
+        genres (iterable): Keep artists with at least one matching genre.
+        min_popularity (int): Keep artists at least this popular.
+        max_popularity (int): Keep artists at most this popular.
+        exclude (iterable): Artist URLs to drop.
+        include_unknown (bool): Keep artists without metadata when a genre
+            or popularity filter is set.
+    
+    Returns:
+        callable: Takes an artist URL, True if the artist passes.
+    """
+    excluded = set(exclude)
+    filtered = bool(genres) or min_popularity is not None or max_popularity is not None
+    terms = [genre.lower().strip() for genre in genres if genre and genre.strip()] if genres else None
+    low = min_popularity if min_popularity is not None else 0
+    high = max_popularity if max_popularity is not None else 100
+    
+    def allowed(artist_url: str) -> bool:
+        if artist_url in excluded:
+            return False
+        if not filtered:
+            return True
+        metadata = metadata_store.get(artist_url)
+        if not metadata:
+            return include_unknown
+        if not low <= min(max(metadata["popularity"], 0), 100) <= high:
+            return False
+        return terms is None or any(term in genre.lower() for genre in metadata["genres"] for term in terms)
+    
+    return allowed
@@ -0,0 +1,201 @@
+import zlib
+from array import array
+from typing import Dict, List, Optional, Iterable
+
+from .graph_snapshot import GraphSnapshot
+
+# Distances are stored as unsigned bytes; this value marks "not reachable"
+UNREACHABLE = 255
+
+# Edge weights are stored as unsigned 16-bit integers
+MAX_WEIGHT = 65535
+
+class CompactGraph:
+    """
+    Interned, read-only compressed sparse row (CSR) copy of one graph version.
+    
+    Artist URLs are interned to dense integer IDs (crawled artists first, in
+    snapshot order, then artists only seen as collaborators). Out-edges of
+    node i are targets[offsets[i]:offsets[i + 1]], and the reverse graph is
+    kept the same way in in_offsets/in_targets. All four are 32-bit
+    `array`s, so a graph with millions of edges takes a few bytes per edge
+    instead of a Python list and string per edge. `weights` is a parallel
+    16-bit array with the collaboration strength (shared tracks, 1 when
+    unknown) of each out-edge.
+    
+    Derived indexes computed for this version (e.g. landmark distances) are
+    attached to the instance, so they always describe exactly this graph.
+    """
+    
+    def __init__(self, version: int, urls: List[str], offsets: array, targets: array,
+                 weights: Optional[array] = None):
+        """
+        Initialize the graph and build the reverse edges.
+        
+        Args:
+            version (int): Version of the snapshot this graph was built from.
+            urls (list): Artist URL of every node ID.
+            offsets (array): CSR offsets, len(urls) + 1 entries.
+            targets (array): CSR edge targets.
+            weights (array): Strength of each edge in targets; all 1 if omitted.
+        """
+        self.version = version
+        self.urls = urls
+        self.ids: Dict[str, int] = {url: node for node, url in enumerate(urls)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights if weights is not None else array("H", [1]) * len(targets)
+        self.landmarks = None
+        self.labels = None
+        self.attributes = None
+        self.separation = None
+        self.communities = None
+        self._fingerprint: Optional[int] = None
+        
+        # Reverse CSR by counting sort
+        in_counts = array("I", bytes(4 * (len(urls) + 1)))
+        for target in targets:
+            in_counts[target + 1] += 1
+        for node in range(len(urls)):
+            in_counts[node + 1] += in_counts[node]
+        self.in_offsets = array("I", in_counts)
+        self.in_targets = array("I", bytes(4 * len(targets)))
+        position = in_counts
+        for source in range(len(urls)):
+            for edge in range(offsets[source], offsets[source + 1]):
+                target = targets[edge]
+                self.in_targets[position[target]] = source
+                position[target] += 1
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: GraphSnapshot) -> "CompactGraph":
+        """
+        Intern and pack a graph snapshot.
+        
+        Args:
+            snapshot (GraphSnapshot): Graph version to pack.
+        
+        Returns:
+            CompactGraph: The packed graph.
+        """
+        urls = list(snapshot)
+        ids = {url: node for node, url in enumerate(urls)}
+        crawled = len(urls)
+        offsets = array("I", [0])
+        targets = array("I")
+        weights = array("H")
+        for artist_url in urls[:crawled]:
+            related_urls = snapshot[artist_url]
+            for related_url in related_urls:
+                node = ids.get(related_url)
+                if node is None:
+                    node = ids[related_url] = len(urls)
+                    urls.append(related_url)
+                targets.append(node)
+            strengths = snapshot.strengths(artist_url)
+            if strengths:
+                weights.extend(min(max(strength, 1), MAX_WEIGHT) for strength in strengths)
+            else:
+                weights.extend([1] * len(related_urls))
+            offsets.append(len(targets))
+        offsets.extend([len(targets)] * (len(urls) - crawled))
+        return cls(snapshot.version, urls, offsets, targets, weights)
+    
+    @property
+    def node_count(self) -> int:
+        return len(self.urls)
+    
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+    
+    def fingerprint(self) -> int:
+        """
+        Checksum of the interned URLs and edges, identifying this exact graph
+        across restarts (versions restart at 0 in every process).
+        
+        Returns:
+            int: CRC-32 of the graph.
+        """
+        if self._fingerprint is None:
+            checksum = zlib.crc32("\n".join(self.urls).encode("utf-8"))
+            checksum = zlib.crc32(self.offsets.tobytes(), checksum)
+            self._fingerprint = zlib.crc32(self.targets.tobytes(), checksum)
+        return self._fingerprint
+    
+    def node_id(self, artist_url: str) -> Optional[int]:
+        """Get the node ID of an artist URL, or None if it is not in the graph."""
+        return self.ids.get(artist_url)
+    
+    def neighbors(self, node: int) -> array:
+        """Get the out-neighbors of a node."""
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+    
+    def in_neighbors(self, node: int) -> array:
+        """Get the in-neighbors of a node."""
+        return self.in_targets[self.in_offsets[node]:self.in_offsets[node + 1]]
+    
+    def degree(self, node: int) -> int:
+        """Get the total (out plus in) degree of a node."""
+        return (self.offsets[node + 1] - self.offsets[node]) + (self.in_offsets[node + 1] - self.in_offsets[node])
+    
+    def distances(self, source: int, reverse: bool = False) -> array:
+        """
+        Compute hop distances from a node with a BFS.
+        
+        Args:
+            source (int): Node ID to start from.
+            reverse (bool): Follow edges backwards, giving distances *to* the source.
+        
+        Returns:
+            array: Unsigned byte distance per node, UNREACHABLE where there is no
+            path (or it is longer than 254 hops).
+        """
+        offsets, targets = (self.in_offsets, self.in_targets) if reverse else (self.offsets, self.targets)
+        distances = array("B", bytes([UNREACHABLE])) * len(self.urls)
+        distances[source] = 0
+        frontier = [source]
+        depth = 0
+        while frontier and depth < UNREACHABLE - 1:
+            depth += 1
+            next_frontier = []
+            for node in frontier:
+                for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                    if distances[neighbor] == UNREACHABLE:
+                        distances[neighbor] = depth
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return distances
+    
+    def walk_counts(self, source: int, max_length: int) -> List[Dict[int, int]]:
+        """
+        Count the walks of length 1..max_length from a node to every node.
+        
+        Repeated sparse matrix-vector products over the CSR: the vector of
+        walk counts of length l is multiplied by the adjacency matrix to
+        get length l + 1, touching only nodes with non-zero counts. Walks
+        may revisit artists; counts are exact Python integers.
+        
+        Args:
+            source (int): Node ID to start from.
+            max_length (int): Longest walk to count.
+        
+        Returns:
+            list: Per length 1..max_length, node ID -> number of walks from
+            the source ending there (nodes with none are left out).
+        """
+        offsets, targets = self.offsets, self.targets
+        counts = []
+        vector = {source: 1}
+        for _ in range(max_length):
+            product: Dict[int, int] = {}
+            for node, walks in vector.items():
+                for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                    product[neighbor] = product.get(neighbor, 0) + walks
+            counts.append(product)
+            vector = product
+        return counts
+    
+    def path_urls(self, nodes: Iterable[int]) -> List[str]:
+        """Translate node IDs back to artist URLs."""
+        return [self.urls[node] for node in nodes]
\ No newline at end of file
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Any
+
+logger = logging.getLogger(__name__)
+
+class ConcurrentCrawler:
+    """
+    asyncio-based discography crawler with bounded parallelism.
+    
+    Spotipy is a blocking client, so each API call runs on a small worker
+    pool while an asyncio semaphore keeps at most `concurrency` requests in
+    flight. Every call still goes through SpotifyService.safe_request, which
+    takes a token from the shared rate limiter and retries per request, so
+    throughput is bounded by the API quota rather than by round-trip latency.
+    
+    Pages and album batches are fetched concurrently but their results are
+    assembled in request order, so the tracks returned are exactly the ones
+    (and in the same order as) the sequential crawl produces.
+    """
+    
+    def __init__(self, spotify_service, concurrency: int):
+        """
+        Initialize the crawler.
+        
+        Args:
+            spotify_service: SpotifyService used to issue (rate-limited) requests.
+            concurrency (int): Maximum number of requests in flight.
+        """
+        self.spotify_service = spotify_service
+        self.concurrency = max(1, concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="spotify-crawler")
+    
+    async def _call(self, semaphore: asyncio.Semaphore, func, *args, **kwargs):
+        """Run one rate-limited, retried Spotify request on the worker pool."""
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, partial(self.spotify_service.safe_request, func, *args, **kwargs)
+            )
+    
+    async def _artist_albums(self, semaphore: asyncio.Semaphore, artist_id: str) -> List[Dict[str, Any]]:
+        """Fetch every page of an artist's albums, pages after the first in parallel."""
+        service = self.spotify_service
+        page_size = service.ARTIST_ALBUMS_PAGE_SIZE
+        
+        def request(offset: int):
+            return self._call(semaphore, service.sp.artist_albums, artist_id, album_type="album,single",
+                              country="US", limit=page_size, offset=offset)
+        
+        first_page = await request(0)
+        pages = [first_page]
+        if first_page.get("next"):
+            offsets = range(page_size, first_page["total"], page_size)
+            pages += await asyncio.gather(*(request(offset) for offset in offsets))
+        
+        unique_albums = {}
+        for page in pages:
+            for album in page["items"]:
+                unique_albums.setdefault(album["id"], album)
+        return list(unique_albums.values())
+    
+    async def _album_tracks(self, semaphore: asyncio.Semaphore, album: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Get all tracks of an album, fetching extra track pages in parallel."""
+        service = self.spotify_service
+        tracks = album["tracks"]
+        items = list(tracks["items"])
+        if tracks.get("next"):
+            offsets = range(len(items), tracks["total"], service.ALBUM_TRACKS_PAGE_SIZE)
+            pages = await asyncio.gather(*(
+                self._call(semaphore, service.sp.album_tracks, album["id"],
+                           limit=service.ALBUM_TRACKS_PAGE_SIZE, offset=offset)
+                for offset in offsets
+            ))
+            for page in pages:
+                items.extend(page["items"])
+        return items
+    
+    async def _discography(self, semaphore: asyncio.Semaphore, artist_id: str, newer_than: Optional[str],
+                           crawled_album_ids: Optional[List[str]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Get an artist's albums and the tracks of the selected albums in sequential-crawl order."""
+        service = self.spotify_service
+        batch_size = service.ALBUM_BATCH_SIZE
+        artist_albums = await self._artist_albums(semaphore, artist_id)
+        album_ids = service.select_albums(artist_albums, newer_than, crawled_album_ids)
+        batches = await asyncio.gather(*(
+            self._call(semaphore, service.sp.albums, album_ids[start:start + batch_size])
+            for start in range(0, len(album_ids), batch_size)
+        ))
+        
+        albums = [album for batch in batches for album in batch["albums"] if album]
+        album_tracks = await asyncio.gather(*(self._album_tracks(semaphore, album) for album in albums))
+        return artist_albums, [track for tracks in album_tracks for track in tracks]
+    
+    async def _crawl(self, artist_ids: List[str], newer_than: Optional[str],
+                     crawled_album_ids: Optional[List[str]]) -> Dict[str, Any]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(
+            *(self._discography(semaphore, artist_id, newer_than, crawled_album_ids) for artist_id in artist_ids),
+            return_exceptions=True
+        )
+        return dict(zip(artist_ids, results))
+    
+    def crawl_discographies(self, artist_ids: List[str], newer_than: Optional[str] = None,
+                            crawled_album_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Crawl the discographies of several artists concurrently.
+        
+        Must be called from a thread without a running event loop (e.g. a
+        search thread); it runs its own loop until all artists are done.
+        
+        Args:
+            artist_ids (list): Spotify IDs of the artists to crawl.
+            newer_than (str): Release-date watermark; only fetch tracks of
+                albums released after it. None fetches every album.
+            crawled_album_ids (list): Albums released on the watermark date
+                that were already crawled; other albums released that day are
+                fetched too. None fetches none released that day.
+        
+        Returns:
+            dict: Artist ID -> (albums, tracks) tuple, or the exception that
+            stopped that artist's crawl.
+        """
+        if not artist_ids:
+            return {}
+        return asyncio.run(self._crawl(list(dict.fromkeys(artist_ids)), newer_than, crawled_album_ids))
+    
+    def shutdown(self):
+        """Stop the worker pool."""
+        self._executor.shutdown(wait=False)
\ No newline at end of file
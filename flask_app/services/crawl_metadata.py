@@ -0,0 +1,176 @@
+import csv
+import os
+import time
+import logging
+import threading
+from typing import Dict, List, Optional, Any
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+class CrawlMetadataStore:
+    """
+    Per-artist crawl bookkeeping used for incremental recrawls.
+    
+    For every crawled artist it remembers when the discography was last
+    crawled, the newest album release date seen (the watermark), the IDs of
+    the albums released on that date and how many albums the artist had.
+    Entries are appended to a CSV file:
+        artist_id,last_crawled,newest_release_date,album_count,watermark_album_ids
+    with space-separated album IDs. Later rows override earlier ones. Rows
+    written before the album IDs were recorded have no fifth column.
+    """
+    
+    def __init__(self, metadata_file: Optional[str] = None):
+        """
+        Initialize the store and load any previously recorded entries.
+        
+        Args:
+            metadata_file (str): Path of the crawl metadata CSV file.
+        """
+        self.metadata_file = metadata_file or Config.CRAWL_METADATA_FILE
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._pending: List[List[Any]] = []
+        self._lock = threading.Lock()
+        
+        self._load()
+        logger.info(f"Crawl metadata initialized with {len(self._entries)} artists")
+    
+    def _load(self):
+        """Load previously recorded entries from disk."""
+        if not os.path.exists(self.metadata_file):
+            return
+        try:
+            with open(self.metadata_file, mode="r", newline="", encoding="utf-8") as file:
+                for row in csv.reader(file):
+                    if len(row) >= 4:
+                        self._entries[row[0]] = {
+                            "last_crawled": float(row[1] or 0),
+                            "newest_release_date": row[2] or None,
+                            "album_count": int(row[3] or 0),
+                            "watermark_album_ids": row[4].split() if len(row) >= 5 else None
+                        }
+        except Exception as e:
+            logger.error(f"Error reading crawl metadata from {self.metadata_file}: {e}")
+    
+    @staticmethod
+    def newest_release_date(albums: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Get the newest release date of a list of albums.
+        
+        Spotify dates have year, month or day precision ("2019", "2019-05",
+        "2019-05-17"); as strings they sort chronologically.
+        
+        Args:
+            albums (list): Simplified album objects.
+        
+        Returns:
+            str: Newest release date, or None if no album has one.
+        """
+        dates = [album.get("release_date") for album in albums if album.get("release_date")]
+        return max(dates) if dates else None
+    
+    @staticmethod
+    def released_on(albums: List[Dict[str, Any]], release_date: Optional[str]) -> List[str]:
+        """
+        Get the IDs of the albums released on a date.
+        
+        Args:
+            albums (list): Simplified album objects.
+            release_date (str): Release date, usually the watermark.
+        
+        Returns:
+            list: Album IDs, empty if release_date is None.
+        """
+        if not release_date:
+            return []
+        return [album["id"] for album in albums if album.get("release_date") == release_date]
+    
+    def record_crawl(self, artist_id: str, newest_release_date: Optional[str], album_count: int,
+                     watermark_album_ids: Optional[List[str]] = None):
+        """
+        Record a completed (full or incremental) crawl of an artist.
+        
+        Args:
+            artist_id (str): Spotify ID of the artist.
+            newest_release_date (str): Newest album release date seen.
+            album_count (int): Number of albums and singles the artist has.
+            watermark_album_ids (list): IDs of the crawled albums released on
+                newest_release_date; merged with the recorded ones if the
+                watermark did not move.
+        """
+        with self._lock:
+            previous = self._entries.get(artist_id)
+            watermark_album_ids = list(watermark_album_ids or [])
+            if previous and previous["newest_release_date"] and (
+                    not newest_release_date or previous["newest_release_date"] >= newest_release_date):
+                if previous["newest_release_date"] > (newest_release_date or ""):
+                    watermark_album_ids = []
+                newest_release_date = previous["newest_release_date"]
+                watermark_album_ids = list(dict.fromkeys((previous["watermark_album_ids"] or []) + watermark_album_ids))
+            
+            entry = {
+                "last_crawled": time.time(),
+                "newest_release_date": newest_release_date,
+                "album_count": album_count,
+                "watermark_album_ids": watermark_album_ids
+            }
+            self._entries[artist_id] = entry
+            self._pending.append([artist_id, entry["last_crawled"], newest_release_date or "", album_count,
+                                  " ".join(watermark_album_ids)])
+    
+    def get(self, artist_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get crawl metadata for an artist.
+        
+        Args:
+            artist_id (str): Spotify ID (or URL) of the artist.
+        
+        Returns:
+            dict: last_crawled, newest_release_date, album_count and
+            watermark_album_ids (None for entries recorded before album IDs
+            were), or None if never recorded.
+        """
+        return self._entries.get(artist_id.rstrip("/").split("/")[-1])
+    
+    def stale_artists(self, max_age: float, limit: int) -> List[str]:
+        """
+        Get the artists whose last crawl is older than max_age, oldest first.
+        
+        Args:
+            max_age (float): Age in seconds after which a crawl is stale.
+            limit (int): Maximum number of artist IDs to return.
+        
+        Returns:
+            list: Spotify artist IDs.
+        """
+        cutoff = time.time() - max_age
+        with self._lock:
+            stale = [(entry["last_crawled"], artist_id) for artist_id, entry in self._entries.items()
+                     if entry["last_crawled"] < cutoff]
+        stale.sort()
+        return [artist_id for _, artist_id in stale[:limit]]
+    
+    def flush(self) -> bool:
+        """
+        Append entries recorded since the last flush to disk.
+        
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        
+        if not pending:
+            return True
+        
+        try:
+            with open(self.metadata_file, mode="a", newline="", encoding="utf-8") as file:
+                csv.writer(file).writerows(pending)
+            return True
+        except Exception as e:
+            logger.error(f"Error flushing crawl metadata: {e}")
+            with self._lock:
+                self._pending = pending + self._pending
+            return False
\ No newline at end of file
@@ -0,0 +1,110 @@
+import heapq
+import threading
+from collections import Counter
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+class DegreeStats:
+    """
+    Running connection counts of the artist graph.
+    
+    Keeps the total number of connections, a histogram of artists per
+    connection count and a max-heap of (connections, artist) so graph
+    statistics never scan the graph. Every update changes one histogram
+    bucket and pushes one heap entry, O(log n); entries made stale by a
+    later update of the same artist are skipped (and dropped) when the
+    top artists are read, and the heap is rebuilt once stale entries
+    outnumber live ones.
+    """
+    
+    def __init__(self, adjacency_list: Mapping[str, Sequence[str]]):
+        """
+        Count the connections of a graph.
+        
+        Args:
+            adjacency_list: Artist URL -> related artist URLs.
+        """
+        self._lock = threading.Lock()
+        self.reset(adjacency_list)
+    
+    def reset(self, adjacency_list: Mapping[str, Sequence[str]]):
+        """
+        Recount everything for a replaced graph.
+        
+        Args:
+            adjacency_list: Artist URL -> related artist URLs.
+        """
+        degrees = {artist_url: len(related_urls) for artist_url, related_urls in adjacency_list.items()}
+        with self._lock:
+            self._degrees = degrees
+            self._histogram = Counter(degrees.values())
+            self._total = sum(degrees.values())
+            self._rebuild_heap()
+    
+    def _rebuild_heap(self):
+        self._heap = [(-degree, artist_url) for artist_url, degree in self._degrees.items()]
+        heapq.heapify(self._heap)
+    
+    def update(self, artist_url: str, degree: int):
+        """
+        Record the new connection count of an artist.
+        
+        Args:
+            artist_url (str): URL of the artist.
+            degree (int): Number of related artists it has now.
+        """
+        with self._lock:
+            previous = self._degrees.get(artist_url)
+            if previous == degree:
+                return
+            if previous is not None:
+                self._histogram[previous] -= 1
+                if not self._histogram[previous]:
+                    del self._histogram[previous]
+                self._total -= previous
+            self._degrees[artist_url] = degree
+            self._histogram[degree] += 1
+            self._total += degree
+            heapq.heappush(self._heap, (-degree, artist_url))
+            if len(self._heap) > 2 * len(self._degrees) + 64:
+                self._rebuild_heap()
+    
+    @property
+    def total_connections(self) -> int:
+        return self._total
+    
+    def histogram(self) -> Dict[int, int]:
+        """
+        Get the degree distribution.
+        
+        Returns:
+            dict: Number of connections -> number of artists with it, by
+            increasing number of connections.
+        """
+        with self._lock:
+            return dict(sorted(self._histogram.items()))
+    
+    def top(self, count: int) -> List[Tuple[str, int]]:
+        """
+        Get the artists with the most connections.
+        
+        Args:
+            count (int): Number of artists.
+        
+        Returns:
+            list: (artist URL, connections) pairs, most connected first.
+        """
+        with self._lock:
+            heap = self._heap
+            top = []
+            seen = set()
+            while heap and len(top) < count:
+                entry = heapq.heappop(heap)
+                degree, artist_url = -entry[0], entry[1]
+                # Stale (the artist was updated since) or a duplicate of a live entry
+                if self._degrees.get(artist_url) != degree or artist_url in seen:
+                    continue
+                seen.add(artist_url)
+                top.append(entry)
+            for entry in top:
+                heapq.heappush(heap, entry)
+            return [(artist_url, -negative_degree) for negative_degree, artist_url in top]
\ No newline at end of file
@@ -0,0 +1,276 @@
+import os
+import mmap
+import time
+import struct
+import logging
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from .compact_graph import CompactGraph, UNREACHABLE
+
+logger = logging.getLogger(__name__)
+
+# File layout: header, out/in label offsets (uint32), out/in hub ranks (uint32), out/in distances (uint8)
+MAGIC = b"DSPL"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sIIIII")  # magic, format, node count, out entries, in entries, graph fingerprint
+
+class DistanceLabels:
+    """
+    Exact distance oracle over a CompactGraph using pruned landmark labeling.
+    
+    Every node v keeps an out-label of (hub, d(v, hub)) pairs and an
+    in-label of (hub, d(hub, v)) pairs such that each shortest path s -> t
+    passes through a hub in both out(s) and in(t) (a 2-hop cover), so
+        d(s, t) = min over common hubs h of d(s, h) + d(h, t)
+    is a merge of two short sorted lists. Hubs are processed in descending
+    degree order and each pruned BFS stops wherever the labels built so far
+    already give the distance, which keeps labels small on graphs with a
+    few very connected artists.
+    
+    Labels are written to a single file and served from a read-only memory
+    map, so a loaded index costs page cache rather than Python objects and
+    is shared between worker processes.
+    """
+    
+    def __init__(self, graph: CompactGraph, path: str):
+        """
+        Open a label file built for a graph.
+        
+        Args:
+            graph (CompactGraph): The graph the labels were built from.
+            path (str): Path of the label file.
+        
+        Raises:
+            ValueError: If the file is not a label file for this graph.
+        """
+        self.graph = graph
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        magic, format_version, node_count, out_entries, in_entries, fingerprint = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a distance label file")
+        if node_count != graph.node_count or fingerprint != graph.fingerprint():
+            self.close()
+            raise ValueError(f"{path} was built for a different graph")
+        
+        view = memoryview(self._mmap)
+        position = HEADER.size
+        sections = []
+        for length, item_format in [(node_count + 1, "I"), (node_count + 1, "I"),
+                                    (out_entries, "I"), (in_entries, "I"),
+                                    (out_entries, "B"), (in_entries, "B")]:
+            size = length * struct.calcsize(item_format)
+            sections.append(view[position:position + size].cast(item_format))
+            position += size
+        (self.out_offsets, self.in_offsets, self.out_hubs, self.in_hubs,
+         self.out_distances, self.in_distances) = sections
+        self.entry_count = out_entries + in_entries
+    
+    @classmethod
+    def open_if_current(cls, graph: CompactGraph, path: str) -> Optional["DistanceLabels"]:
+        """
+        Open a label file if it exists and was built for exactly this graph.
+        
+        Args:
+            graph (CompactGraph): The graph to serve.
+            path (str): Path of the label file.
+        
+        Returns:
+            DistanceLabels: The opened labels, or None if they must be rebuilt.
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(graph, path)
+        except (ValueError, OSError, struct.error) as e:
+            logger.info(f"Not using distance labels in {path}: {e}")
+            return None
+    
+    @classmethod
+    def build(cls, graph: CompactGraph, path: str) -> "DistanceLabels":
+        """
+        Compute the labels of a graph, write them atomically and open them.
+        
+        Args:
+            graph (CompactGraph): Graph to index.
+            path (str): Path of the label file to write.
+        
+        Returns:
+            DistanceLabels: The new labels.
+        """
+        started = time.time()
+        out_labels, in_labels = _pruned_landmark_labels(graph)
+        
+        out_offsets, out_hubs, out_distances = _pack(out_labels)
+        in_offsets, in_hubs, in_distances = _pack(in_labels)
+        temp_file = f"{path}.{os.getpid()}.tmp"
+        with open(temp_file, "wb") as file:
+            file.write(HEADER.pack(MAGIC, FORMAT_VERSION, graph.node_count,
+                                   len(out_hubs), len(in_hubs), graph.fingerprint()))
+            for section in [out_offsets, in_offsets, out_hubs, in_hubs, out_distances, in_distances]:
+                file.write(section.tobytes())
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, path)
+        
+        labels = cls(graph, path)
+        logger.info(f"Distance labels built for {graph.node_count} artists with {labels.entry_count} entries "
+                    f"({labels.entry_count / max(1, graph.node_count):.1f} per artist) in {time.time() - started:.2f}s")
+        return labels
+    
+    def distance(self, source: int, target: int) -> Optional[int]:
+        """
+        Get the exact distance between two nodes.
+        
+        Args:
+            source (int): Node ID of the first artist.
+            target (int): Node ID of the second artist.
+        
+        Returns:
+            int: Hops from source to target, or None if there is no path.
+        """
+        i, i_end = self.out_offsets[source], self.out_offsets[source + 1]
+        j, j_end = self.in_offsets[target], self.in_offsets[target + 1]
+        out_hubs, in_hubs = self.out_hubs, self.in_hubs
+        best = UNREACHABLE
+        while i < i_end and j < j_end:
+            out_hub, in_hub = out_hubs[i], in_hubs[j]
+            if out_hub == in_hub:
+                through = self.out_distances[i] + self.in_distances[j]
+                if through < best:
+                    best = through
+                i += 1
+                j += 1
+            elif out_hub < in_hub:
+                i += 1
+            else:
+                j += 1
+        return best if best < UNREACHABLE else None
+    
+    def shortest_path(self, source: int, target: int) -> Optional[Tuple[List[int], int]]:
+        """
+        Reconstruct a shortest path by walking down the exact distances.
+        
+        From each node only the neighbors one hop closer to the target are
+        followed, so the search is bounded by the degrees along one path.
+        
+        Args:
+            source (int): Node ID of the first artist.
+            target (int): Node ID of the second artist.
+        
+        Returns:
+            tuple: (path as node IDs, distance queries made), or None if there is no path.
+        """
+        remaining = self.distance(source, target)
+        if remaining is None:
+            return None
+        
+        path = [source]
+        queries = 1
+        node = source
+        while remaining:
+            for neighbor in self.graph.neighbors(node):
+                queries += 1
+                if self.distance(neighbor, target) == remaining - 1:
+                    break
+            else:
+                logger.error(f"Distance labels in {self.path} are inconsistent with the graph")
+                return None
+            path.append(neighbor)
+            node = neighbor
+            remaining -= 1
+        return path, queries
+    
+    def describe(self) -> Dict[str, Any]:
+        """
+        Get the size of the labels.
+        
+        Returns:
+            dict: entries, average_label_size and bytes.
+        """
+        return {
+            "entries": self.entry_count,
+            "average_label_size": self.entry_count / max(1, 2 * self.graph.node_count),
+            "bytes": len(self._mmap)
+        }
+    
+    def close(self):
+        """Unmap the label file."""
+        for name in ["out_offsets", "in_offsets", "out_hubs", "in_hubs", "out_distances", "in_distances"]:
+            section = self.__dict__.pop(name, None)
+            if section is not None:
+                section.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Still referenced by a query in flight; the map is released with this object
+            pass
+
+def _pruned_landmark_labels(graph: CompactGraph) -> Tuple[List[List[Tuple[int, int]]], List[List[Tuple[int, int]]]]:
+    """
+    Compute out- and in-labels with pruned BFS from every node in descending degree order.
+    
+    Args:
+        graph (CompactGraph): Graph to index.
+    
+    Returns:
+        tuple: (out-labels, in-labels), one list of (hub rank, distance) pairs per
+        node, sorted by hub rank.
+    """
+    node_count = graph.node_count
+    order = sorted(range(node_count), key=lambda node: -graph.degree(node))
+    out_labels: List[List[Tuple[int, int]]] = [[] for _ in range(node_count)]
+    in_labels: List[List[Tuple[int, int]]] = [[] for _ in range(node_count)]
+    seen = bytearray(node_count)
+    
+    for rank, hub in enumerate(order):
+        # Forward: d(hub, v) goes into in-labels, pruned where out(hub) x in(v) already covers it
+        _pruned_bfs(hub, rank, graph.offsets, graph.targets, dict(out_labels[hub]), in_labels, seen)
+        # Backward: d(v, hub) goes into out-labels, pruned where out(v) x in(hub) already covers it
+        _pruned_bfs(hub, rank, graph.in_offsets, graph.in_targets, dict(in_labels[hub]), out_labels, seen)
+    return out_labels, in_labels
+
+def _pruned_bfs(hub: int, rank: int, offsets: array, targets: array, hub_label: Dict[int, int],
+                labels: List[List[Tuple[int, int]]], seen: bytearray):
+    """Run one pruned BFS from a hub, appending (rank, distance) to the labels it reaches."""
+    visited = [hub]
+    seen[hub] = 1
+    frontier = [hub]
+    depth = 0
+    while frontier and depth < UNREACHABLE:
+        next_frontier = []
+        for node in frontier:
+            covered = False
+            for other_rank, distance in labels[node]:
+                through = hub_label.get(other_rank)
+                if through is not None and through + distance <= depth:
+                    covered = True
+                    break
+            if covered:
+                continue
+            labels[node].append((rank, depth))
+            for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    visited.append(neighbor)
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+        depth += 1
+    for node in visited:
+        seen[node] = 0
+
+def _pack(labels: List[List[Tuple[int, int]]]) -> Tuple[array, array, array]:
+    """Flatten per-node labels into offsets, hub ranks and distances."""
+    offsets = array("I", [0])
+    hubs = array("I")
+    distances = array("B")
+    for label in labels:
+        for rank, distance in label:
+            hubs.append(rank)
+            distances.append(distance)
+        offsets.append(len(hubs))
+    return offsets, hubs, distances
\ No newline at end of file
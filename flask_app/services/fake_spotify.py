@@ -0,0 +1,403 @@
+import json
+import math
+import time
+import random
+import logging
+import threading
+from collections import deque
+from typing import Optional, List, Dict, Any
+
+from spotipy import SpotifyException
+
+from config import Config
+from .name_index import ARTIST_URL_PREFIX
+from .resolution_cache import normalize_artist_name
+
+logger = logging.getLogger(__name__)
+
+# Word lists for synthetic artist names; every index maps to a distinct name
+NAME_FIRST = [
+    "Amber", "Blue", "Crimson", "Silver", "Golden", "Velvet", "Neon", "Midnight", "Lunar", "Electric",
+    "Wild", "Quiet", "Broken", "Hollow", "Frozen", "Burning", "Paper", "Glass", "Iron", "Static"
+]
+NAME_SECOND = [
+    "Wolves", "Harbor", "Echo", "Parade", "Garden", "Rivers", "Signal", "Machine", "Saints", "Tides",
+    "Lanterns", "Ghosts", "Avenue", "Hearts", "Satellite", "Canyon", "Orchid", "Engines", "Choir", "Comet",
+    "Drifters", "Mirrors", "Sparrows", "Thunder", "Circus"
+]
+GENRES = [
+    "pop", "rap", "hip hop", "trap", "r&b", "indie", "rock", "alt rock", "edm", "house",
+    "techno", "country", "latin", "reggaeton", "k-pop", "jazz", "soul", "afrobeats", "metal", "folk"
+]
+
+class FakeSpotifyClient:
+    """
+    In-process stand-in for the Spotipy client.
+    
+    Serves a deterministic synthetic catalog (or a recorded one loaded from a
+    JSON file) through the same methods and response shapes SpotifyService
+    uses, so crawling, rate limiting and searches can be benchmarked and
+    tested without credentials or network.
+    
+    Synthetic artists are numbered by popularity (index 0 is the most
+    popular) and their albums and tracks are generated on demand from the
+    seed, so large catalogs cost no memory up front. Collaborators are drawn
+    with a bias towards popular artists, like real features.
+    
+    Every call sleeps for the configured latency and is checked against a
+    simulated server-side rate limit: calls over `rate_limit` per second, and
+    a random `error_rate` fraction of calls, fail with a 429 SpotifyException
+    carrying a Retry-After header.
+    """
+    
+    def __init__(self, num_artists: int = 2000, albums_per_artist: int = 6, tracks_per_album: int = 10,
+                 feature_rate: float = 0.3, seed: int = 0, catalog_file: Optional[str] = None,
+                 latency: float = 0.0, jitter: float = 0.0, rate_limit: float = 0.0,
+                 error_rate: float = 0.0, retry_after: int = 1):
+        """
+        Initialize the fake client.
+        
+        Args:
+            num_artists (int): Number of synthetic artists.
+            albums_per_artist (int): Average number of albums and singles per artist.
+            tracks_per_album (int): Average number of tracks per album.
+            feature_rate (float): Probability that a track features other artists.
+            seed (int): Seed of the synthetic catalog.
+            catalog_file (str): Recorded catalog to serve instead of a synthetic one.
+            latency (float): Seconds every call takes.
+            jitter (float): Maximum extra random latency in seconds.
+            rate_limit (float): Calls per second allowed before answering 429 (0 disables).
+            error_rate (float): Fraction of calls randomly answered with 429.
+            retry_after (int): Retry-After seconds sent with injected 429 responses.
+        """
+        self.num_artists = num_artists
+        self.albums_per_artist = max(1, albums_per_artist)
+        self.tracks_per_album = max(1, tracks_per_album)
+        self.feature_rate = feature_rate
+        self.seed = seed
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        
+        self.request_count = 0
+        self.throttled_count = 0
+        self._recent_requests = deque()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        
+        # Recorded catalog, if any: artist ID -> artist, album ID -> album, artist ID -> album IDs
+        self._artists: Optional[Dict[str, Dict[str, Any]]] = None
+        self._albums: Dict[str, Dict[str, Any]] = {}
+        self._artist_albums: Dict[str, List[str]] = {}
+        self._search_names: Optional[List[Any]] = None
+        if catalog_file:
+            self._load_catalog(catalog_file)
+    
+    @classmethod
+    def from_config(cls) -> "FakeSpotifyClient":
+        """
+        Create a fake client from the FAKE_SPOTIFY_* settings.
+        
+        Returns:
+            FakeSpotifyClient: The client.
+        """
+        return cls(
+            num_artists=Config.FAKE_SPOTIFY_ARTISTS,
+            albums_per_artist=Config.FAKE_SPOTIFY_ALBUMS_PER_ARTIST,
+            tracks_per_album=Config.FAKE_SPOTIFY_TRACKS_PER_ALBUM,
+            feature_rate=Config.FAKE_SPOTIFY_FEATURE_RATE,
+            seed=Config.FAKE_SPOTIFY_SEED,
+            catalog_file=Config.FAKE_SPOTIFY_CATALOG_FILE or None,
+            latency=Config.FAKE_SPOTIFY_LATENCY,
+            jitter=Config.FAKE_SPOTIFY_JITTER,
+            rate_limit=Config.FAKE_SPOTIFY_RATE_LIMIT,
+            error_rate=Config.FAKE_SPOTIFY_ERROR_RATE,
+            retry_after=Config.FAKE_SPOTIFY_RETRY_AFTER
+        )
+    
+    def _load_catalog(self, catalog_file: str):
+        """
+        Load a recorded catalog.
+        
+        The file holds {"artists": [full artist objects], "albums": [full
+        album objects]}, each album with its "artists" and all of its tracks
+        under "tracks" -> "items".
+        """
+        with open(catalog_file, mode="r", encoding="utf-8") as file:
+            catalog = json.load(file)
+        
+        self._artists = {artist["id"]: artist for artist in catalog.get("artists", [])}
+        for album in catalog.get("albums", []):
+            self._albums[album["id"]] = album
+            for artist in album.get("artists", []):
+                self._artist_albums.setdefault(artist["id"], []).append(album["id"])
+        for album_ids in self._artist_albums.values():
+            album_ids.sort(key=lambda album_id: self._albums[album_id].get("release_date", ""), reverse=True)
+        
+        self.num_artists = len(self._artists)
+        logger.info(f"Loaded fake Spotify catalog with {len(self._artists)} artists and {len(self._albums)} albums")
+    
+    # Simulated server behaviour
+    
+    def _serve(self):
+        """Apply latency, the simulated rate limit and 429 injection to one call."""
+        with self._lock:
+            self.request_count += 1
+            now = time.monotonic()
+            throttled_for = None
+            if self.rate_limit > 0:
+                while self._recent_requests and self._recent_requests[0] <= now - 1.0:
+                    self._recent_requests.popleft()
+                if len(self._recent_requests) >= self.rate_limit:
+                    throttled_for = max(1, math.ceil(self._recent_requests[0] + 1.0 - now))
+                else:
+                    self._recent_requests.append(now)
+            if throttled_for is None and self.error_rate > 0 and self._random.random() < self.error_rate:
+                throttled_for = self.retry_after
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter > 0 else 0)
+        
+        if delay > 0:
+            time.sleep(delay)
+        if throttled_for is not None:
+            with self._lock:
+                self.throttled_count += 1
+            raise SpotifyException(429, -1, "API rate limit exceeded", headers={"Retry-After": str(throttled_for)})
+    
+    @staticmethod
+    def _not_found(kind: str, object_id: str):
+        return SpotifyException(404, -1, f"Non existing {kind} id: {object_id}")
+    
+    @staticmethod
+    def _page(items: List[Any], total: int, limit: int, offset: int, href: str) -> Dict[str, Any]:
+        next_offset = offset + limit
+        return {
+            "href": f"{href}?offset={offset}&limit={limit}",
+            "items": items,
+            "limit": limit,
+            "offset": offset,
+            "total": total,
+            "next": f"{href}?offset={next_offset}&limit={limit}" if next_offset < total else None,
+            "previous": None
+        }
+    
+    # Synthetic catalog
+    
+    def _artist_index(self, artist_id: str) -> Optional[int]:
+        if not artist_id.startswith("artist"):
+            return None
+        try:
+            index = int(artist_id[6:])
+        except ValueError:
+            return None
+        return index if 0 <= index < self.num_artists else None
+    
+    @staticmethod
+    def _artist_name(index: int) -> str:
+        first = NAME_FIRST[index % len(NAME_FIRST)]
+        second = NAME_SECOND[(index // len(NAME_FIRST)) % len(NAME_SECOND)]
+        generation = index // (len(NAME_FIRST) * len(NAME_SECOND))
+        return f"{first} {second}" + (f" {generation + 1}" if generation else "")
+    
+    @staticmethod
+    def _simplified_artist(artist_id: str, name: str) -> Dict[str, Any]:
+        return {
+            "id": artist_id,
+            "name": name,
+            "type": "artist",
+            "uri": f"spotify:artist:{artist_id}",
+            "external_urls": {"spotify": ARTIST_URL_PREFIX + artist_id}
+        }
+    
+    def _synthetic_artist(self, index: int) -> Dict[str, Any]:
+        rng = random.Random(f"{self.seed}:artist:{index}")
+        artist_id = f"artist{index:07d}"
+        artist = self._simplified_artist(artist_id, self._artist_name(index))
+        popularity = int(round(100 * (1 - index / max(1, self.num_artists)) ** 2))
+        artist.update({
+            "popularity": popularity,
+            "followers": {"href": None, "total": int(popularity ** 3 * rng.uniform(5, 15))},
+            "genres": rng.sample(GENRES, rng.randint(1, 3)),
+            "images": [{"url": f"https://i.scdn.co/image/{artist_id}", "height": 640, "width": 640}]
+        })
+        return artist
+    
+    def _synthetic_album_ids(self, index: int) -> List[str]:
+        rng = random.Random(f"{self.seed}:albums:{index}")
+        count = rng.randint(1, 2 * self.albums_per_artist - 1)
+        return [f"album{index:07d}x{number:03d}" for number in range(count)]
+    
+    def _synthetic_album(self, album_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            index, number = int(album_id[5:12]), int(album_id[13:])
+        except ValueError:
+            return None
+        if not album_id.startswith("album") or index >= self.num_artists or \
+                album_id not in self._synthetic_album_ids(index):
+            return None
+        
+        rng = random.Random(f"{self.seed}:album:{album_id}")
+        artist_id = f"artist{index:07d}"
+        main_artist = self._simplified_artist(artist_id, self._artist_name(index))
+        
+        # Albums are numbered newest first, the way Spotify lists them
+        year = 2024 - number * rng.randint(1, 3)
+        album_type = "single" if rng.random() < 0.4 else "album"
+        track_count = 1 if album_type == "single" else rng.randint(max(1, self.tracks_per_album // 2),
+                                                                   self.tracks_per_album * 3 // 2)
+        
+        tracks = []
+        for track_number in range(track_count):
+            artists = [main_artist]
+            if rng.random() < self.feature_rate:
+                for _ in range(rng.randint(1, 2)):
+                    # Skewed towards popular artists, like real features
+                    featured = int(self.num_artists * rng.random() ** 2)
+                    if featured != index:
+                        artists.append(self._simplified_artist(f"artist{featured:07d}", self._artist_name(featured)))
+            track_id = f"track{index:07d}x{number:03d}x{track_number:03d}"
+            tracks.append({
+                "id": track_id,
+                "name": f"Track {track_number + 1} ({main_artist['name']})",
+                "type": "track",
+                "track_number": track_number + 1,
+                "duration_ms": rng.randint(120000, 300000),
+                "artists": artists,
+                "external_urls": {"spotify": f"https://open.spotify.com/track/{track_id}"}
+            })
+        
+        return {
+            "id": album_id,
+            "name": f"{main_artist['name']} {'Single' if album_type == 'single' else 'Album'} {number + 1}",
+            "album_type": album_type,
+            "release_date": f"{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "release_date_precision": "day",
+            "total_tracks": track_count,
+            "artists": [main_artist],
+            "external_urls": {"spotify": f"https://open.spotify.com/album/{album_id}"},
+            "tracks": {"items": tracks}
+        }
+    
+    # Catalog access (recorded or synthetic)
+    
+    def _get_artist(self, artist_id: str) -> Optional[Dict[str, Any]]:
+        if self._artists is not None:
+            return self._artists.get(artist_id)
+        index = self._artist_index(artist_id)
+        return self._synthetic_artist(index) if index is not None else None
+    
+    def _get_album_ids(self, artist_id: str) -> Optional[List[str]]:
+        if self._artists is not None:
+            return self._artist_albums.get(artist_id, []) if artist_id in self._artists else None
+        index = self._artist_index(artist_id)
+        return self._synthetic_album_ids(index) if index is not None else None
+    
+    def _get_album(self, album_id: str) -> Optional[Dict[str, Any]]:
+        if self._artists is not None:
+            return self._albums.get(album_id)
+        return self._synthetic_album(album_id)
+    
+    def _iter_artists(self):
+        if self._artists is not None:
+            return iter(self._artists.values())
+        return (self._synthetic_artist(index) for index in range(self.num_artists))
+    
+    def artist_names(self, limit: Optional[int] = None) -> List[str]:
+        """
+        Get artist names from the catalog, most popular first.
+        
+        Args:
+            limit (int): Maximum number of names.
+        
+        Returns:
+            list: Artist names.
+        """
+        artists = sorted(self._iter_artists(), key=lambda artist: -artist.get("popularity", 0))
+        return [artist["name"] for artist in artists[:limit]]
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get request statistics.
+        
+        Returns:
+            dict: Requests served and requests answered with 429.
+        """
+        with self._lock:
+            return {"requests": self.request_count, "throttled": self.throttled_count}
+    
+    # Spotipy methods
+    
+    def search(self, q: str, limit: int = 10, offset: int = 0, type: str = "track",
+               market: Optional[str] = None) -> Dict[str, Any]:
+        """Search artists by name, most popular first (only type="artist" is supported)."""
+        self._serve()
+        if type != "artist":
+            raise SpotifyException(400, -1, f"Unsupported search type in fake client: {type}")
+        
+        if self._search_names is None:
+            self._search_names = [(normalize_artist_name(artist["name"]), -artist.get("popularity", 0), artist["id"])
+                                  for artist in self._iter_artists()]
+        
+        query = normalize_artist_name(q)
+        # Exact matches first, then by popularity, like Spotify's relevance ranking
+        ranked = sorted((name != query, negative_popularity, artist_id)
+                        for name, negative_popularity, artist_id in self._search_names if query in name)
+        matches = [self._get_artist(artist_id) for _, _, artist_id in ranked]
+        return {"artists": self._page(matches[offset:offset + limit], len(matches), limit, offset,
+                                      "https://api.spotify.com/v1/search")}
+    
+    def artist(self, artist_id: str) -> Dict[str, Any]:
+        """Get a full artist object."""
+        self._serve()
+        artist_id = artist_id.rstrip("/").split("/")[-1]
+        artist = self._get_artist(artist_id)
+        if artist is None:
+            raise self._not_found("artist", artist_id)
+        return artist
+    
+    def artist_albums(self, artist_id: str, album_type: Optional[str] = None, country: Optional[str] = None,
+                      limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """Get a page of an artist's albums as simplified album objects."""
+        self._serve()
+        album_ids = self._get_album_ids(artist_id)
+        if album_ids is None:
+            raise self._not_found("artist", artist_id)
+        
+        albums = [self._get_album(album_id) for album_id in album_ids]
+        if album_type:
+            album_types = set(album_type.split(","))
+            albums = [album for album in albums if album.get("album_type") in album_types]
+        
+        items = [{name: value for name, value in album.items() if name != "tracks"}
+                 for album in albums[offset:offset + limit]]
+        return self._page(items, len(albums), limit, offset, f"https://api.spotify.com/v1/artists/{artist_id}/albums")
+    
+    def albums(self, albums: List[str], market: Optional[str] = None) -> Dict[str, Any]:
+        """Get several full album objects, with the first page of their tracks."""
+        self._serve()
+        if len(albums) > 20:
+            raise SpotifyException(400, -1, "Too many ids requested")
+        
+        result = []
+        for album_id in albums:
+            album = self._get_album(album_id)
+            if album is None:
+                result.append(None)
+                continue
+            tracks = album["tracks"]["items"]
+            result.append(dict(album, tracks=self._page(
+                tracks[:50], len(tracks), 50, 0, f"https://api.spotify.com/v1/albums/{album_id}/tracks"
+            )))
+        return {"albums": result}
+    
+    def album_tracks(self, album_id: str, limit: int = 50, offset: int = 0,
+                     market: Optional[str] = None) -> Dict[str, Any]:
+        """Get a page of an album's tracks."""
+        self._serve()
+        album = self._get_album(album_id)
+        if album is None:
+            raise self._not_found("album", album_id)
+        tracks = album["tracks"]["items"]
+        return self._page(tracks[offset:offset + limit], len(tracks), limit, offset,
+                          f"https://api.spotify.com/v1/albums/{album_id}/tracks")
\ No newline at end of file
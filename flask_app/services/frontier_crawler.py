@@ -0,0 +1,281 @@
+import os
+import json
+import heapq
+import time
+import logging
+import threading
+from collections import Counter, deque
+from typing import Dict, List, Optional, Any
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+class FrontierCrawler:
+    """
+    Background crawler that keeps expanding the artist graph.
+    
+    Artists that appear as collaborators but were never crawled form the
+    frontier. They are kept in a priority queue ranked by in-degree,
+    popularity and how often users searched them, and expanded one at a
+    time through SpotifyService.find_related_artists_batch into GraphService.
+    Artists without features are stored with no connections, so they count
+    as crawled and are never queued again.
+    
+    The queue, search counts and counters are checkpointed to a JSON file so
+    the crawler resumes where it stopped after a restart. An hourly
+    expansion budget keeps it from starving interactive searches of API quota.
+    """
+    
+    def __init__(self, spotify_service, graph_service, checkpoint_file: Optional[str] = None):
+        """
+        Initialize the frontier crawler.
+        
+        Args:
+            spotify_service: Service used to crawl artist discographies.
+            graph_service: Graph the expansions are written to.
+            checkpoint_file (str): Path of the JSON checkpoint file.
+        """
+        self.spotify_service = spotify_service
+        self.graph_service = graph_service
+        self.checkpoint_file = checkpoint_file or Config.FRONTIER_CHECKPOINT_FILE
+        
+        self._heap: List[List[Any]] = []  # [-priority, url] entries, stale ones skipped lazily
+        self._priorities: Dict[str, float] = {}
+        self._in_degree: Counter = Counter()
+        self._search_counts: Counter = Counter()
+        self._expanded = set()
+        self._recent_expansions = deque()
+        
+        self.expanded_count = 0
+        self.failed_count = 0
+        self._last_seeded = 0.0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        
+        self._load_checkpoint()
+    
+    def _priority(self, artist_url: str) -> float:
+        return (
+            self._in_degree[artist_url] * Config.FRONTIER_WEIGHT_IN_DEGREE
+            + self.spotify_service.metadata_store.get_popularity(artist_url) * Config.FRONTIER_WEIGHT_POPULARITY
+            + self._search_counts[artist_url] * Config.FRONTIER_WEIGHT_SEARCHES
+        )
+    
+    def _push(self, artist_url: str):
+        """Queue (or re-rank) an unexpanded artist. Caller holds the lock."""
+        if artist_url in self._expanded or artist_url in self.graph_service.snapshot():
+            return
+        priority = self._priority(artist_url)
+        if self._priorities.get(artist_url) == priority:
+            return
+        self._priorities[artist_url] = priority
+        heapq.heappush(self._heap, [-priority, artist_url])
+        
+        if len(self._heap) > Config.FRONTIER_MAX_QUEUE_SIZE * 2:
+            self._compact()
+    
+    def _compact(self):
+        """Drop stale heap entries and trim the queue to its size limit. Caller holds the lock."""
+        entries = [[-priority, url] for url, priority in self._priorities.items()]
+        entries.sort()
+        entries = entries[:Config.FRONTIER_MAX_QUEUE_SIZE]
+        self._priorities = {url: -negative for negative, url in entries}
+        heapq.heapify(entries)
+        self._heap = entries
+    
+    def _pop(self) -> Optional[str]:
+        """Pop the highest-priority unexpanded artist, skipping stale entries."""
+        with self._lock:
+            while self._heap:
+                negative, artist_url = heapq.heappop(self._heap)
+                if self._priorities.get(artist_url) != -negative:
+                    continue
+                del self._priorities[artist_url]
+                if artist_url not in self._expanded:
+                    return artist_url
+        return None
+    
+    def seed_from_graph(self):
+        """Rebuild in-degrees and the frontier from the current adjacency list."""
+        adjacency_list = self.graph_service.read_adjacency_list()
+        in_degree = Counter()
+        for related_urls in adjacency_list.values():
+            in_degree.update(related_urls)
+        
+        with self._lock:
+            self._expanded.update(adjacency_list.keys())
+            self._in_degree = in_degree
+            for artist_url in in_degree:
+                self._push(artist_url)
+            self._last_seeded = time.time()
+        
+        logger.info(f"Frontier seeded with {len(self._priorities)} unexpanded artists")
+    
+    def record_search(self, artist_url: str):
+        """
+        Note that a user searched for an artist, raising its crawl priority.
+        
+        Ignored while the crawler is not running, so a disabled crawler does
+        not grow a queue nobody expands.
+        
+        Args:
+            artist_url (str): Spotify URL of the searched artist.
+        """
+        if not self.is_running():
+            return
+        with self._lock:
+            self._search_counts[artist_url] += 1
+            self._push(artist_url)
+    
+    def _load_checkpoint(self):
+        if not os.path.exists(self.checkpoint_file):
+            return
+        try:
+            with open(self.checkpoint_file, mode="r", encoding="utf-8") as file:
+                checkpoint = json.load(file)
+            
+            self._search_counts = Counter(checkpoint.get("search_counts", {}))
+            self.expanded_count = checkpoint.get("expanded_count", 0)
+            self.failed_count = checkpoint.get("failed_count", 0)
+            for artist_url, priority in checkpoint.get("queue", []):
+                self._priorities[artist_url] = priority
+                self._heap.append([-priority, artist_url])
+            heapq.heapify(self._heap)
+            
+            logger.info(f"Resumed frontier crawler with {len(self._priorities)} queued artists")
+        except Exception as e:
+            logger.error(f"Error loading frontier checkpoint from {self.checkpoint_file}: {e}")
+    
+    def save_checkpoint(self) -> bool:
+        """
+        Write the queue and counters to the checkpoint file atomically.
+        
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        with self._lock:
+            queue = sorted(self._priorities.items(), key=lambda item: -item[1])[:Config.FRONTIER_MAX_QUEUE_SIZE]
+            checkpoint = {
+                "saved_at": time.time(),
+                "expanded_count": self.expanded_count,
+                "failed_count": self.failed_count,
+                "search_counts": dict(self._search_counts),
+                "queue": queue
+            }
+        
+        temp_file = self.checkpoint_file + ".tmp"
+        try:
+            with open(temp_file, mode="w", encoding="utf-8") as file:
+                json.dump(checkpoint, file)
+            os.replace(temp_file, self.checkpoint_file)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving frontier checkpoint to {self.checkpoint_file}: {e}")
+            return False
+    
+    def _budget_exhausted(self) -> bool:
+        """Check the sliding one-hour expansion budget."""
+        cutoff = time.time() - 3600
+        while self._recent_expansions and self._recent_expansions[0] < cutoff:
+            self._recent_expansions.popleft()
+        return len(self._recent_expansions) >= Config.FRONTIER_MAX_EXPANSIONS_PER_HOUR
+    
+    def expand_next(self) -> bool:
+        """
+        Expand the highest-priority frontier artist.
+        
+        Returns:
+            bool: True if an artist was taken off the queue, False if it was empty.
+        """
+        artist_url = self._pop()
+        if not artist_url:
+            return False
+        
+        if artist_url in self.graph_service.snapshot():
+            # Expanded by an interactive search since the frontier was seeded
+            with self._lock:
+                self._expanded.add(artist_url)
+            return True
+        
+        self._recent_expansions.append(time.time())
+        # Unlike find_related_artists, the batch call tells failed crawls from artists without features
+        related_urls = self.spotify_service.find_related_artists_batch([artist_url]).get(artist_url)
+        if related_urls is None or not self.graph_service.add_artist_connections(artist_url, related_urls):
+            # Nothing stored; skip it until the next restart rather than retrying in a loop
+            with self._lock:
+                self._expanded.add(artist_url)
+            self.failed_count += 1
+            return True
+        
+        with self._lock:
+            self._expanded.add(artist_url)
+            self.expanded_count += 1
+            self._in_degree.update(related_urls)
+            for related_url in related_urls:
+                self._push(related_url)
+        
+        logger.info(f"Frontier crawler expanded {artist_url} with {len(related_urls)} connections")
+        if self.expanded_count % Config.FRONTIER_CHECKPOINT_EVERY == 0:
+            self.save_checkpoint()
+        return True
+    
+    def _run(self):
+        logger.info("Frontier crawler started")
+        while not self._stop_event.is_set():
+            try:
+                if time.time() - self._last_seeded >= Config.FRONTIER_RESEED_INTERVAL:
+                    self.seed_from_graph()
+                
+                if self._budget_exhausted() or not self.expand_next():
+                    self._stop_event.wait(Config.FRONTIER_IDLE_SLEEP)
+            except Exception as e:
+                logger.error(f"Error in frontier crawler: {e}")
+                self._stop_event.wait(Config.FRONTIER_IDLE_SLEEP)
+        
+        self.save_checkpoint()
+        logger.info("Frontier crawler stopped")
+    
+    def is_running(self) -> bool:
+        """Check whether the crawler thread is alive."""
+        return bool(self._thread and self._thread.is_alive())
+    
+    def start(self):
+        """Start the crawler in a daemon thread."""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="frontier-crawler")
+        self._thread.daemon = True
+        self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop the crawler after the current expansion and write a checkpoint.
+        
+        Args:
+            timeout (float): Seconds to wait for the thread to finish.
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+    
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get crawler status.
+        
+        Returns:
+            dict: Running state, queue size, counters and remaining budget.
+        """
+        with self._lock:
+            top = sorted(self._priorities.items(), key=lambda item: -item[1])[:10]
+            return {
+                "running": self.is_running(),
+                "queued_artists": len(self._priorities),
+                "expanded_count": self.expanded_count,
+                "failed_count": self.failed_count,
+                "expansions_last_hour": len(self._recent_expansions),
+                "max_expansions_per_hour": Config.FRONTIER_MAX_EXPANSIONS_PER_HOUR,
+                "next_artists": [{"url": url, "priority": priority} for url, priority in top]
+            }
\ No newline at end of file
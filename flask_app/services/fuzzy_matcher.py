@@ -0,0 +1,190 @@
+import time
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, Any
+
+from config import Config
+from .name_index import NameIndex, ARTIST_URL_PREFIX
+from .metadata_store import ArtistMetadataStore
+from .resolution_cache import normalize_artist_name
+
+logger = logging.getLogger(__name__)
+
+def name_trigrams(normalized: str) -> List[str]:
+    """
+    Split a normalized name into its distinct padded character trigrams.
+    
+    Args:
+        normalized (str): Name already passed through normalize_artist_name.
+    
+    Returns:
+        list: Distinct trigrams ("  d", " dr", "dra", ... for "drake").
+    """
+    padded = f"  {normalized} "
+    return list({padded[i:i + 3] for i in range(len(padded) - 2)})
+
+class FuzzyMatcher:
+    """
+    Offline fuzzy artist-name matcher over the local name index.
+    
+    Names are broken into character trigrams and stored in a precomputed
+    inverted index (trigram -> artist positions). A query only touches the
+    postings of its own trigrams, counts shared trigrams per candidate and
+    ranks them by Jaccard similarity, so typos resolve without API calls.
+    
+    The first index is built at startup (see SearchService); later builds
+    run in the background when the name index has changed and the previous
+    build is older than FUZZY_REBUILD_INTERVAL, and the old index is served
+    meanwhile.
+    """
+    
+    def __init__(self, name_index: NameIndex, metadata_store: ArtistMetadataStore):
+        """
+        Initialize the fuzzy matcher.
+        
+        Args:
+            name_index: Local artist name index.
+            metadata_store: Local artist metadata store, used to break ties.
+        """
+        self.name_index = name_index
+        self.metadata_store = metadata_store
+        
+        # (artist IDs, names, trigram counts, postings), swapped atomically on rebuild
+        self._index: Tuple[List[str], List[str], List[int], Dict[str, List[int]]] = ([], [], [], {})
+        self._built_version = None
+        self._built_at = 0.0
+        self._rebuilding = False
+        self._lock = threading.Lock()
+    
+    def rebuild(self):
+        """Rebuild the trigram inverted index from the name index."""
+        started = time.time()
+        version = self.name_index.version
+        
+        ids, names, sizes = [], [], []
+        postings = defaultdict(list)
+        for artist_id, name in self.name_index.items():
+            normalized = normalize_artist_name(name)
+            if not normalized:
+                continue
+            position = len(ids)
+            trigrams = name_trigrams(normalized)
+            ids.append(artist_id)
+            names.append(name)
+            sizes.append(len(trigrams))
+            for trigram in trigrams:
+                postings[trigram].append(position)
+        
+        with self._lock:
+            self._index = (ids, names, sizes, dict(postings))
+            self._built_version = version
+            self._built_at = time.time()
+            self._rebuilding = False
+        
+        logger.info(f"Fuzzy matcher index rebuilt with {len(ids)} artists in {time.time() - started:.2f}s")
+    
+    def _ensure_fresh(self):
+        """Schedule a background rebuild when the name index changed and the build is old enough."""
+        if self._rebuilding or self._built_version == self.name_index.version:
+            return
+        if self._built_version is not None and time.time() - self._built_at < Config.FUZZY_REBUILD_INTERVAL:
+            return
+        
+        self._rebuilding = True
+        thread = threading.Thread(target=self._rebuild_safely)
+        thread.daemon = True
+        thread.start()
+    
+    def _rebuild_safely(self):
+        try:
+            self.rebuild()
+        except Exception as e:
+            logger.error(f"Error rebuilding fuzzy matcher index: {e}")
+            self._rebuilding = False
+    
+    def match(self, name: str, limit: int = 5, min_score: float = 0.0) -> List[Dict[str, Any]]:
+        """
+        Find the artists whose names are most similar to the given name.
+        
+        Args:
+            name (str): Artist name as typed by the user.
+            limit (int): Maximum number of candidates to return.
+            min_score (float): Minimum trigram similarity (0-1) to include.
+        
+        Returns:
+            list: Candidates with id, name, url and score, best first.
+        """
+        normalized = normalize_artist_name(name)
+        if not normalized:
+            return []
+        
+        self._ensure_fresh()
+        ids, names, sizes, postings = self._index
+        
+        query_trigrams = name_trigrams(normalized)
+        shared = defaultdict(int)
+        for trigram in query_trigrams:
+            for position in postings.get(trigram, ()):
+                shared[position] += 1
+        
+        query_size = len(query_trigrams)
+        scored = []
+        for position, count in shared.items():
+            score = count / (query_size + sizes[position] - count)
+            if score >= min_score:
+                scored.append((score, self.metadata_store.get_popularity(ids[position]), position))
+        scored.sort(reverse=True)
+        
+        return [
+            {
+                "id": ids[position],
+                "name": names[position],
+                "url": ARTIST_URL_PREFIX + ids[position],
+                "score": round(score, 3)
+            }
+            for score, _, position in scored[:limit]
+        ]
+    
+    def best_match(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the best candidate if it is confident enough to skip Spotify.
+        
+        A candidate is confident if its normalized name equals the query and
+        no other artist has that name, or if it scores at least FUZZY_MIN_SCORE
+        and leads the runner-up by FUZZY_MIN_MARGIN. A near miss of an artist
+        missing from the index ("adele" vs a local "adel") is not.
+        
+        Args:
+            name (str): Artist name as typed by the user.
+        
+        Returns:
+            dict: The confident candidate, or None if Spotify should be asked.
+        """
+        candidates = self.match(name, limit=2, min_score=Config.FUZZY_MIN_SCORE - Config.FUZZY_MIN_MARGIN)
+        if not candidates:
+            return None
+        
+        best = candidates[0]
+        runner_up = candidates[1] if len(candidates) > 1 else None
+        normalized = normalize_artist_name(name)
+        if (normalize_artist_name(best["name"]) == normalized
+                and not (runner_up and normalize_artist_name(runner_up["name"]) == normalized)):
+            return best
+        if best["score"] >= Config.FUZZY_MIN_SCORE and (
+                not runner_up or best["score"] - runner_up["score"] >= Config.FUZZY_MIN_MARGIN):
+            return best
+        return None
+    
+    def fallback_match(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the best candidate above FUZZY_FALLBACK_SCORE, for when Spotify cannot be asked.
+        
+        Args:
+            name (str): Artist name as typed by the user.
+        
+        Returns:
+            dict: The best candidate, or None if nothing matches well enough.
+        """
+        candidates = self.match(name, limit=1, min_score=Config.FUZZY_FALLBACK_SCORE)
+        return candidates[0] if candidates else None
\ No newline at end of file
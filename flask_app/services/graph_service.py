@@ -1,9 +1,26 @@
 import csv
 import os
+import math
+import time
+import heapq
+import atexit
+import itertools
 import logging
-from typing import Dict, List, Optional, Tuple, Callable
+import threading
+from array import array
+from typing import Dict, List, Optional, Tuple, Callable, Any, Iterator, Set, Union
 
 from config import Config
+from models.graph_model import Connection, GraphStats
+from .graph_writer import GraphWriter
+from .graph_snapshot import GraphSnapshot
+from .compact_graph import CompactGraph
+from .landmark_index import LandmarkIndex
+from .distance_labels import DistanceLabels
+from .separation_stats import SeparationStats
+from .degree_stats import DegreeStats
+from .betweenness import load_ranking
+from .communities import Communities
 
 logger = logging.getLogger(__name__)
 
@@ -16,11 +33,29 @@ class GraphService:
     """
     
     def __init__(self):
-        """Initialize graph service."""
+        """Initialize graph service and load the adjacency list into memory."""
         self.csv_file = Config.CSV_FILE
+        self.weights_file = Config.WEIGHTS_FILE
+        self._write_lock = threading.Lock()
+        adjacency_list = self._load_adjacency_list()
+        self._graph = GraphSnapshot(0, adjacency_list, weights=GraphSnapshot(0, self._load_weights(adjacency_list)))
+        self.degree_stats = DegreeStats(adjacency_list)
+        
+        # Updates are published as new snapshots immediately and persisted in batches
+        self.writer = GraphWriter(self.csv_file, self.snapshot, weights_file=self.weights_file)
+        
+        # Compact copy of a recent version with its landmark index, rebuilt in the background
+        self._compact: Optional[CompactGraph] = None
+        self._compact_built_at = 0.0
+        self._compact_rebuilding = False
+        self._compact_lock = threading.Lock()
+        self._building: Set[str] = set()  # Derived indexes being built in the background
+        self._built_at: Dict[str, float] = {}  # When each derived index was last built in the background
+        self._betweenness: Optional[Tuple[float, Dict[str, Any]]] = None  # (file mtime, saved ranking)
+        atexit.register(self.close)
         logger.info(f"Graph service initialized with CSV file: {self.csv_file}")
     
-    def read_adjacency_list(self) -> Dict[str, List[str]]:
+    def _load_adjacency_list(self) -> Dict[str, Tuple[str, ...]]:
         """
         Reads the adjacency list from the CSV file.
         
@@ -40,7 +75,7 @@ class GraphService:
                 for row in reader:
                     if row:  # Skip empty rows
                         artist_url = row[0]
-                        related_urls = row[1:]
+                        related_urls = tuple(row[1:])
                         adjacency_list[artist_url] = related_urls
             
             logger.info(f"Loaded adjacency list with {len(adjacency_list)} artists")
@@ -50,11 +85,61 @@ class GraphService:
             logger.error(f"Error reading adjacency list from {self.csv_file}: {e}")
             return {}
     
-    def write_adjacency_list(self, adjacency_list: Dict[str, List[str]]) -> bool:
+    def _load_weights(self, adjacency_list: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[int, ...]]:
         """
-        Writes the adjacency list to the CSV file.
+        Reads collaboration strengths from the weights CSV file.
         
-        Preserves the exact functionality from the original implementation.
+        Rows that no longer line up with the adjacency list (e.g. the CSV was
+        edited by hand) are ignored, leaving those strengths unknown.
+        
+        Args:
+            adjacency_list (dict): The loaded adjacency list.
+        
+        Returns:
+            dict: Artist URL -> shared track count per related artist.
+        """
+        weights = {}
+        if not os.path.exists(self.weights_file):
+            return weights
+        try:
+            with open(self.weights_file, mode="r", newline="") as file:
+                for row in csv.reader(file):
+                    if row and len(row) - 1 == len(adjacency_list.get(row[0], ())):
+                        weights[row[0]] = tuple(int(strength) for strength in row[1:])
+            logger.info(f"Loaded collaboration strengths for {len(weights)} artists")
+        except Exception as e:
+            logger.error(f"Error reading collaboration strengths from {self.weights_file}: {e}")
+            return {}
+        return weights
+    
+    def snapshot(self) -> GraphSnapshot:
+        """
+        Gets the current graph version.
+        
+        The snapshot is immutable, so a search can keep using it while
+        updates publish newer versions. Reading it takes no lock.
+        
+        Returns:
+            GraphSnapshot: Read-only mapping of artist URLs to related artist URLs.
+        """
+        return self._graph
+    
+    def read_adjacency_list(self) -> GraphSnapshot:
+        """
+        Gets the adjacency list.
+        
+        The graph is loaded from the CSV file once at startup and kept up to
+        date in memory, so this no longer re-reads the file. The result is
+        the current immutable snapshot.
+        
+        Returns:
+            GraphSnapshot: Read-only mapping of artist URLs to related artist URLs.
+        """
+        return self._graph
+    
+    def write_adjacency_list(self, adjacency_list: Dict[str, List[str]]) -> bool:
+        """
+        Replaces the adjacency list and writes it to the CSV file.
         
         Args:
             adjacency_list (dict): Adjacency list mapping artist URLs to related artist URLs.
@@ -62,36 +147,55 @@ class GraphService:
         Returns:
             bool: True if successful, False otherwise.
         """
-        try:
-            with open(self.csv_file, mode="w", newline="") as file:
-                writer = csv.writer(file)
-                for artist_url, related_urls in adjacency_list.items():
-                    writer.writerow([artist_url] + related_urls)
-            
-            logger.info(f"Successfully wrote adjacency list with {len(adjacency_list)} artists")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error writing adjacency list to {self.csv_file}: {e}")
-            return False
+        graph = {artist_url: tuple(related_urls) for artist_url, related_urls in adjacency_list.items()}
+        with self._write_lock:
+            self._graph = GraphSnapshot(self._graph.version + 1, graph, weights=GraphSnapshot(0, {}))
+            self.degree_stats.reset(graph)
+        self.writer.submit(len(adjacency_list))
+        return self.writer.flush()
     
-    def add_artist_connections(self, artist_url: str, related_urls: List[str]) -> bool:
+    def add_artist_connections(self, artist_url: str, related_urls: Union[List[str], Dict[str, int]]) -> bool:
         """
         Add connections for an artist to the adjacency list.
         
+        The update is visible to searches immediately and written to disk
+        by the graph writer with the next batch.
+        
         Args:
             artist_url (str): URL of the artist.
-            related_urls (list): List of related artist URLs.
+            related_urls: List of related artist URLs, or a dict of related
+                artist URL -> number of shared tracks to record strengths.
             
         Returns:
             bool: True if successful, False otherwise.
         """
+        return self.add_many_artist_connections({artist_url: related_urls})
+    
+    def add_many_artist_connections(self, connections: Dict[str, Union[List[str], Dict[str, int]]]) -> bool:
+        """
+        Add connections for several artists to the adjacency list.
+        
+        Args:
+            connections (dict): Artist URL -> list of related artist URLs, or
+                dict of related artist URL -> number of shared tracks.
+            
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        if not connections:
+            return True
         try:
-            adjacency_list = self.read_adjacency_list()
-            adjacency_list[artist_url] = related_urls
-            return self.write_adjacency_list(adjacency_list)
+            updates = {artist_url: tuple(related_urls) for artist_url, related_urls in connections.items()}
+            strengths = {artist_url: tuple(related_urls.values()) for artist_url, related_urls in connections.items()
+                         if isinstance(related_urls, dict)}
+            with self._write_lock:
+                self._graph = self._graph.with_updates(updates, strengths)
+                for artist_url, related_urls in updates.items():
+                    self.degree_stats.update(artist_url, len(related_urls))
+            self.writer.submit(len(connections))
+            return True
         except Exception as e:
-            logger.error(f"Error adding artist connections: {e}")
+            logger.error(f"Error adding connections for {len(connections)} artists: {e}")
             return False
     
     def get_artist_connections(self, artist_url: str) -> List[str]:
@@ -104,8 +208,220 @@ class GraphService:
         Returns:
             list: List of related artist URLs.
         """
-        adjacency_list = self.read_adjacency_list()
-        return adjacency_list.get(artist_url, [])
+        return list(self._graph.get(artist_url, ()))
+    
+    def get_connection_strengths(self, artist_url: str) -> Dict[str, int]:
+        """
+        Get the connections of an artist with their strengths.
+        
+        Args:
+            artist_url (str): URL of the artist.
+        
+        Returns:
+            dict: Related artist URL -> number of shared tracks (1 when unknown).
+        """
+        graph = self._graph
+        related_urls = graph.get(artist_url, ())
+        return dict(zip(related_urls, graph.strengths(artist_url) or (1,) * len(related_urls)))
+    
+    def get_path_connections(self, path_urls: List[str], snapshot: Optional[GraphSnapshot] = None) -> List[Connection]:
+        """
+        Get the connections along a path with their strengths.
+        
+        Args:
+            path_urls (list): Artist URLs of the path.
+            snapshot (GraphSnapshot): Graph version to read; defaults to the current one.
+        
+        Returns:
+            list: One Connection per hop (strength 1 when unknown).
+        """
+        graph = snapshot if snapshot is not None else self._graph
+        connections = []
+        for from_url, to_url in zip(path_urls, path_urls[1:]):
+            related_urls = graph.get(from_url, ())
+            strengths = graph.strengths(from_url)
+            strength = strengths[related_urls.index(to_url)] if strengths and to_url in related_urls else 1
+            connections.append(Connection(from_url, to_url, strength=strength))
+        return connections
+    
+    def rebuild_compact_graph(self) -> CompactGraph:
+        """
+        Pack the current graph version and compute its landmark index.
+        
+        Distance labels on disk are attached when they were built for exactly
+        this graph (e.g. right after a restart); otherwise compact_graph()
+        builds them in the background. Separation statistics and communities
+        of the previous compact graph are kept until new ones are built, since
+        they describe their own graph version and are only rebuilt once per
+        GRAPH_ANALYTICS_INTERVAL.
+        
+        Returns:
+            CompactGraph: The new compact graph, with `landmarks` set.
+        """
+        started = time.time()
+        compact = CompactGraph.from_snapshot(self.snapshot())
+        compact.landmarks = LandmarkIndex(compact, Config.LANDMARK_COUNT)
+        if Config.DISTANCE_LABELS_ENABLED:
+            compact.labels = DistanceLabels.open_if_current(compact, Config.DISTANCE_LABELS_FILE)
+        if Config.SEPARATION_STATS_ENABLED:
+            compact.separation = SeparationStats.open_if_current(compact, Config.SEPARATION_STATS_FILE)
+        with self._compact_lock:
+            if self._compact is None or compact.version >= self._compact.version:
+                if self._compact is not None:
+                    compact.separation = compact.separation or self._compact.separation
+                    compact.communities = compact.communities or self._compact.communities
+                self._compact = compact
+            self._compact_built_at = time.time()
+            self._compact_rebuilding = False
+        logger.info(f"Compact graph version {compact.version} built with {compact.node_count} artists and "
+                    f"{compact.edge_count} connections in {time.time() - started:.2f}s")
+        return compact
+    
+    def _rebuild_compact_graph_safely(self):
+        try:
+            self.rebuild_compact_graph()
+        except Exception as e:
+            logger.error(f"Error rebuilding compact graph: {e}")
+            self._compact_rebuilding = False
+    
+    def build_distance_labels(self, compact: Optional[CompactGraph] = None) -> DistanceLabels:
+        """
+        Build the distance labels of a compact graph and attach them to it.
+        
+        Args:
+            compact (CompactGraph): Graph to label; defaults to the latest one.
+        
+        Returns:
+            DistanceLabels: The new labels, also written to DISTANCE_LABELS_FILE.
+        """
+        compact = compact if compact is not None else self.compact_graph()
+        compact.labels = DistanceLabels.build(compact, Config.DISTANCE_LABELS_FILE)
+        return compact.labels
+    
+    def build_separation_stats(self, compact: Optional[CompactGraph] = None) -> SeparationStats:
+        """
+        Sample the degrees of separation of a compact graph and attach them to it.
+        
+        Args:
+            compact (CompactGraph): Graph to analyze; defaults to the latest one.
+        
+        Returns:
+            SeparationStats: The new statistics, also written to SEPARATION_STATS_FILE.
+        """
+        compact = compact if compact is not None else self.compact_graph()
+        # In-process: worker processes are for manage.py, see graph_workers.map_over_graph
+        separation = SeparationStats.build(compact, Config.SEPARATION_SAMPLE_SIZE, processes=1)
+        separation.save(Config.SEPARATION_STATS_FILE)
+        compact.separation = separation
+        return separation
+    
+    def build_communities(self, compact: Optional[CompactGraph] = None) -> Communities:
+        """
+        Detect the communities (scenes) of a compact graph and attach them to it.
+        
+        Args:
+            compact (CompactGraph): Graph to partition; defaults to the latest one.
+        
+        Returns:
+            Communities: The detected communities.
+        """
+        compact = compact if compact is not None else self.compact_graph()
+        compact.communities = Communities.detect(compact, Config.COMMUNITY_MAX_ROUNDS)
+        return compact.communities
+    
+    def _build_safely(self, compact: CompactGraph, attribute: str, build: Callable[[CompactGraph], Any]):
+        try:
+            build(compact)
+        except Exception as e:
+            logger.error(f"Error building {attribute} of compact graph version {compact.version}: {e}")
+        finally:
+            with self._compact_lock:
+                self._building.discard(attribute)
+    
+    def _ensure_derived_indexes(self, compact: CompactGraph):
+        """
+        Start background builds of the derived indexes the latest compact graph
+        is missing or has only for an older version, each at most once per
+        GRAPH_ANALYTICS_INTERVAL.
+        """
+        for attribute, enabled, build in [
+            ("labels", Config.DISTANCE_LABELS_ENABLED, self.build_distance_labels),
+            ("separation", Config.SEPARATION_STATS_ENABLED, self.build_separation_stats),
+            ("communities", Config.COMMUNITIES_ENABLED, self.build_communities)
+        ]:
+            current = getattr(compact, attribute)
+            if not enabled or (current is not None and current.graph is compact):
+                continue
+            with self._compact_lock:
+                if attribute in self._building or compact is not self._compact:
+                    continue
+                if time.time() - self._built_at.get(attribute, 0.0) < Config.GRAPH_ANALYTICS_INTERVAL:
+                    continue
+                self._building.add(attribute)
+                self._built_at[attribute] = time.time()
+            
+            thread = threading.Thread(target=self._build_safely, args=(compact, attribute, build),
+                                      name=f"compact-graph-{attribute}")
+            thread.daemon = True
+            thread.start()
+    
+    def compact_graph(self, wait: bool = True) -> Optional[CompactGraph]:
+        """
+        Get the most recently built compact graph.
+        
+        It is built on first use and then rebuilt in the background when the
+        graph has changed and the last build is older than
+        GRAPH_INDEX_REBUILD_INTERVAL, so it may lag the current version. Its
+        distance labels, separation statistics and communities follow in
+        other background builds, so `labels`, `separation` and `communities`
+        are None until they are ready.
+        
+        Args:
+            wait (bool): Build the first compact graph in this thread. If
+                False, it is built in the background and None is returned
+                until it is ready.
+        
+        Returns:
+            CompactGraph: Compact graph with its landmark index.
+        """
+        compact = self._compact
+        if compact is None:
+            if not wait:
+                self._start_compact_rebuild()
+                return None
+            compact = self.rebuild_compact_graph()
+            self._ensure_derived_indexes(compact)
+            return compact
+        
+        self._ensure_derived_indexes(compact)
+        if compact.version != self._graph.version and (
+                time.time() - self._compact_built_at >= Config.GRAPH_INDEX_REBUILD_INTERVAL):
+            self._start_compact_rebuild()
+        return compact
+    
+    def _start_compact_rebuild(self):
+        """Rebuild the compact graph in a background thread unless a rebuild is already running."""
+        with self._compact_lock:
+            if self._compact_rebuilding:
+                return
+            self._compact_rebuilding = True
+        
+        thread = threading.Thread(target=self._rebuild_compact_graph_safely, name="compact-graph-rebuild")
+        thread.daemon = True
+        thread.start()
+    
+    def flush(self) -> bool:
+        """
+        Write pending graph updates to disk now.
+        
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        return self.writer.flush()
+    
+    def close(self):
+        """Write pending graph updates and stop the graph writer."""
+        self.writer.close()
     
     def find_related_artists_in_memory(self, adjacency_list: Dict[str, List[str]], artist_url: str) -> List[str]:
         """
@@ -128,7 +444,8 @@ class GraphService:
         return []
     
     def breadth_first_search(self, starting_url: str, ending_url: str, 
-                           progress_callback: Optional[Callable[[int, str], None]] = None) -> Optional[List]:
+                           progress_callback: Optional[Callable[[int, str], None]] = None,
+                           snapshot: Optional[GraphSnapshot] = None) -> Optional[List]:
         """
         Finds the shortest path between two artists using BFS.
         
@@ -138,6 +455,7 @@ class GraphService:
             starting_url (str): URL of the starting artist.
             ending_url (str): URL of the ending artist.
             progress_callback: Optional callback for progress updates.
+            snapshot (GraphSnapshot): Graph version to search; defaults to the current one.
         
         Returns:
             list: A list containing:
@@ -147,7 +465,7 @@ class GraphService:
             Returns None if no path is found.
         """
         try:
-            adjacency_list = self.read_adjacency_list()  # Load adjacency list once
+            adjacency_list = snapshot if snapshot is not None else self.snapshot()  # Pin one graph version
             url_counter = 0
             queue = [(starting_url, [starting_url])]
             visited = set()
@@ -198,8 +516,725 @@ class GraphService:
                 progress_callback(100, f"Search failed: {str(e)}")
             return None
     
+    def expanding_breadth_first_search(self, starting_url: str, ending_url: str,
+                                       expand: Callable[[List[str]], Dict[str, List[str]]],
+                                       progress_callback: Optional[Callable[[int, str], None]] = None,
+                                       batch_size: Optional[int] = None,
+                                       snapshot: Optional[GraphSnapshot] = None) -> Optional[List]:
+        """
+        Finds the shortest path between two artists, crawling uncrawled artists on the way.
+        
+        A level-synchronous BFS: each level is scanned in batches, and the
+        artists of a batch that were never crawled are first handed to
+        `expand` together, so they can be fetched concurrently. `expand`
+        enforces the search's request and time budget; once it returns
+        nothing the search carries on over the already crawled graph only.
+        
+        Args:
+            starting_url (str): URL of the starting artist.
+            ending_url (str): URL of the ending artist.
+            expand: Callback crawling a batch of artist URLs and returning
+                URL -> related URLs for those it could fetch (and persisted).
+            progress_callback: Optional callback for progress updates.
+            batch_size (int): Artists scanned (and crawled) per batch.
+            snapshot (GraphSnapshot): Graph version to start from; defaults to
+                the current one. Artists crawled by this search are layered on
+                top of it for the rest of the search.
+        
+        Returns:
+            list: [degrees, artists searched] + shortest path as a list of URLs,
+            or None if no path is found.
+        """
+        try:
+            adjacency_list = snapshot if snapshot is not None else self.snapshot()
+            crawled = {}  # Artists crawled during this search
+            batch_size = batch_size or Config.LAZY_EXPANSION_BATCH
+            parents = {starting_url: None}
+            attempted = set()
+            level = [starting_url]
+            url_counter = 0
+            
+            def build_path(url: str) -> List[str]:
+                path = []
+                while url is not None:
+                    path.append(url)
+                    url = parents[url]
+                return path[::-1]
+            
+            if progress_callback:
+                progress_callback(10, "Starting BFS search with on-demand crawling...")
+            
+            if starting_url == ending_url:
+                return [0, 1, starting_url]
+            
+            while level:
+                next_level = []
+                for start in range(0, len(level), batch_size):
+                    batch = level[start:start + batch_size]
+                    
+                    # Crawl the batch's uncrawled artists together before scanning it
+                    uncrawled = [url for url in batch if url not in adjacency_list and url not in attempted]
+                    if uncrawled:
+                        attempted.update(uncrawled)
+                        if progress_callback:
+                            progress_callback(
+                                min(90, 10 + (url_counter * 80 // 1000)),
+                                f"Fetching {len(uncrawled)} uncrawled artists (searched {url_counter})..."
+                            )
+                        crawled.update(expand(uncrawled))
+                    
+                    for current_url in batch:
+                        url_counter += 1
+                        neighbors = crawled.get(current_url)
+                        if neighbors is None:
+                            neighbors = adjacency_list.get(current_url, ())
+                        for neighbor in neighbors:
+                            if neighbor in parents:
+                                continue
+                            parents[neighbor] = current_url
+                            if neighbor == ending_url:
+                                if progress_callback:
+                                    progress_callback(100, "Connection found!")
+                                path = build_path(neighbor)
+                                return [len(path) - 1, url_counter] + path
+                            next_level.append(neighbor)
+                    
+                    if progress_callback:
+                        progress_callback(
+                            min(90, 10 + (url_counter * 80 // 1000)),
+                            f"Searched {url_counter} artists..."
+                        )
+                
+                level = next_level
+            
+            if progress_callback:
+                progress_callback(100, "No connection found")
+            return None
+            
+        except Exception as e:
+            logger.error(f"Error in expanding BFS search: {e}")
+            if progress_callback:
+                progress_callback(100, f"Search failed: {str(e)}")
+            return None
+    
+    def all_shortest_paths(self, starting_url: str, ending_url: str,
+                           snapshot: Optional[GraphSnapshot] = None) -> Iterator[List[str]]:
+        """
+        Lazily yields every shortest path between two artists.
+        
+        A level-by-level BFS records all shortest-path predecessors of each
+        artist (a DAG) and stops at the target's level; the paths are then
+        walked back from the target one at a time, so only the DAG and the
+        current path are ever held in memory, however many paths there are.
+        
+        Args:
+            starting_url (str): URL of the starting artist.
+            ending_url (str): URL of the ending artist.
+            snapshot (GraphSnapshot): Graph version to search; defaults to the current one.
+        
+        Yields:
+            list: Shortest paths as lists of URLs.
+        """
+        adjacency_list = snapshot if snapshot is not None else self.snapshot()  # Pin one graph version
+        if starting_url == ending_url:
+            yield [starting_url]
+            return
+        
+        predecessors: Dict[str, List[str]] = {starting_url: []}
+        frontier = [starting_url]
+        while frontier and ending_url not in predecessors:
+            level: Dict[str, List[str]] = {}
+            for current_url in frontier:
+                for neighbor in adjacency_list.get(current_url, ()):
+                    if neighbor in predecessors:
+                        continue
+                    parents = level.setdefault(neighbor, [])
+                    if not parents or parents[-1] != current_url:
+                        parents.append(current_url)
+            predecessors.update(level)
+            frontier = list(level)
+        
+        if ending_url not in predecessors:
+            return
+        
+        # Depth-first walk of the DAG from the target with one mutable path
+        path = [ending_url]
+        stack = [iter(predecessors[ending_url])]
+        while stack:
+            parent = next(stack[-1], None)
+            if parent is None:
+                stack.pop()
+                path.pop()
+                continue
+            path.append(parent)
+            if parent == starting_url:
+                yield path[::-1]
+                path.pop()
+            else:
+                stack.append(iter(predecessors[parent]))
+    
+    def k_shortest_paths(self, starting_url: str, ending_url: str,
+                         snapshot: Optional[GraphSnapshot] = None) -> Iterator[List[str]]:
+        """
+        Lazily yields the shortest simple paths between two artists in order of length (Yen's algorithm).
+        
+        Each new path is the shortest deviation from a path already yielded,
+        so taking k paths costs k rounds of spur searches and the consumer
+        decides how many rounds run.
+        
+        Args:
+            starting_url (str): URL of the starting artist.
+            ending_url (str): URL of the ending artist.
+            snapshot (GraphSnapshot): Graph version to search; defaults to the current one.
+        
+        Yields:
+            list: Simple paths as lists of URLs, shortest first.
+        """
+        adjacency_list = snapshot if snapshot is not None else self.snapshot()  # Pin one graph version
+        path = self._restricted_shortest_path(adjacency_list, starting_url, ending_url, set(), set())
+        if path is None:
+            return
+        
+        accepted = [path]
+        seen = {tuple(path)}
+        candidates: List[Tuple[int, int, List[str]]] = []  # (length, insertion order, path)
+        order = itertools.count()
+        yield path
+        
+        while True:
+            previous = accepted[-1]
+            for i in range(len(previous) - 1):
+                root = previous[:i + 1]
+                # Edges already used after this root, and the root itself, may not be reused
+                removed_edges = {(accepted_path[i], accepted_path[i + 1]) for accepted_path in accepted
+                                 if len(accepted_path) > i + 1 and accepted_path[:i + 1] == root}
+                spur_path = self._restricted_shortest_path(adjacency_list, previous[i], ending_url,
+                                                           set(root[:-1]), removed_edges)
+                if spur_path is not None:
+                    candidate = root[:-1] + spur_path
+                    if tuple(candidate) not in seen:
+                        seen.add(tuple(candidate))
+                        heapq.heappush(candidates, (len(candidate), next(order), candidate))
+            
+            if not candidates:
+                return
+            path = heapq.heappop(candidates)[2]
+            accepted.append(path)
+            yield path
+    
+    @staticmethod
+    def _restricted_shortest_path(adjacency_list: GraphSnapshot, starting_url: str, ending_url: str,
+                                  removed_urls: Set[str], removed_edges: Set[Tuple[str, str]]) -> Optional[List[str]]:
+        """BFS shortest path avoiding some artists and connections, or None."""
+        parents: Dict[str, Optional[str]] = {starting_url: None}
+        frontier = [starting_url]
+        while frontier:
+            next_frontier = []
+            for current_url in frontier:
+                if current_url == ending_url:
+                    path = []
+                    while current_url is not None:
+                        path.append(current_url)
+                        current_url = parents[current_url]
+                    return path[::-1]
+                for neighbor in adjacency_list.get(current_url, ()):
+                    if (neighbor not in parents and neighbor not in removed_urls
+                            and (current_url, neighbor) not in removed_edges):
+                        parents[neighbor] = current_url
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return None
+    
+    def a_star_search(self, starting_url: str, ending_url: str,
+                      progress_callback: Optional[Callable[[int, str], None]] = None,
+                      compact: Optional[CompactGraph] = None) -> Optional[List]:
+        """
+        Finds the shortest path between two artists using A* with landmark bounds.
+        
+        The landmark lower bounds are admissible and consistent, so the
+        first time the target is popped its path is a shortest path, while
+        expansion is steered towards the target; long-distance queries
+        visit a small fraction of the artists BFS visits. Nodes the
+        landmarks prove cannot reach the target are never queued.
+        
+        Args:
+            starting_url (str): URL of the starting artist.
+            ending_url (str): URL of the ending artist.
+            progress_callback: Optional callback for progress updates.
+            compact (CompactGraph): Indexed graph version to search; defaults
+                to the latest built one.
+        
+        Returns:
+            list: [degrees, artists searched] + shortest path as a list of URLs,
+            or None if no path is found (or either artist is not in the graph).
+        """
+        try:
+            compact = compact if compact is not None else self.compact_graph()
+            source = compact.node_id(starting_url)
+            target = compact.node_id(ending_url)
+            if source is None or target is None:
+                logger.info("A* search artists are not in the indexed graph")
+                return None
+            
+            if progress_callback:
+                progress_callback(10, "Starting A* search...")
+            
+            lower_bound = compact.landmarks.heuristic(target)
+            estimate = lower_bound(source)
+            if estimate is None:
+                if progress_callback:
+                    progress_callback(100, "No connection found")
+                return None
+            
+            offsets, targets = compact.offsets, compact.targets
+            best = {source: 0}
+            parents = {source: None}
+            heap = [(estimate, 0, source)]  # (f, -g, node): ties go to the deepest node
+            url_counter = 0
+            
+            while heap:
+                _, negative_depth, node = heapq.heappop(heap)
+                depth = -negative_depth
+                if depth > best[node]:
+                    continue  # Stale entry
+                url_counter += 1
+                
+                if progress_callback and url_counter % 100 == 0:
+                    progress_callback(
+                        min(90, 10 + (url_counter * 80 // 1000)),
+                        f"Searched {url_counter} artists..."
+                    )
+                
+                if node == target:
+                    path = []
+                    while node is not None:
+                        path.append(node)
+                        node = parents[node]
+                    path.reverse()
+                    if progress_callback:
+                        progress_callback(100, "Connection found!")
+                    return [len(path) - 1, url_counter] + compact.path_urls(path)
+                
+                next_depth = depth + 1
+                for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                    if next_depth >= best.get(neighbor, next_depth + 1):
+                        continue
+                    best[neighbor] = next_depth
+                    estimate = lower_bound(neighbor)
+                    if estimate is None:
+                        continue  # Provably cannot reach the target
+                    parents[neighbor] = node
+                    heapq.heappush(heap, (next_depth + estimate, -next_depth, neighbor))
+            
+            if progress_callback:
+                progress_callback(100, "No connection found")
+            return None
+            
+        except Exception as e:
+            logger.error(f"Error in A* search: {e}")
+            if progress_callback:
+                progress_callback(100, f"Search failed: {str(e)}")
+            return None
+    
+    def filtered_breadth_first_search(self, starting_url: str, ending_url: str, allowed: bytearray,
+                                      progress_callback: Optional[Callable[[int, str], None]] = None,
+                                      compact: Optional[CompactGraph] = None) -> Optional[List]:
+        """
+        Finds the shortest path between two artists through allowed artists only.
+        
+        The filter is a precomputed byte per node ID, so checking an artist
+        is one array read and the search is as fast as an unfiltered BFS on
+        the compact graph. The two end artists are always allowed.
+        
+        Args:
+            starting_url (str): URL of the starting artist.
+            ending_url (str): URL of the ending artist.
+            allowed (bytearray): 1 for every node ID the path may pass through.
+            progress_callback: Optional callback for progress updates.
+            compact (CompactGraph): Graph version the mask was built for;
+                defaults to the latest built one.
+        
+        Returns:
+            list: [degrees, artists searched] + shortest allowed path as a list of URLs,
+            or None if no path is found (or either artist is not in the graph).
+        """
+        try:
+            compact = compact if compact is not None else self.compact_graph()
+            source = compact.node_id(starting_url)
+            target = compact.node_id(ending_url)
+            if source is None or target is None:
+                logger.info("Filtered search artists are not in the indexed graph")
+                return None
+            
+            if progress_callback:
+                progress_callback(10, "Starting filtered BFS search...")
+            
+            offsets, targets = compact.offsets, compact.targets
+            parents = {source: None}
+            frontier = [source]
+            url_counter = 0
+            while frontier and target not in parents:
+                next_frontier = []
+                for node in frontier:
+                    url_counter += 1
+                    if progress_callback and url_counter % 100 == 0:
+                        progress_callback(
+                            min(90, 10 + (url_counter * 80 // 1000)),
+                            f"Searched {url_counter} artists..."
+                        )
+                    for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                        if neighbor not in parents and (allowed[neighbor] or neighbor == target):
+                            parents[neighbor] = node
+                            next_frontier.append(neighbor)
+                frontier = next_frontier
+            
+            if target not in parents:
+                if progress_callback:
+                    progress_callback(100, "No connection found")
+                return None
+            
+            path = []
+            node = target
+            while node is not None:
+                path.append(node)
+                node = parents[node]
+            path.reverse()
+            if progress_callback:
+                progress_callback(100, "Connection found!")
+            return [len(path) - 1, url_counter] + compact.path_urls(path)
+            
+        except Exception as e:
+            logger.error(f"Error in filtered BFS search: {e}")
+            if progress_callback:
+                progress_callback(100, f"Search failed: {str(e)}")
+            return None
+    
+    def filtered_snapshot_search(self, starting_url: str, ending_url: str, allowed: Callable[[str], bool],
+                                 progress_callback: Optional[Callable[[int, str], None]] = None,
+                                 snapshot: Optional[GraphSnapshot] = None) -> Optional[List]:
+        """
+        Finds the shortest path between two artists through allowed artists only, without the compact graph.
+        
+        Used while the compact graph is not built yet or lags the artists
+        searched; the filter is checked per artist as the search reaches it
+        instead of from a precomputed mask. The two end artists are always allowed.
+        
+        Args:
+            starting_url (str): URL of the starting artist.
+            ending_url (str): URL of the ending artist.
+            allowed: Takes an artist URL, True if the path may pass through it.
+            progress_callback: Optional callback for progress updates.
+            snapshot (GraphSnapshot): Graph version to search; defaults to the current one.
+        
+        Returns:
+            list: [degrees, artists searched] + shortest allowed path as a list of URLs,
+            or None if no path is found.
+        """
+        try:
+            adjacency_list = snapshot if snapshot is not None else self.snapshot()
+            if progress_callback:
+                progress_callback(10, "Starting filtered BFS search...")
+            
+            parents = {starting_url: None}
+            frontier = [starting_url]
+            url_counter = 0
+            while frontier and ending_url not in parents:
+                next_frontier = []
+                for current_url in frontier:
+                    url_counter += 1
+                    if progress_callback and url_counter % 100 == 0:
+                        progress_callback(
+                            min(90, 10 + (url_counter * 80 // 1000)),
+                            f"Searched {url_counter} artists..."
+                        )
+                    for neighbor in adjacency_list.get(current_url, []):
+                        if neighbor not in parents and (neighbor == ending_url or allowed(neighbor)):
+                            parents[neighbor] = current_url
+                            next_frontier.append(neighbor)
+                frontier = next_frontier
+            
+            if ending_url not in parents:
+                if progress_callback:
+                    progress_callback(100, "No connection found")
+                return None
+            
+            path = []
+            url = ending_url
+            while url is not None:
+                path.append(url)
+                url = parents[url]
+            path.reverse()
+            if progress_callback:
+                progress_callback(100, "Connection found!")
+            return [len(path) - 1, url_counter] + path
+            
+        except Exception as e:
+            logger.error(f"Error in filtered BFS search: {e}")
+            if progress_callback:
+                progress_callback(100, f"Search failed: {str(e)}")
+            return None
+    
+    def strongest_path_search(self, starting_url: str, ending_url: str,
+                              progress_callback: Optional[Callable[[int, str], None]] = None,
+                              compact: Optional[CompactGraph] = None) -> Optional[List]:
+        """
+        Finds the path between two artists that prefers strong collaborations (Dijkstra).
+        
+        Each connection costs 1 / its strength (shared tracks), so a path
+        through frequent collaborators beats a shorter one through one-off
+        features. Runs on the compact graph's parallel weight array with a
+        binary heap and lazy deletion: improved nodes are pushed again and
+        outdated heap entries are skipped when popped.
+        
+        Args:
+            starting_url (str): URL of the starting artist.
+            ending_url (str): URL of the ending artist.
+            progress_callback: Optional callback for progress updates.
+            compact (CompactGraph): Graph version to search; defaults to the
+                latest built one.
+        
+        Returns:
+            list: [degrees, artists searched] + lowest-cost path as a list of URLs,
+            or None if no path is found (or either artist is not in the graph).
+        """
+        try:
+            compact = compact if compact is not None else self.compact_graph()
+            source = compact.node_id(starting_url)
+            target = compact.node_id(ending_url)
+            if source is None or target is None:
+                logger.info("Weighted search artists are not in the indexed graph")
+                return None
+            
+            if progress_callback:
+                progress_callback(10, "Starting weighted search...")
+            
+            offsets, targets, weights = compact.offsets, compact.targets, compact.weights
+            costs = array("d", [math.inf]) * compact.node_count
+            costs[source] = 0.0
+            parents = {source: None}
+            heap = [(0.0, source)]
+            url_counter = 0
+            
+            while heap:
+                cost, node = heapq.heappop(heap)
+                if cost > costs[node]:
+                    continue  # Stale entry
+                url_counter += 1
+                
+                if progress_callback and url_counter % 100 == 0:
+                    progress_callback(
+                        min(90, 10 + (url_counter * 80 // 1000)),
+                        f"Searched {url_counter} artists..."
+                    )
+                
+                if node == target:
+                    path = []
+                    while node is not None:
+                        path.append(node)
+                        node = parents[node]
+                    path.reverse()
+                    if progress_callback:
+                        progress_callback(100, "Connection found!")
+                    return [len(path) - 1, url_counter] + compact.path_urls(path)
+                
+                for edge in range(offsets[node], offsets[node + 1]):
+                    neighbor = targets[edge]
+                    next_cost = cost + 1.0 / weights[edge]
+                    if next_cost < costs[neighbor]:
+                        costs[neighbor] = next_cost
+                        parents[neighbor] = node
+                        heapq.heappush(heap, (next_cost, neighbor))
+            
+            if progress_callback:
+                progress_callback(100, "No connection found")
+            return None
+            
+        except Exception as e:
+            logger.error(f"Error in weighted search: {e}")
+            if progress_callback:
+                progress_callback(100, f"Search failed: {str(e)}")
+            return None
+    
+    def labeled_search(self, starting_url: str, ending_url: str,
+                       progress_callback: Optional[Callable[[int, str], None]] = None,
+                       compact: Optional[CompactGraph] = None) -> Optional[List]:
+        """
+        Finds the shortest path between two artists with the distance labels.
+        
+        The degrees come from a single label query and the path from a walk
+        that only follows neighbors one hop closer to the target.
+        
+        Args:
+            starting_url (str): URL of the starting artist.
+            ending_url (str): URL of the ending artist.
+            progress_callback: Optional callback for progress updates.
+            compact (CompactGraph): Labeled graph version to search; defaults
+                to the latest built one.
+        
+        Returns:
+            list: [degrees, distance queries made] + shortest path as a list of URLs,
+            or None if no path is found (or the artists or labels are not available).
+        """
+        try:
+            compact = compact if compact is not None else self.compact_graph()
+            source = compact.node_id(starting_url)
+            target = compact.node_id(ending_url)
+            if compact.labels is None or source is None or target is None:
+                return None
+            
+            found = compact.labels.shortest_path(source, target)
+            if found is None:
+                if progress_callback:
+                    progress_callback(100, "No connection found")
+                return None
+            
+            path, queries = found
+            if progress_callback:
+                progress_callback(100, "Connection found!")
+            return [len(path) - 1, queries] + compact.path_urls(path)
+            
+        except Exception as e:
+            logger.error(f"Error in labeled search: {e}")
+            if progress_callback:
+                progress_callback(100, f"Search failed: {str(e)}")
+            return None
+    
+    def separation_bounds(self, starting_url: str, ending_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get instant landmark bounds on the degrees of separation of two artists.
+        
+        Args:
+            starting_url (str): URL of the starting artist.
+            ending_url (str): URL of the ending artist.
+        
+        Returns:
+            dict: lower_bound, upper_bound, connected and graph_version, or
+            None if either artist is not in the indexed graph or no compact
+            graph has been built yet (its build is started in the background).
+        """
+        compact = self.compact_graph(wait=False)
+        if compact is None:
+            return None
+        source = compact.node_id(starting_url)
+        target = compact.node_id(ending_url)
+        if source is None or target is None:
+            return None
+        bounds = compact.landmarks.bounds(source, target)
+        bounds["graph_version"] = compact.version
+        return bounds
+    
+    def walk_counts(self, starting_url: str, max_length: int, ending_url: Optional[str] = None,
+                    top: int = 10, compact: Optional[CompactGraph] = None) -> Optional[Dict[str, Any]]:
+        """
+        Count the walks of length 1..max_length from an artist.
+        
+        The number of distinct walks between two artists scores how strongly
+        they are connected without enumerating any path: many short routes
+        mean a close scene, a single long one a loose link.
+        
+        Args:
+            starting_url (str): URL of the starting artist.
+            max_length (int): Longest walk to count.
+            ending_url (str): URL of one artist to count walks to; if omitted,
+                the artists with the most walks are listed instead.
+            top (int): Artists to list when no ending artist is given.
+            compact (CompactGraph): Graph to count on; defaults to the latest
+                built one, which is never built here.
+        
+        Returns:
+            dict: walks (per length) and total to the ending artist, or `top`
+            (url, walks, total per artist); plus reached and total walks per
+            length and graph_version. None if an artist is not in the graph
+            or no compact graph has been built yet.
+        """
+        compact = compact or self.compact_graph(wait=False)
+        if compact is None:
+            return None
+        source = compact.node_id(starting_url)
+        target = compact.node_id(ending_url) if ending_url else None
+        if source is None or (ending_url and target is None):
+            return None
+        
+        counts = compact.walk_counts(source, max_length)
+        result = {
+            "max_length": max_length,
+            "reached": [len(product) for product in counts],
+            "total_walks": [sum(product.values()) for product in counts],
+            "graph_version": compact.version
+        }
+        if target is not None:
+            walks = [product.get(target, 0) for product in counts]
+            result["walks"] = walks
+            result["total"] = sum(walks)
+            return result
+        
+        totals: Dict[int, int] = {}
+        for product in counts:
+            for node, walks in product.items():
+                totals[node] = totals.get(node, 0) + walks
+        totals.pop(source, None)
+        result["top"] = [
+            {"url": compact.urls[node], "walks": [product.get(node, 0) for product in counts], "total": total}
+            for node, total in heapq.nlargest(top, totals.items(), key=lambda item: item[1])
+        ]
+        return result
+    
+    def path_communities(self, path_urls: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Label the hops of a path with their community (scene).
+        
+        Args:
+            path_urls (list): Artist URLs along the path.
+        
+        Returns:
+            dict: path_communities and scene_crossings (see Communities.label_path),
+            or None while the compact graph or its communities are being built.
+        """
+        compact = self.compact_graph(wait=False)
+        if compact is None or compact.communities is None:
+            return None
+        return compact.communities.label_path(path_urls)
+    
+    def bridge_artists(self, limit: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the artists with the highest betweenness from the last betweenness job.
+        
+        The ranking is read from BETWEENNESS_FILE (again only when the file
+        changes), so serving it costs nothing; the job itself runs offline.
+        
+        Args:
+            limit (int): Number of artists.
+        
+        Returns:
+            dict: artists ({"url", "score", "normalized"}, highest first), samples,
+            computed_at, and current (False if the graph has changed since), or
+            None if no ranking has been computed or no compact graph has been
+            built yet to compare it with.
+        """
+        compact = self.compact_graph(wait=False)
+        if compact is None:
+            return None
+        try:
+            mtime = os.path.getmtime(Config.BETWEENNESS_FILE)
+        except OSError:
+            return None
+        if self._betweenness is None or self._betweenness[0] != mtime:
+            saved = load_ranking(Config.BETWEENNESS_FILE)
+            if saved is None:
+                return None
+            self._betweenness = (mtime, saved)
+        saved = self._betweenness[1]
+        
+        return {
+            "artists": [dict(artist) for artist in saved["ranking"][:limit]],
+            "samples": saved["samples"],
+            "computed_at": saved["computed_at"],
+            "current": saved["fingerprint"] == compact.fingerprint()
+        }
+    
     def depth_first_search(self, starting_url: str, ending_url: str,
-                          progress_callback: Optional[Callable[[int, str], None]] = None) -> Optional[List]:
+                          progress_callback: Optional[Callable[[int, str], None]] = None,
+                          snapshot: Optional[GraphSnapshot] = None) -> Optional[List]:
         """
         Uses DFS to find any path between two artists.
         
@@ -210,13 +1245,14 @@ class GraphService:
             starting_url (str): Spotify URL of the starting artist.
             ending_url (str): Spotify URL of the ending artist.
             progress_callback: Optional callback for progress updates.
+            snapshot (GraphSnapshot): Graph version to search; defaults to the current one.
         
         Returns:
             list: Path of artist URLs from start to end, or None if no connection.
         """
         try:
             url_counter = 0
-            adjacency_list = self.read_adjacency_list()
+            adjacency_list = snapshot if snapshot is not None else self.snapshot()
             
             # Initialize stack for iterative DFS
             stack = [(starting_url, [starting_url])]  # Each element is (current_url, path)
@@ -265,22 +1301,197 @@ class GraphService:
                 progress_callback(100, f"Search failed: {str(e)}")
             return None
     
-    def get_graph_stats(self) -> Dict[str, int]:
+    def iterative_deepening_search(self, starting_url: str, ending_url: str,
+                                   progress_callback: Optional[Callable[[int, str], None]] = None,
+                                   max_depth: Optional[int] = None,
+                                   snapshot: Optional[GraphSnapshot] = None) -> Optional[List]:
+        """
+        Finds the shortest path between two artists using iterative deepening DFS.
+        
+        Depth-limited DFS is repeated with limits 1, 2, ... so the first path
+        found is a shortest one, like BFS, while memory stays proportional
+        to the depth: a single path that is pushed and popped, the set of
+        artists on it and one neighbor iterator per level, with no visited
+        set and no per-entry path copies. The price is re-expanding the
+        shallow levels on every iteration.
+        
+        Args:
+            starting_url (str): URL of the starting artist.
+            ending_url (str): URL of the ending artist.
+            progress_callback: Optional callback for progress updates.
+            max_depth (int): Deepest limit to try; defaults to IDDFS_MAX_DEPTH.
+            snapshot (GraphSnapshot): Graph version to search; defaults to the current one.
+        
+        Returns:
+            list: [degrees, artists searched] + shortest path as a list of URLs,
+            or None if no path within max_depth (or MAX_SEARCH_TIME) is found.
+        """
+        try:
+            adjacency_list = snapshot if snapshot is not None else self.snapshot()  # Pin one graph version
+            max_depth = max_depth or Config.IDDFS_MAX_DEPTH
+            deadline = time.monotonic() + Config.MAX_SEARCH_TIME
+            url_counter = 0
+            
+            if progress_callback:
+                progress_callback(10, "Starting iterative deepening search...")
+            
+            if starting_url == ending_url:
+                return [0, 0, starting_url]
+            
+            for limit in range(1, max_depth + 1):
+                if progress_callback:
+                    progress_callback(10 + 80 * (limit - 1) // max_depth, f"Searching paths of {limit} degrees...")
+                
+                path = [starting_url]
+                on_path = {starting_url}
+                neighbor_iterators = [iter(adjacency_list.get(starting_url, ()))]
+                cut_off = False
+                
+                while neighbor_iterators:
+                    neighbor = next(neighbor_iterators[-1], None)
+                    if neighbor is None:
+                        neighbor_iterators.pop()
+                        on_path.discard(path.pop())
+                        continue
+                    if neighbor in on_path:
+                        continue
+                    
+                    url_counter += 1
+                    if neighbor == ending_url:
+                        path.append(neighbor)
+                        if progress_callback:
+                            progress_callback(100, "Connection found!")
+                        return [len(path) - 1, url_counter] + path
+                    
+                    if url_counter % 10000 == 0 and time.monotonic() > deadline:
+                        logger.info(f"Iterative deepening search stopped at depth {limit} after {url_counter} artists")
+                        if progress_callback:
+                            progress_callback(100, "Search time limit reached")
+                        return None
+                    
+                    related_urls = adjacency_list.get(neighbor)
+                    if not related_urls:
+                        continue
+                    if len(path) < limit:
+                        path.append(neighbor)
+                        on_path.add(neighbor)
+                        neighbor_iterators.append(iter(related_urls))
+                    else:
+                        cut_off = True
+                
+                # Nothing was cut off by the limit, so a deeper search cannot find more
+                if not cut_off:
+                    break
+            
+            if progress_callback:
+                progress_callback(100, "No connection found")
+            return None
+            
+        except Exception as e:
+            logger.error(f"Error in iterative deepening search: {e}")
+            if progress_callback:
+                progress_callback(100, f"Search failed: {str(e)}")
+            return None
+    
+    def neighborhood(self, artist_url: str, hops: int, limit: int,
+                     snapshot: Optional[GraphSnapshot] = None) -> Iterator[Tuple[str, int]]:
+        """
+        Lazily list the artists within some degrees of an artist.
+        
+        A level-synchronous BFS: the whole frontier of one level is expanded
+        before the next, so artists come out in order of distance and each
+        level can be reported as soon as it is complete. The BFS stops after
+        `limit` artists, so a caller can stream the result without ever
+        holding more than the frontier and the visited set.
+        
+        Args:
+            artist_url (str): URL of the artist at the center.
+            hops (int): Largest distance to include.
+            limit (int): Maximum number of artists to yield.
+            snapshot (GraphSnapshot): Graph version to search; defaults to the current one.
+        
+        Yields:
+            tuple: (artist URL, distance) for every artist 1..hops degrees away,
+            by increasing distance; the center artist itself is not included.
+        """
+        adjacency_list = snapshot if snapshot is not None else self.snapshot()  # Pin one graph version
+        visited = {artist_url}
+        frontier = [artist_url]
+        count = 0
+        for distance in range(1, hops + 1):
+            next_frontier = []
+            for url in frontier:
+                for neighbor in adjacency_list.get(url, ()):
+                    if neighbor in visited:
+                        continue
+                    if count >= limit:
+                        return
+                    visited.add(neighbor)
+                    next_frontier.append(neighbor)
+                    count += 1
+                    yield neighbor, distance
+            if not next_frontier:
+                return
+            frontier = next_frontier
+    
+    def get_graph_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the current graph.
         
+        Counts come from the running degree statistics, so this never scans
+        the graph. Fields derived from the compact graph (landmarks, distance
+        labels, separation, communities) are None, and index_pending is True,
+        until its first background build is ready.
+        
         Returns:
-            dict: Statistics including number of artists, connections, etc.
+            dict: Statistics including number of artists, connections, the most
+            connected artists and the degree distribution.
         """
         try:
-            adjacency_list = self.read_adjacency_list()
-            total_artists = len(adjacency_list)
-            total_connections = sum(len(connections) for connections in adjacency_list.values())
+            # Counters and snapshot are updated together under the write lock
+            with self._write_lock:
+                adjacency_list = self.snapshot()
+                total_artists = len(adjacency_list)
+                total_connections = self.degree_stats.total_connections
+                top = self.degree_stats.top(Config.STATS_TOP_ARTISTS)
+                histogram = self.degree_stats.histogram()
+            
+            stats = GraphStats(
+                total_artists=total_artists,
+                total_connections=total_connections,
+                average_connections=total_connections / total_artists if total_artists > 0 else 0,
+                most_connected_artist=top[0][0] if top else None,
+                most_connections_count=top[0][1] if top else None,
+                most_connected_artists=[{"url": artist_url, "connections": degree} for artist_url, degree in top],
+                degree_distribution=histogram
+            ).to_dict()
+            
+            compact = self.compact_graph(wait=False)
+            if compact is None:
+                return {
+                    **stats,
+                    "graph_version": adjacency_list.version,
+                    "indexed_version": None,
+                    "index_pending": True,
+                    "landmarks": None,
+                    "distance_labels": None,
+                    "average_separation": None,
+                    "separation": None,
+                    "communities": None
+                }
+            separation = compact.separation.describe() if compact.separation is not None else None
+            communities = compact.communities.describe() if compact.communities is not None else None
             
             return {
-                "total_artists": total_artists,
-                "total_connections": total_connections,
-                "average_connections": total_connections / total_artists if total_artists > 0 else 0
+                **stats,
+                "graph_version": adjacency_list.version,
+                "indexed_version": compact.version,
+                "index_pending": False,
+                "landmarks": compact.landmarks.describe(),
+                "distance_labels": compact.labels.describe() if compact.labels is not None else None,
+                "average_separation": separation["average_separation"] if separation is not None else None,
+                "separation": separation,
+                "communities": communities
             }
         except Exception as e:
             logger.error(f"Error getting graph stats: {e}")
@@ -0,0 +1,118 @@
+import math
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Tuple
+
+# Smallest overlay folded into a new base; beyond it the limit grows with the square root of the base,
+# which balances copying the overlay on every update against rebuilding the base
+MIN_COMPACT_OVERLAY = 1024
+
+class GraphSnapshot(Mapping):
+    """
+    Immutable, versioned view of the artist graph.
+    
+    A snapshot is a frozen base adjacency dict plus a small overlay of the
+    adjacency lists changed since the base was built. Writers never modify
+    a snapshot: with_updates() returns the next version, sharing the base
+    and copying only the overlay, and folds the overlay into a fresh base
+    once it grows past about the square root of the base size. Readers pin one snapshot for
+    a whole search without any locking, so a search sees exactly one graph
+    version no matter how many expansions land meanwhile.
+    
+    Adjacency lists are stored as tuples so they cannot be changed in place.
+    Collaboration strengths (shared track counts) are kept in a second
+    snapshot of the same shape, `weights`, whose tuples are parallel to the
+    adjacency lists and which is versioned together with them.
+    """
+    
+    __slots__ = ("version", "_base", "_overlay", "_size", "weights")
+    
+    def __init__(self, version: int, base: Dict[str, Tuple[str, ...]],
+                 overlay: Optional[Dict[str, Tuple[str, ...]]] = None, size: Optional[int] = None,
+                 weights: Optional["GraphSnapshot"] = None):
+        """
+        Initialize a snapshot. The dicts passed in must not be modified afterwards.
+        
+        Args:
+            version (int): Graph version number.
+            base (dict): Frozen artist URL -> related artist URLs.
+            overlay (dict): Adjacency lists replacing or adding to the base.
+            size (int): Number of artists, if already known.
+            weights (GraphSnapshot): Artist URL -> shared track count per related
+                artist, parallel to the adjacency lists; None if not tracked.
+        """
+        self.version = version
+        self._base = base
+        self._overlay = overlay or {}
+        if size is None:
+            size = len(base) + sum(1 for artist_url in self._overlay if artist_url not in base)
+        self._size = size
+        self.weights = weights
+    
+    def __getitem__(self, artist_url: str) -> Tuple[str, ...]:
+        related_urls = self._overlay.get(artist_url)
+        if related_urls is None:
+            return self._base[artist_url]
+        return related_urls
+    
+    def get(self, artist_url: str, default=None):
+        related_urls = self._overlay.get(artist_url)
+        if related_urls is None:
+            return self._base.get(artist_url, default)
+        return related_urls
+    
+    def __contains__(self, artist_url) -> bool:
+        return artist_url in self._overlay or artist_url in self._base
+    
+    def __iter__(self) -> Iterator[str]:
+        # Base order first (the CSV order), then artists added since
+        yield from self._base
+        for artist_url in self._overlay:
+            if artist_url not in self._base:
+                yield artist_url
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def strengths(self, artist_url: str) -> Tuple[int, ...]:
+        """
+        Get the collaboration strengths of an artist's connections.
+        
+        Args:
+            artist_url (str): URL of the artist.
+        
+        Returns:
+            tuple: Shared track count per related artist, in adjacency list
+            order, or () if unknown.
+        """
+        if self.weights is None:
+            return ()
+        strengths = self.weights.get(artist_url, ())
+        return strengths if len(strengths) == len(self.get(artist_url, ())) else ()
+    
+    def with_updates(self, updates: Dict[str, Tuple[str, ...]],
+                     strengths: Optional[Dict[str, Tuple[int, ...]]] = None) -> "GraphSnapshot":
+        """
+        Build the next version with some adjacency lists replaced or added.
+        
+        Args:
+            updates (dict): Artist URL -> related artist URLs (as tuples).
+            strengths (dict): Artist URL -> shared track counts parallel to its
+                update; artists missing here get unknown strengths.
+        
+        Returns:
+            GraphSnapshot: The next version; this snapshot is unchanged.
+        """
+        weights = self.weights
+        if weights is not None:
+            strengths = strengths or {}
+            weights = weights.with_updates({artist_url: strengths.get(artist_url, ()) for artist_url in updates})
+        
+        size = self._size + sum(1 for artist_url in updates if artist_url not in self)
+        overlay = dict(self._overlay)
+        overlay.update(updates)
+        
+        if len(overlay) >= max(MIN_COMPACT_OVERLAY, math.isqrt(len(self._base))):
+            base = dict(self._base)
+            base.update(overlay)
+            return GraphSnapshot(self.version + 1, base, size=size, weights=weights)
+        return GraphSnapshot(self.version + 1, self._base, overlay, size, weights)
\ No newline at end of file
@@ -0,0 +1,72 @@
+import os
+import functools
+import multiprocessing
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+from config import Config
+from .compact_graph import CompactGraph
+
+# CSR arrays of the graph being analyzed, set once in every worker process
+_offsets: Optional[array] = None
+_targets: Optional[array] = None
+
+def _init_worker(offsets: array, targets: array):
+    global _offsets, _targets
+    _offsets, _targets = offsets, targets
+
+def _call_with_graph(function: Callable[[array, array, Any], Any], chunk: Any) -> Any:
+    return function(_offsets, _targets, chunk)
+
+def worker_count(processes: Optional[int] = None) -> int:
+    """
+    Get the number of analytics worker processes to use.
+    
+    Args:
+        processes (int): Requested workers; defaults to GRAPH_ANALYTICS_WORKERS.
+    
+    Returns:
+        int: Workers, one per CPU when the setting is 0.
+    """
+    processes = processes if processes is not None else Config.GRAPH_ANALYTICS_WORKERS
+    return processes if processes > 0 else (os.cpu_count() or 1)
+
+def map_over_graph(graph: CompactGraph, function: Callable[[array, array, Any], Any],
+                   chunks: Sequence[Any], processes: Optional[int] = None) -> List[Any]:
+    """
+    Run a CPU-bound traversal over chunks of work in parallel worker processes.
+    
+    Pure-Python traversals hold the GIL, so threads would not run them in
+    parallel. Each worker gets the graph's CSR arrays once, when it starts,
+    instead of with every chunk; with a single worker the chunks run in
+    this process.
+    
+    Workers are spawned, never forked: a forked child of a process whose
+    other threads hold locks can deadlock. Spawned workers import the main
+    module, so only scripts whose main module does nothing on import
+    (manage.py) should use more than one worker; the web server runs its
+    analytics in-process.
+    
+    Args:
+        graph (CompactGraph): Graph to traverse.
+        function: Module-level function(offsets, targets, chunk) -> result.
+        chunks (list): Work items, e.g. lists of source node IDs.
+        processes (int): Worker processes; defaults to worker_count().
+    
+    Returns:
+        list: The result of every chunk, in order.
+    """
+    processes = min(worker_count(processes), len(chunks))
+    if processes <= 1:
+        return [function(graph.offsets, graph.targets, chunk) for chunk in chunks]
+    
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context, initializer=_init_worker,
+                             initargs=(graph.offsets, graph.targets)) as pool:
+        return list(pool.map(functools.partial(_call_with_graph, function), chunks))
+
+def split(items: Sequence[Any], processes: int) -> List[Sequence[Any]]:
+    """Split work into a few chunks per worker, so uneven chunks still balance out."""
+    size = max(1, -(-len(items) // (processes * 4)))
+    return [items[i:i + size] for i in range(0, len(items), size)]
\ No newline at end of file
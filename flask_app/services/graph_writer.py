@@ -0,0 +1,186 @@
+import os
+import csv
+import time
+import queue
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+class GraphWriter:
+    """
+    Group-commit writer persisting the in-memory artist graph.
+    
+    Callers apply updates to the in-memory graph themselves and only
+    notify the writer. A single background thread collects the
+    notifications from a queue and rewrites the adjacency list CSV once
+    enough updates have accumulated or the oldest pending update is old
+    enough, so the cost of a write is shared by every update in its batch
+    and concurrent expansions never rewrite the file one by one. Each write
+    goes to a temporary file that is fsynced and atomically renamed over
+    the CSV, so a crash never leaves a partially written graph behind.
+    Collaboration strengths of the same snapshot are written the same way
+    to a second file, so both files always describe one graph version.
+    """
+    
+    def __init__(self, csv_file: str, snapshot: Callable[[], Dict[str, List[str]]],
+                 flush_size: Optional[int] = None, flush_interval: Optional[float] = None,
+                 weights_file: Optional[str] = None):
+        """
+        Initialize the writer and start its thread.
+        
+        Args:
+            csv_file (str): Path of the adjacency list CSV file.
+            snapshot: Callback returning a consistent copy of the graph to write.
+            flush_size (int): Pending updates that trigger a write.
+            flush_interval (float): Seconds an update may wait before it is written.
+            weights_file (str): Path of the collaboration strength CSV file, if
+                the snapshots carry strengths.
+        """
+        self.csv_file = csv_file
+        self.weights_file = weights_file
+        self.snapshot = snapshot
+        self.flush_size = flush_size or Config.GRAPH_FLUSH_SIZE
+        self.flush_interval = flush_interval if flush_interval is not None else Config.GRAPH_FLUSH_INTERVAL
+        
+        self.write_count = 0
+        self.updates_written = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="graph-writer")
+        self._thread.daemon = True
+        self._thread.start()
+    
+    def submit(self, updates: int = 1):
+        """
+        Note that the in-memory graph changed and must be persisted.
+        
+        Args:
+            updates (int): Number of artists updated.
+        """
+        self._queue.put(updates)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write all pending updates now and wait for the write to finish.
+        
+        Args:
+            timeout (float): Seconds to wait for the writer.
+        
+        Returns:
+            bool: True if the graph was persisted, False otherwise.
+        """
+        if self._closed or not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        result = []
+        self._queue.put((done, result))
+        return done.wait(timeout) and bool(result and result[0])
+    
+    def close(self, timeout: Optional[float] = None):
+        """
+        Write pending updates and stop the writer thread.
+        
+        Args:
+            timeout (float): Seconds to wait for the final write.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+    
+    def _run(self):
+        pending = 0
+        oldest = None
+        while True:
+            wait = None if oldest is None else max(0.0, oldest + self.flush_interval - time.monotonic())
+            try:
+                items = [self._queue.get(timeout=wait)]
+            except queue.Empty:
+                items = []
+            
+            # Take everything queued meanwhile so one write covers the whole group
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = None in items
+            waiters = [item for item in items if isinstance(item, tuple)]
+            pending += sum(item for item in items if isinstance(item, int))
+            if pending and oldest is None:
+                oldest = time.monotonic()
+            
+            due = oldest is not None and time.monotonic() - oldest >= self.flush_interval
+            written = True
+            if pending and (stop or waiters or due or pending >= self.flush_size):
+                written = self._write()
+                if written:
+                    self.updates_written += pending
+                    pending = 0
+                    oldest = None
+                else:
+                    # Retry after another interval rather than in a tight loop
+                    oldest = time.monotonic()
+            
+            for done, result in waiters:
+                result.append(written)
+                done.set()
+            if stop:
+                return
+    
+    def _write(self) -> bool:
+        """Write a snapshot of the graph to temporary files, fsync them and rename them over the CSVs."""
+        started = time.perf_counter()
+        adjacency_list = self.snapshot()
+        try:
+            self._replace_file(self.csv_file, ([artist_url] + list(related_urls)
+                                               for artist_url, related_urls in adjacency_list.items()))
+            if self.weights_file and getattr(adjacency_list, "weights", None) is not None:
+                self._replace_file(self.weights_file, self._strength_rows(adjacency_list))
+            self._fsync_directory()
+        except Exception as e:
+            logger.error(f"Error writing adjacency list to {self.csv_file}: {e}")
+            return False
+        
+        self.write_count += 1
+        logger.info(f"Wrote adjacency list with {len(adjacency_list)} artists "
+                    f"in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return True
+    
+    @staticmethod
+    def _strength_rows(adjacency_list) -> Iterable[List[Any]]:
+        """Rows of artist URL followed by the strengths of its connections, for artists that have them."""
+        for artist_url in adjacency_list:
+            strengths = adjacency_list.strengths(artist_url)
+            if strengths:
+                yield [artist_url] + list(strengths)
+    
+    @staticmethod
+    def _replace_file(path: str, rows: Iterable[List[Any]]):
+        """Write rows to a temporary file, fsync it and atomically rename it over the file."""
+        temp_file = f"{path}.{os.getpid()}.tmp"
+        with open(temp_file, mode="w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerows(rows)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, path)
+    
+    def _fsync_directory(self):
+        """Make the rename itself durable where the platform allows it."""
+        try:
+            fd = os.open(os.path.dirname(os.path.abspath(self.csv_file)), os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
\ No newline at end of file
@@ -0,0 +1,120 @@
+import time
+import logging
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+from .compact_graph import CompactGraph, UNREACHABLE
+
+logger = logging.getLogger(__name__)
+
+class LandmarkIndex:
+    """
+    ALT (A*, landmarks, triangle inequality) distance bounds for a CompactGraph.
+    
+    For k high-degree landmark artists L it stores d(L, v) and d(v, L) for
+    every node v as unsigned byte arrays (k * 2 bytes per node). Because
+    the graph is directed, the triangle inequality gives two lower bounds
+    on d(s, t):
+        d(L, t) - d(L, s)    and    d(s, L) - d(t, L)
+    and the upper bound d(s, L) + d(L, t). A landmark that reaches s but
+    not t (or is reached from t but not from s) proves there is no path.
+    """
+    
+    def __init__(self, graph: CompactGraph, count: int):
+        """
+        Choose landmarks and compute their distance arrays.
+        
+        Args:
+            graph (CompactGraph): Graph to index.
+            count (int): Number of landmarks.
+        """
+        started = time.time()
+        self.graph = graph
+        
+        # Highest total degree among crawled artists (only they have out-edges to search from)
+        candidates = [node for node in range(graph.node_count) if graph.offsets[node + 1] > graph.offsets[node]]
+        candidates.sort(key=lambda node: -graph.degree(node))
+        self.landmarks: List[int] = candidates[:count]
+        self.forward = [graph.distances(landmark) for landmark in self.landmarks]
+        self.backward = [graph.distances(landmark, reverse=True) for landmark in self.landmarks]
+        
+        logger.info(f"Landmark index built with {len(self.landmarks)} landmarks over "
+                    f"{graph.node_count} artists in {time.time() - started:.2f}s")
+    
+    def _target_distances(self, target: int) -> List[Tuple[array, array, int, int]]:
+        return [(forward, backward, forward[target], backward[target])
+                for forward, backward in zip(self.forward, self.backward)]
+    
+    def heuristic(self, target: int) -> Callable[[int], Optional[int]]:
+        """
+        Build the A* heuristic towards a target.
+        
+        Args:
+            target (int): Node ID of the target.
+        
+        Returns:
+            Callable: Node ID -> admissible, consistent lower bound on its
+            distance to the target, or None if it provably cannot reach it.
+        """
+        per_landmark = self._target_distances(target)
+        
+        def lower_bound(node: int) -> Optional[int]:
+            bound = 0
+            for forward, backward, landmark_to_target, target_to_landmark in per_landmark:
+                landmark_to_node = forward[node]
+                if landmark_to_node != UNREACHABLE:
+                    if landmark_to_target == UNREACHABLE:
+                        return None
+                    if landmark_to_target - landmark_to_node > bound:
+                        bound = landmark_to_target - landmark_to_node
+                if target_to_landmark != UNREACHABLE:
+                    node_to_landmark = backward[node]
+                    if node_to_landmark == UNREACHABLE:
+                        return None
+                    if node_to_landmark - target_to_landmark > bound:
+                        bound = node_to_landmark - target_to_landmark
+            return bound
+        
+        return lower_bound
+    
+    def bounds(self, source: int, target: int) -> Dict[str, Any]:
+        """
+        Get instant lower and upper bounds on the separation of two artists.
+        
+        Args:
+            source (int): Node ID of the first artist.
+            target (int): Node ID of the second artist.
+        
+        Returns:
+            dict: lower_bound, upper_bound (None if no landmark connects them)
+            and connected (False if no path exists, None if unknown).
+        """
+        if source == target:
+            return {"lower_bound": 0, "upper_bound": 0, "connected": True}
+        
+        lower = self.heuristic(target)(source)
+        if lower is None:
+            return {"lower_bound": None, "upper_bound": None, "connected": False}
+        
+        upper = None
+        for forward, backward in zip(self.forward, self.backward):
+            if backward[source] != UNREACHABLE and forward[target] != UNREACHABLE:
+                through = backward[source] + forward[target]
+                if upper is None or through < upper:
+                    upper = through
+        
+        return {
+            "lower_bound": max(1, lower),
+            "upper_bound": upper,
+            "connected": True if upper is not None else None
+        }
+    
+    def describe(self) -> List[Dict[str, Any]]:
+        """
+        Get the landmarks with their degrees.
+        
+        Returns:
+            list: {"url", "degree"} per landmark.
+        """
+        return [{"url": self.graph.urls[landmark], "degree": self.graph.degree(landmark)}
+                for landmark in self.landmarks]
\ No newline at end of file
@@ -0,0 +1,132 @@
+import csv
+import os
+import logging
+import threading
+from typing import Dict, List, Optional, Any
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+class ArtistMetadataStore:
+    """
+    Local store of artist metadata (popularity, followers, genres, image).
+    
+    Filled from the full artist objects Spotify returns for searches and
+    artist lookups. Entries are appended to a CSV file:
+        artist_id,popularity,followers,genres,image_url
+    where genres are joined with "|". Later rows override earlier ones.
+    """
+    
+    def __init__(self, metadata_file: Optional[str] = None):
+        """
+        Initialize the metadata store and load any previously recorded entries.
+        
+        Args:
+            metadata_file (str): Path of the metadata CSV file.
+        """
+        self.metadata_file = metadata_file or Config.METADATA_FILE
+        self._metadata: Dict[str, Dict[str, Any]] = {}
+        self._pending: List[List[Any]] = []
+        self._lock = threading.Lock()
+        self.version = 0
+        
+        self._load()
+        logger.info(f"Metadata store initialized with {len(self._metadata)} artists")
+    
+    def _load(self):
+        """Load previously recorded metadata from disk."""
+        if not os.path.exists(self.metadata_file):
+            return
+        try:
+            with open(self.metadata_file, mode="r", newline="", encoding="utf-8") as file:
+                for row in csv.reader(file):
+                    if len(row) >= 5:
+                        self._metadata[row[0]] = {
+                            "popularity": int(row[1] or 0),
+                            "followers": int(row[2] or 0),
+                            "genres": row[3].split("|") if row[3] else [],
+                            "image_url": row[4] or None
+                        }
+        except Exception as e:
+            logger.error(f"Error reading artist metadata from {self.metadata_file}: {e}")
+    
+    def __len__(self) -> int:
+        return len(self._metadata)
+    
+    def record_artist(self, artist: Dict[str, Any]):
+        """
+        Record metadata from a full Spotify artist object.
+        
+        Args:
+            artist (dict): Artist object from the Spotify API.
+        """
+        artist_id = artist.get("id")
+        if not artist_id:
+            return
+        entry = {
+            "popularity": artist.get("popularity", 0) or 0,
+            "followers": (artist.get("followers") or {}).get("total", 0) or 0,
+            "genres": list(artist.get("genres") or []),
+            "image_url": artist["images"][0]["url"] if artist.get("images") else None
+        }
+        with self._lock:
+            if self._metadata.get(artist_id) == entry:
+                return
+            self._metadata[artist_id] = entry
+            self._pending.append([
+                artist_id,
+                entry["popularity"],
+                entry["followers"],
+                "|".join(entry["genres"]),
+                entry["image_url"] or ""
+            ])
+            self.version += 1
+    
+    def get(self, artist_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get recorded metadata for an artist.
+        
+        Args:
+            artist_url (str): Spotify URL or ID of the artist.
+        
+        Returns:
+            dict: Popularity, followers, genres and image URL, or None if unknown.
+        """
+        return self._metadata.get(artist_url.rstrip("/").split("/")[-1])
+    
+    def get_popularity(self, artist_url: str) -> int:
+        """
+        Get the recorded popularity of an artist.
+        
+        Args:
+            artist_url (str): Spotify URL or ID of the artist.
+        
+        Returns:
+            int: Popularity (0-100), or 0 if unknown.
+        """
+        entry = self.get(artist_url)
+        return entry["popularity"] if entry else 0
+    
+    def flush(self) -> bool:
+        """
+        Append entries recorded since the last flush to disk.
+        
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        
+        if not pending:
+            return True
+        
+        try:
+            with open(self.metadata_file, mode="a", newline="", encoding="utf-8") as file:
+                csv.writer(file).writerows(pending)
+            return True
+        except Exception as e:
+            logger.error(f"Error flushing artist metadata: {e}")
+            with self._lock:
+                self._pending = pending + self._pending
+            return False
\ No newline at end of file
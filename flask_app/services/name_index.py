@@ -0,0 +1,215 @@
+import csv
+import os
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple, Any
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+ARTIST_URL_PREFIX = "https://open.spotify.com/artist/"
+
+class NameIndex:
+    """
+    Compact local index of artist names and collaboration provenance.
+    
+    Every track payload returned by Spotify already carries the simplified
+    artist objects of everyone on the track. The crawler records those
+    ID -> name pairs (and the track that links two artists) here, so any path
+    produced by the graph can be rendered without extra API calls.
+    
+    Entries are kept in memory and appended to two small CSV files:
+        - names file:  artist_id,name
+        - tracks file: artist_id,other_artist_id,track_id,track_name
+    """
+    
+    def __init__(self, names_file: Optional[str] = None, tracks_file: Optional[str] = None):
+        """
+        Initialize the name index and load any previously recorded entries.
+        
+        Args:
+            names_file (str): Path of the ID -> name CSV file.
+            tracks_file (str): Path of the collaboration provenance CSV file.
+        """
+        self.names_file = names_file or Config.NAME_INDEX_FILE
+        self.tracks_file = tracks_file or Config.TRACK_INDEX_FILE
+        
+        self._names: Dict[str, str] = {}
+        self._tracks: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._pending_names: List[Tuple[str, str]] = []
+        self._pending_tracks: List[Tuple[str, str, str, str]] = []
+        self._lock = threading.Lock()
+        self.version = 0
+        
+        self._load()
+        logger.info(f"Name index initialized with {len(self._names)} artists and {len(self._tracks)} tracks")
+    
+    @staticmethod
+    def artist_id(artist_url: str) -> str:
+        """
+        Extract the Spotify artist ID from an artist URL (IDs are returned unchanged).
+        
+        Args:
+            artist_url (str): Spotify URL or ID of the artist.
+        
+        Returns:
+            str: The artist ID.
+        """
+        return artist_url.rstrip("/").split("/")[-1]
+    
+    @staticmethod
+    def _pair_key(artist_id: str, other_id: str) -> Tuple[str, str]:
+        """Order a pair of artist IDs so (a, b) and (b, a) share one entry."""
+        return (artist_id, other_id) if artist_id <= other_id else (other_id, artist_id)
+    
+    def _load(self):
+        """Load previously recorded names and tracks from disk."""
+        if os.path.exists(self.names_file):
+            try:
+                with open(self.names_file, mode="r", newline="", encoding="utf-8") as file:
+                    for row in csv.reader(file):
+                        if len(row) >= 2:
+                            self._names[row[0]] = row[1]
+            except Exception as e:
+                logger.error(f"Error reading name index from {self.names_file}: {e}")
+        
+        if os.path.exists(self.tracks_file):
+            try:
+                with open(self.tracks_file, mode="r", newline="", encoding="utf-8") as file:
+                    for row in csv.reader(file):
+                        if len(row) >= 4:
+                            self._tracks[self._pair_key(row[0], row[1])] = (row[2], row[3])
+            except Exception as e:
+                logger.error(f"Error reading track index from {self.tracks_file}: {e}")
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def record_name(self, artist_id: str, name: str):
+        """
+        Record the name of an artist.
+        
+        Args:
+            artist_id (str): Spotify ID (or URL) of the artist.
+            name (str): Display name of the artist.
+        """
+        if not artist_id or not name:
+            return
+        artist_id = self.artist_id(artist_id)
+        with self._lock:
+            if self._names.get(artist_id) != name:
+                self._names[artist_id] = name
+                self._pending_names.append((artist_id, name))
+                self.version += 1
+    
+    def record_track(self, artist_id: str, other_id: str, track_id: str, track_name: str):
+        """
+        Record a track on which two artists appear together.
+        
+        Only the first track seen for a pair is kept.
+        
+        Args:
+            artist_id (str): Spotify ID of the first artist.
+            other_id (str): Spotify ID of the second artist.
+            track_id (str): Spotify ID of the track.
+            track_name (str): Name of the track.
+        """
+        if not artist_id or not other_id or artist_id == other_id or not track_id:
+            return
+        key = self._pair_key(artist_id, other_id)
+        with self._lock:
+            if key not in self._tracks:
+                self._tracks[key] = (track_id, track_name or "")
+                self._pending_tracks.append(key + (track_id, track_name or ""))
+    
+    def record_track_artists(self, artist_id: str, track: Dict[str, Any]):
+        """
+        Record every artist name on a track and its provenance for the crawled artist.
+        
+        Args:
+            artist_id (str): Spotify ID of the artist being crawled.
+            track (dict): Simplified track object from the Spotify API.
+        """
+        for artist in track.get("artists", []):
+            other_id = artist.get("id")
+            if not other_id:
+                continue
+            self.record_name(other_id, artist.get("name"))
+            if other_id != artist_id:
+                self.record_track(artist_id, other_id, track.get("id"), track.get("name"))
+    
+    def get_name(self, artist_url: str) -> Optional[str]:
+        """
+        Look up an artist name without calling the Spotify API.
+        
+        Args:
+            artist_url (str): Spotify URL or ID of the artist.
+        
+        Returns:
+            str: Name of the artist, or None if it has never been seen.
+        """
+        return self._names.get(self.artist_id(artist_url))
+    
+    def items(self) -> List[Tuple[str, str]]:
+        """
+        Get a snapshot of all known (artist_id, name) pairs.
+        
+        Returns:
+            list: (artist_id, name) tuples.
+        """
+        with self._lock:
+            return list(self._names.items())
+    
+    def get_track(self, artist_url: str, other_url: str) -> Optional[Dict[str, str]]:
+        """
+        Look up a track linking two artists.
+        
+        Args:
+            artist_url (str): Spotify URL or ID of the first artist.
+            other_url (str): Spotify URL or ID of the second artist.
+        
+        Returns:
+            dict: Track ID, name and URL, or None if no track was recorded.
+        """
+        entry = self._tracks.get(self._pair_key(self.artist_id(artist_url), self.artist_id(other_url)))
+        if not entry:
+            return None
+        track_id, track_name = entry
+        return {
+            "id": track_id,
+            "name": track_name,
+            "url": f"https://open.spotify.com/track/{track_id}"
+        }
+    
+    def flush(self) -> bool:
+        """
+        Append entries recorded since the last flush to disk.
+        
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        with self._lock:
+            pending_names, self._pending_names = self._pending_names, []
+            pending_tracks, self._pending_tracks = self._pending_tracks, []
+        
+        if not pending_names and not pending_tracks:
+            return True
+        
+        try:
+            if pending_names:
+                with open(self.names_file, mode="a", newline="", encoding="utf-8") as file:
+                    csv.writer(file).writerows(pending_names)
+            if pending_tracks:
+                with open(self.tracks_file, mode="a", newline="", encoding="utf-8") as file:
+                    csv.writer(file).writerows(pending_tracks)
+            
+            logger.debug(f"Flushed {len(pending_names)} names and {len(pending_tracks)} tracks to name index")
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error flushing name index: {e}")
+            with self._lock:
+                self._pending_names = pending_names + self._pending_names
+                self._pending_tracks = pending_tracks + self._pending_tracks
+            return False
\ No newline at end of file
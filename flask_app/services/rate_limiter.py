@@ -0,0 +1,60 @@
+import time
+import threading
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every Spotify API request.
+    
+    Tokens refill continuously at `rate` per second up to `capacity`. Each
+    request takes one token, blocking until one is available, so any number
+    of concurrent workers together stay within the request budget.
+    """
+    
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        Initialize the bucket full.
+        
+        Args:
+            rate (float): Tokens added per second.
+            capacity (int): Maximum burst size.
+        """
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """
+        Drain the bucket so no request is sent for the given time.
+        
+        Used when Spotify answers 429 with a Retry-After header. Without a
+        configured rate there is no bucket to drain, so the caller sleeps.
+        
+        Args:
+            seconds (float): Time to hold back all requests.
+        """
+        if self.rate <= 0:
+            time.sleep(seconds)
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
\ No newline at end of file
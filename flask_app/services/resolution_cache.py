@@ -0,0 +1,122 @@
+import re
+import time
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Optional, Tuple, Dict, Any
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Sentinel stored for names Spotify could not resolve
+_MISS = object()
+
+def normalize_artist_name(name: str) -> str:
+    """
+    Normalize an artist name for cache and index lookups.
+    
+    Case-folds, strips accents and collapses whitespace so "Beyoncé",
+    "beyonce" and "  BEYONCE " share a single key.
+    
+    Args:
+        name (str): Raw artist name.
+    
+    Returns:
+        str: Normalized name.
+    """
+    if not name:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _WHITESPACE_RE.sub(" ", stripped.casefold()).strip()
+
+class ResolutionCache:
+    """
+    Bounded LRU cache for artist name -> Spotify URL resolutions.
+    
+    Hits expire after a TTL, and names that Spotify could not resolve are
+    cached as misses with their own (shorter) TTL so repeated typos do not
+    spend rate-limit budget either.
+    """
+    
+    def __init__(self, max_size: int, ttl: float, negative_ttl: float):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size (int): Maximum number of cached names.
+            ttl (float): Seconds a resolved URL stays valid.
+            negative_ttl (float): Seconds a miss stays valid.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, name: str) -> Tuple[bool, Optional[str]]:
+        """
+        Look up a name.
+        
+        Args:
+            name (str): Artist name (normalized internally).
+        
+        Returns:
+            tuple: (found, url). found is True for cached hits and cached
+            misses; url is None for cached misses.
+        """
+        key = normalize_artist_name(name)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, None if value is _MISS else value
+    
+    def put(self, name: str, url: Optional[str]):
+        """
+        Store a resolution. A url of None records a negative result.
+        
+        Args:
+            name (str): Artist name (normalized internally).
+            url (str): Resolved Spotify URL, or None if not found.
+        """
+        key = normalize_artist_name(name)
+        if not key:
+            return
+        ttl = self.ttl if url else self.negative_ttl
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (url if url else _MISS, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            dict: Current size, capacity, hits and misses.
+        """
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses
+        }
\ No newline at end of file
@@ -0,0 +1,160 @@
+import os
+import json
+import time
+import zlib
+import hashlib
+import logging
+import threading
+from typing import Dict, Optional, Any
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Cache policy per Spotipy method name
+IMMUTABLE = "immutable"    # Album payloads never change once published
+REVALIDATE = "revalidate"  # Artist album listings grow when new releases appear
+
+CACHE_POLICIES = {
+    "album": IMMUTABLE,
+    "albums": IMMUTABLE,
+    "album_tracks": IMMUTABLE,
+    "artist_albums": REVALIDATE
+}
+
+class ResponseCache:
+    """
+    Compressed, content-addressed on-disk cache for Spotify API responses.
+    
+    Payloads are stored once per distinct content as zlib-compressed JSON
+    under objects/<2 hex>/<sha256 of payload>. Each request key (method name
+    plus arguments) gets a small ref file under refs/<2 hex>/<sha256 of key>
+    pointing at its payload, so identical responses share one object and
+    both directories stay evenly sharded.
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the cache directory.
+        
+        Args:
+            cache_dir (str): Root directory of the cache.
+        """
+        self.cache_dir = cache_dir or Config.RESPONSE_CACHE_DIR
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        logger.info(f"Response cache initialized in {self.cache_dir}")
+    
+    @staticmethod
+    def policy(func) -> Optional[str]:
+        """
+        Get the cache policy for a Spotipy method.
+        
+        Args:
+            func: The Spotipy function being called.
+        
+        Returns:
+            str: IMMUTABLE, REVALIDATE or None if responses must not be cached.
+        """
+        return CACHE_POLICIES.get(getattr(func, "__name__", ""))
+    
+    @staticmethod
+    def request_key(func, args: tuple, kwargs: Dict[str, Any]) -> str:
+        """
+        Build a stable key for a request.
+        
+        Args:
+            func: The Spotipy function being called.
+            args (tuple): Positional arguments.
+            kwargs (dict): Keyword arguments.
+        
+        Returns:
+            str: Key string.
+        """
+        return json.dumps([getattr(func, "__name__", str(func)), list(args), kwargs], sort_keys=True, default=str)
+    
+    def _path(self, kind: str, digest: str, suffix: str = "") -> str:
+        return os.path.join(self.cache_dir, kind, digest[:2], digest + suffix)
+    
+    def _write_atomic(self, path: str, data: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, mode="wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key (str): Request key from request_key().
+        
+        Returns:
+            dict: {"payload", "stored_at", "total"} or None on a miss.
+        """
+        ref_path = self._path("refs", hashlib.sha256(key.encode("utf-8")).hexdigest(), ".json")
+        try:
+            with open(ref_path, mode="r", encoding="utf-8") as file:
+                ref = json.load(file)
+            with open(self._path("objects", ref["blob"], ".z"), mode="rb") as file:
+                payload = json.loads(zlib.decompress(file.read()))
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable response cache entry {ref_path}: {e}")
+            with self._lock:
+                self.misses += 1
+            return None
+        
+        with self._lock:
+            self.hits += 1
+        return {"payload": payload, "stored_at": ref.get("stored_at", 0), "total": ref.get("total")}
+    
+    def put(self, key: str, payload: Any):
+        """
+        Store a response.
+        
+        Args:
+            key (str): Request key from request_key().
+            payload: JSON-serializable response.
+        """
+        try:
+            data = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            blob = hashlib.sha256(data).hexdigest()
+            blob_path = self._path("objects", blob, ".z")
+            if not os.path.exists(blob_path):
+                self._write_atomic(blob_path, zlib.compress(data, Config.RESPONSE_CACHE_COMPRESSION))
+            
+            ref = {
+                "blob": blob,
+                "stored_at": time.time(),
+                "total": payload.get("total") if isinstance(payload, dict) else None
+            }
+            ref_path = self._path("refs", hashlib.sha256(key.encode("utf-8")).hexdigest(), ".json")
+            self._write_atomic(ref_path, json.dumps(ref).encode("utf-8"))
+        except Exception as e:
+            logger.warning(f"Error writing response cache entry: {e}")
+    
+    def touch(self, key: str, entry: Dict[str, Any]):
+        """
+        Mark a revalidated entry as fresh again.
+        
+        Args:
+            key (str): Request key from request_key().
+            entry (dict): Entry returned by get().
+        """
+        self.put(key, entry["payload"])
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            dict: Hits and misses since startup.
+        """
+        return {"hits": self.hits, "misses": self.misses}
\ No newline at end of file
@@ -1,8 +1,17 @@
+import time
 import logging
-from typing import Optional, Dict, Any, Callable
+import itertools
+from typing import Optional, Dict, Any, Callable, Iterator, List
 
 from .spotify_service import SpotifyService
 from .graph_service import GraphService
+from .graph_snapshot import GraphSnapshot
+from .compact_graph import CompactGraph
+from .attribute_columns import AttributeColumns, artist_filter
+from .typeahead_index import TypeaheadIndex
+from .fuzzy_matcher import FuzzyMatcher
+from .frontier_crawler import FrontierCrawler
+from config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -14,28 +23,47 @@ class SearchService:
     between artists while providing progress tracking.
     """
     
-    def __init__(self, spotify_service: SpotifyService, graph_service: GraphService):
+    def __init__(self, spotify_service: SpotifyService, graph_service: GraphService,
+                 frontier_crawler: Optional[FrontierCrawler] = None):
         """
         Initialize search service.
         
         Args:
             spotify_service: Service for Spotify API interactions.
             graph_service: Service for graph operations and algorithms.
+            frontier_crawler: Optional background crawler told about searched artists.
         """
         self.spotify_service = spotify_service
         self.graph_service = graph_service
+        self.frontier_crawler = frontier_crawler
+        self.typeahead_index = TypeaheadIndex(
+            spotify_service.name_index, spotify_service.metadata_store, graph_service
+        )
+        self.fuzzy_matcher = FuzzyMatcher(spotify_service.name_index, spotify_service.metadata_store)
+        self.fuzzy_matcher.rebuild()  # At startup, so no search waits for the first build
         logger.info("Search service initialized")
     
     def find_connection(self, artist1_name: str, artist2_name: str, algorithm: str = "bfs",
-                       progress_callback: Optional[Callable[[int, str], None]] = None) -> Optional[Dict[str, Any]]:
+                       progress_callback: Optional[Callable[[int, str], None]] = None,
+                       expand: bool = False, paths: Optional[str] = None,
+                       paths_offset: int = 0, paths_limit: Optional[int] = None,
+                       filters: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
         Find connection between two artists using the specified algorithm.
         
         Args:
             artist1_name (str): Name of the first artist.
             artist2_name (str): Name of the second artist.
-            algorithm (str): Algorithm to use ("bfs" or "dfs").
+            algorithm (str): Algorithm to use ("bfs", "dfs", "iddfs", "astar" or "dijkstra").
             progress_callback: Optional callback for progress updates.
+            expand (bool): With BFS, crawl artists beyond the current graph
+                during the search, within the lazy expansion budget.
+            paths (str): Also list alternative routes: "all_shortest" or "k_shortest".
+            paths_offset (int): Alternative paths to skip (for paging).
+            paths_limit (int): Alternative paths to return.
+            filters (dict): With BFS, only pass through artists matching
+                exclude_artists, genres, min_popularity, max_popularity and
+                include_unknown (see _filter_mask).
         
         Returns:
             dict: Search result with path information, or None if no connection found.
@@ -45,8 +73,8 @@ class SearchService:
                 progress_callback(5, "Looking up artists...")
             
             # Get artist URLs from names
-            start_url = self.spotify_service.get_artist_url(artist1_name)
-            end_url = self.spotify_service.get_artist_url(artist2_name)
+            start_url = self.resolve_artist_url(artist1_name)
+            end_url = self.resolve_artist_url(artist2_name)
             
             if not start_url:
                 error_msg = f"Could not find artist: {artist1_name}"
@@ -62,6 +90,10 @@ class SearchService:
                     progress_callback(100, error_msg)
                 return None
             
+            if self.frontier_crawler:
+                self.frontier_crawler.record_search(start_url)
+                self.frontier_crawler.record_search(end_url)
+            
             if progress_callback:
                 progress_callback(15, f"Found both artists, starting {algorithm.upper()} search...")
             
@@ -77,15 +109,81 @@ class SearchService:
                     self.graph_service.add_artist_connections(start_url, related_urls)
                     logger.info(f"Added {len(related_urls)} connections for {artist1_name}")
             
+            # Pin one graph version for the whole search so results are reproducible
+            snapshot = self.graph_service.snapshot()
+            graph_version = snapshot.version
+            
+            # Shortest-path searches of the exact version the distance labels cover are answered by them.
+            # The index is never built here: until its first background build is done, searches use BFS
+            compact = None
+            if algorithm.lower() in ["bfs", "astar"] and not expand:
+                compact = self.graph_service.compact_graph(wait=False)
+                if compact is not None and (compact.node_id(start_url) is None or compact.node_id(end_url) is None):
+                    compact = None
+            labeled = (not filters and compact is not None and compact.labels is not None
+                       and compact.version == snapshot.version)
+            
             # Perform the search using the specified algorithm
-            if algorithm.lower() == "bfs":
+            expanded_urls = []
+            if filters:
+                # Masks follow compact graph node IDs; while the index is not built yet or
+                # lags the artists, the filter is checked per artist on the snapshot instead
+                if compact is not None:
+                    graph_version = compact.version
+                    result = self.graph_service.filtered_breadth_first_search(
+                        start_url, end_url, self._filter_mask(compact, filters), progress_callback, compact=compact
+                    )
+                else:
+                    result = self.graph_service.filtered_snapshot_search(
+                        start_url, end_url, self._filter_predicate(filters), progress_callback, snapshot=snapshot
+                    )
+            elif labeled:
+                result = self.graph_service.labeled_search(
+                    start_url, end_url, progress_callback, compact=compact
+                )
+            elif algorithm.lower() == "bfs" and expand:
+                result = self.graph_service.expanding_breadth_first_search(
+                    start_url, end_url, self._budgeted_expander(expanded_urls), progress_callback,
+                    snapshot=snapshot
+                )
+            elif algorithm.lower() == "bfs":
                 result = self.graph_service.breadth_first_search(
-                    start_url, end_url, progress_callback
+                    start_url, end_url, progress_callback, snapshot=snapshot
                 )
             elif algorithm.lower() == "dfs":
                 result = self.graph_service.depth_first_search(
-                    start_url, end_url, progress_callback
+                    start_url, end_url, progress_callback, snapshot=snapshot
                 )
+            elif algorithm.lower() == "iddfs":
+                result = self.graph_service.iterative_deepening_search(
+                    start_url, end_url, progress_callback, snapshot=snapshot
+                )
+            elif algorithm.lower() == "dijkstra":
+                # Runs on the compact graph like A*, falling back to BFS while it is not
+                # built yet or for artists newer than it
+                compact = self.graph_service.compact_graph(wait=False)
+                if (compact is not None and compact.node_id(start_url) is not None
+                        and compact.node_id(end_url) is not None):
+                    graph_version = compact.version
+                    result = self.graph_service.strongest_path_search(
+                        start_url, end_url, progress_callback, compact=compact
+                    )
+                else:
+                    result = self.graph_service.breadth_first_search(
+                        start_url, end_url, progress_callback, snapshot=snapshot
+                    )
+            elif algorithm.lower() == "astar":
+                # A* runs on the indexed version, which may lag the live graph (or not
+                # be built yet); artists newer than the index are searched with BFS instead
+                if compact is not None:
+                    graph_version = compact.version
+                    result = self.graph_service.a_star_search(
+                        start_url, end_url, progress_callback, compact=compact
+                    )
+                else:
+                    result = self.graph_service.breadth_first_search(
+                        start_url, end_url, progress_callback, snapshot=snapshot
+                    )
             else:
                 error_msg = f"Unknown algorithm: {algorithm}"
                 logger.error(error_msg)
@@ -99,15 +197,23 @@ class SearchService:
                 artists_searched = result[1]
                 path_urls = result[2:]
                 
-                # Convert URLs to names (for BFS, avoid API calls for DFS due to potentially long paths)
-                if algorithm.lower() == "bfs":
-                    path_names = []
-                    for url in path_urls:
-                        name = self.spotify_service.get_artist_name(url)
-                        path_names.append(name if name else url)
-                else:
-                    # For DFS, keep URLs to avoid excessive API calls
-                    path_names = path_urls
+                # Convert URLs to names from the local name index
+                path_names = self._render_path_names(path_urls, allow_api_lookup=algorithm.lower() != "dfs")
+                path_tracks = self._render_path_tracks(path_urls)
+                path_strengths = [connection.strength for connection in self.graph_service.get_path_connections(
+                    path_urls, snapshot=self.graph_service.snapshot() if expanded_urls else snapshot
+                )]
+                
+                # Scene of every hop, once the communities of the indexed graph are known
+                scenes = self.graph_service.path_communities(path_urls) or {}
+                
+                alternative_paths = None
+                if paths:
+                    # Expansions are only in the live graph, not in the pinned version
+                    alternative_paths = self.find_alternative_paths(
+                        start_url, end_url, paths, paths_offset, paths_limit,
+                        snapshot=self.graph_service.snapshot() if expanded_urls else snapshot
+                    )
                 
                 return {
                     "found": True,
@@ -115,6 +221,15 @@ class SearchService:
                     "artists_searched": artists_searched,
                     "path_urls": path_urls,
                     "path_names": path_names,
+                    "path_tracks": path_tracks,
+                    "path_strengths": path_strengths,
+                    "path_communities": scenes.get("path_communities"),
+                    "scene_crossings": scenes.get("scene_crossings"),
+                    "alternative_paths": alternative_paths,
+                    "artists_crawled": len(expanded_urls),
+                    "graph_version": graph_version,
+                    "distance_labels_used": labeled,
+                    "filters": filters,
                     "algorithm": algorithm.upper(),
                     "start_artist": artist1_name,
                     "end_artist": artist2_name
@@ -126,6 +241,14 @@ class SearchService:
                     "artists_searched": None,
                     "path_urls": [],
                     "path_names": [],
+                    "path_tracks": [],
+                    "path_strengths": [],
+                    "path_communities": [],
+                    "scene_crossings": None,
+                    "artists_crawled": len(expanded_urls),
+                    "graph_version": graph_version,
+                    "distance_labels_used": labeled,
+                    "filters": filters,
                     "algorithm": algorithm.upper(),
                     "start_artist": artist1_name,
                     "end_artist": artist2_name,
@@ -139,14 +262,287 @@ class SearchService:
                 progress_callback(100, error_msg)
             return None
     
+    def _filter_mask(self, compact: CompactGraph, filters: Dict[str, Any]) -> bytearray:
+        """
+        Evaluate search filters into a node mask of a compact graph.
+        
+        Attribute columns are built once per compact graph and metadata
+        version, so repeated filtered searches only pay for the mask.
+        
+        Args:
+            compact (CompactGraph): Graph to search.
+            filters (dict): exclude_artists (artist names), genres (genre
+                terms), min_popularity / max_popularity (0-100) and
+                include_unknown (keep artists without metadata, default True).
+        
+        Returns:
+            bytearray: 1 for every node ID the path may pass through.
+        """
+        metadata_store = self.spotify_service.metadata_store
+        attributes = compact.attributes
+        if attributes is None or attributes.metadata_version != metadata_store.version:
+            attributes = compact.attributes = AttributeColumns(compact, metadata_store)
+        
+        excluded = []
+        for artist_url in self._excluded_urls(filters):
+            node = compact.node_id(artist_url)
+            if node is None:
+                logger.info(f"Excluded artist not in the graph: {artist_url}")
+                continue
+            excluded.append(node)
+        
+        return attributes.mask(
+            genres=filters.get("genres"),
+            min_popularity=filters.get("min_popularity"),
+            max_popularity=filters.get("max_popularity"),
+            exclude=excluded,
+            include_unknown=filters.get("include_unknown", True)
+        )
+    
+    def _filter_predicate(self, filters: Dict[str, Any]) -> Callable[[str], bool]:
+        """
+        Evaluate search filters into a per-artist check, for searches without a compact graph.
+        
+        Args:
+            filters (dict): The same filters as _filter_mask.
+        
+        Returns:
+            callable: Takes an artist URL, True if the path may pass through it.
+        """
+        return artist_filter(
+            self.spotify_service.metadata_store,
+            genres=filters.get("genres"),
+            min_popularity=filters.get("min_popularity"),
+            max_popularity=filters.get("max_popularity"),
+            exclude=self._excluded_urls(filters),
+            include_unknown=filters.get("include_unknown", True)
+        )
+    
+    def _excluded_urls(self, filters: Dict[str, Any]) -> List[str]:
+        """Resolve the exclude_artists names of search filters to artist URLs."""
+        excluded = []
+        for artist_name in filters.get("exclude_artists") or []:
+            artist_url = self.resolve_artist_url(artist_name)
+            if not artist_url:
+                logger.info(f"Excluded artist not found: {artist_name}")
+                continue
+            excluded.append(artist_url)
+        return excluded
+    
+    def find_alternative_paths(self, start_url: str, end_url: str, mode: str, offset: int = 0,
+                               limit: Optional[int] = None, snapshot: Optional[GraphSnapshot] = None) -> Dict[str, Any]:
+        """
+        Get one page of alternative routes between two artists.
+        
+        Paths are drawn lazily from the graph service's generators, so only
+        offset + limit + 1 paths are ever enumerated.
+        
+        Args:
+            start_url (str): URL of the starting artist.
+            end_url (str): URL of the ending artist.
+            mode (str): "all_shortest" for every shortest path, or "k_shortest"
+                for the shortest simple paths of any length, in length order.
+            offset (int): Paths to skip.
+            limit (int): Paths to return, PATH_PAGE_SIZE by default.
+            snapshot (GraphSnapshot): Graph version to search; defaults to the current one.
+        
+        Returns:
+            dict: mode, offset, limit, paths (degrees, path_urls, path_names)
+            and next_offset (None on the last page).
+        """
+        limit = limit or Config.PATH_PAGE_SIZE
+        snapshot = snapshot if snapshot is not None else self.graph_service.snapshot()
+        if mode == "all_shortest":
+            generator = self.graph_service.all_shortest_paths(start_url, end_url, snapshot)
+        else:
+            generator = self.graph_service.k_shortest_paths(start_url, end_url, snapshot)
+        
+        # One extra path tells whether another page exists
+        page = list(itertools.islice(generator, offset, offset + limit + 1))
+        generator.close()
+        has_more = len(page) > limit and offset + limit < Config.MAX_ENUMERATED_PATHS
+        
+        return {
+            "mode": mode,
+            "offset": offset,
+            "limit": limit,
+            "graph_version": snapshot.version,
+            "paths": [
+                {
+                    "degrees": len(path_urls) - 1,
+                    "path_urls": path_urls,
+                    "path_names": self._render_path_names(path_urls)
+                }
+                for path_urls in page[:limit]
+            ],
+            "next_offset": offset + limit if has_more else None
+        }
+    
+    def _budgeted_expander(self, expanded_urls: List[str]) -> Callable[[List[str]], Dict[str, List[str]]]:
+        """
+        Build the crawl callback of an expanding BFS, bounded by the lazy expansion budget.
+        
+        The request and time budgets are checked before each batch, so a
+        search overruns them by at most one batch. Request counts are shared
+        by every search running at the same time.
+        
+        Args:
+            expanded_urls (list): Filled with the URLs of the artists crawled.
+        
+        Returns:
+            Callable: Takes artist URLs and returns URL -> related URLs for
+            the artists crawled (and stored in the graph).
+        """
+        deadline = time.monotonic() + Config.LAZY_EXPANSION_TIME_BUDGET
+        request_limit = self.spotify_service.request_count + Config.LAZY_EXPANSION_MAX_REQUESTS
+        
+        def expand(artist_urls: List[str]) -> Dict[str, Dict[str, int]]:
+            if time.monotonic() >= deadline or self.spotify_service.request_count >= request_limit:
+                return {}
+            
+            related = self.spotify_service.find_related_artists_batch(artist_urls)
+            # Artists without features are stored too, so they are never fetched again
+            if not self.graph_service.add_many_artist_connections(related):
+                logger.warning(f"Could not store connections of {len(related)} crawled artists")
+            expanded_urls.extend(related)
+            return related
+        
+        return expand
+    
+    def resolve_artist_url(self, artist_name: str) -> Optional[str]:
+        """
+        Resolve an artist name to a Spotify URL, preferring local data.
+        
+        Checks the resolution cache, then the offline fuzzy matcher over the
+        local name index for a confident match, and only then asks Spotify.
+        Less certain local matches are used only if the Spotify search fails.
+        
+        Args:
+            artist_name (str): Name of the artist as entered by the user.
+        
+        Returns:
+            str: Spotify URL for the artist or None if not found.
+        """
+        found, cached_url = self.spotify_service.resolution_cache.get(artist_name)
+        if found and cached_url:
+            return cached_url
+        
+        try:
+            match = self.fuzzy_matcher.best_match(artist_name)
+        except Exception as e:
+            logger.error(f"Error fuzzy matching '{artist_name}': {e}")
+            match = None
+        
+        if match:
+            logger.info(f"Resolved '{artist_name}' locally to '{match['name']}' (score {match['score']})")
+            return match["url"]
+        
+        artist_url = self.spotify_service.get_artist_url(artist_name)
+        if artist_url:
+            return artist_url
+        
+        # A cached miss means Spotify answered that there is no such artist
+        found, _ = self.spotify_service.resolution_cache.get(artist_name)
+        if found:
+            return None
+        try:
+            match = self.fuzzy_matcher.fallback_match(artist_name)
+        except Exception as e:
+            logger.error(f"Error fuzzy matching '{artist_name}': {e}")
+            match = None
+        if match:
+            logger.info(f"Spotify lookup of '{artist_name}' failed, resolved locally to '{match['name']}' "
+                        f"(score {match['score']})")
+            return match["url"]
+        return None
+    
+    def _render_path_names(self, path_urls: List[str], allow_api_lookup: bool = False) -> List[str]:
+        """
+        Convert a path of artist URLs to artist names.
+        
+        Names come from the local name index filled while crawling. Artists
+        crawled before the index existed fall back to a Spotify lookup only
+        when allowed (short BFS paths); otherwise the URL is kept.
+        
+        Args:
+            path_urls (list): Artist URLs along the path.
+            allow_api_lookup (bool): Whether missing names may be fetched from Spotify.
+        
+        Returns:
+            list: Artist names (or URLs for unknown artists) along the path.
+        """
+        name_index = self.spotify_service.name_index
+        path_names = []
+        missing = 0
+        for url in path_urls:
+            name = name_index.get_name(url)
+            if not name and allow_api_lookup:
+                missing += 1
+                name = self.spotify_service.get_artist_name(url)
+            path_names.append(name if name else url)
+        
+        if missing:
+            name_index.flush()
+            logger.info(f"Fetched {missing} artist names missing from the name index")
+        return path_names
+    
+    def _render_path_tracks(self, path_urls: List[str]) -> List[Optional[Dict[str, str]]]:
+        """
+        Look up the track linking each consecutive pair of artists in a path.
+        
+        Args:
+            path_urls (list): Artist URLs along the path.
+        
+        Returns:
+            list: One track dict (or None if unknown) per hop.
+        """
+        name_index = self.spotify_service.name_index
+        return [name_index.get_track(a, b) for a, b in zip(path_urls, path_urls[1:])]
+    
+    def suggest_artists(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get artist suggestions for autocomplete.
+        
+        Serves suggestions from the local typeahead index and only asks
+        Spotify when fewer than TYPEAHEAD_MIN_RESULTS local matches exist.
+        
+        Args:
+            query (str): Search query.
+            limit (int): Maximum number of results to return.
+        
+        Returns:
+            list: List of artist dictionaries with name, url, and other info.
+        """
+        try:
+            artists = self.typeahead_index.search(query, limit=limit)
+        except Exception as e:
+            logger.error(f"Error searching typeahead index with query '{query}': {e}")
+            artists = []
+        
+        if len(artists) >= min(limit, Config.TYPEAHEAD_MIN_RESULTS):
+            return artists
+        
+        # Too few local matches, top up with Spotify results
+        seen_ids = {artist["id"] for artist in artists}
+        for artist in self.spotify_service.search_artists(query, limit=limit):
+            if len(artists) >= limit:
+                break
+            if artist["id"] not in seen_ids:
+                seen_ids.add(artist["id"])
+                artists.append(artist)
+        return artists
+    
     def expand_artist_network(self, artist_name: str, 
-                            progress_callback: Optional[Callable[[int, str], None]] = None) -> Dict[str, Any]:
+                            progress_callback: Optional[Callable[[int, str], None]] = None,
+                            refresh: bool = False) -> Dict[str, Any]:
         """
         Expand the network by fetching related artists for a given artist.
         
         Args:
             artist_name (str): Name of the artist to expand.
             progress_callback: Optional callback for progress updates.
+            refresh (bool): For artists already in the database, crawl releases
+                newer than the last crawl and merge the new connections.
         
         Returns:
             dict: Result of the expansion operation.
@@ -156,7 +552,7 @@ class SearchService:
                 progress_callback(10, f"Looking up {artist_name}...")
             
             # Get artist URL
-            artist_url = self.spotify_service.get_artist_url(artist_name)
+            artist_url = self.resolve_artist_url(artist_name)
             if not artist_url:
                 error_msg = f"Could not find artist: {artist_name}"
                 logger.error(error_msg)
@@ -167,6 +563,10 @@ class SearchService:
             
             # Check if already in database
             existing_connections = self.graph_service.get_artist_connections(artist_url)
+            if existing_connections and refresh:
+                result = self.refresh_artist_network(artist_url)
+                result["artist"] = artist_name
+                return result
             if existing_connections:
                 return {
                     "success": True,
@@ -209,6 +609,84 @@ class SearchService:
             logger.error(error_msg)
             return {"success": False, "error": error_msg}
     
+    def refresh_artist_network(self, artist_url: str) -> Dict[str, Any]:
+        """
+        Incrementally recrawl an artist and merge connections from new releases.
+        
+        Args:
+            artist_url (str): Spotify URL of the artist.
+        
+        Returns:
+            dict: Result of the refresh operation.
+        """
+        try:
+            # Without a watermark the whole discography is crawled, mirroring find_new_related_artists
+            previous = self.spotify_service.crawl_metadata.get(artist_url)
+            incremental = bool(previous and previous["newest_release_date"])
+            
+            new_urls = self.spotify_service.find_new_related_artists(artist_url)
+            if new_urls is None:
+                return {"success": False, "error": f"Failed to refresh {artist_url}"}
+            
+            # Tracks on new releases add to the strength of existing connections; a full
+            # crawl counted every shared track, so its counts replace the stored ones
+            connections = self.graph_service.get_connection_strengths(artist_url)
+            added = [url for url in new_urls if url not in connections]
+            for url, shared_tracks in new_urls.items():
+                connections[url] = connections.get(url, 0) + shared_tracks if incremental else shared_tracks
+            if new_urls and not self.graph_service.add_artist_connections(artist_url, connections):
+                return {"success": False, "error": "Failed to save connections to database"}
+            
+            return {
+                "success": True,
+                "artist": artist_url,
+                "connections_found": len(connections),
+                "connections_added": len(added),
+                "message": f"Added {len(added)} new connections"
+            }
+            
+        except Exception as e:
+            error_msg = f"Error refreshing network for {artist_url}: {str(e)}"
+            logger.error(error_msg)
+            return {"success": False, "error": error_msg}
+    
+    def refresh_stale_artists(self, limit: Optional[int] = None,
+                              max_age: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Refresh job: incrementally recrawl the artists with the oldest crawls.
+        
+        Artists stored in the graph without crawl metadata (crawled before it
+        was recorded) are treated as stale first.
+        
+        Args:
+            limit (int): Maximum number of artists to refresh (CRAWL_REFRESH_BATCH).
+            max_age (float): Seconds after which a crawl is stale (CRAWL_REFRESH_MAX_AGE).
+        
+        Returns:
+            dict: Number of artists refreshed and connections added.
+        """
+        limit = limit if limit is not None else Config.CRAWL_REFRESH_BATCH
+        max_age = max_age if max_age is not None else Config.CRAWL_REFRESH_MAX_AGE
+        crawl_metadata = self.spotify_service.crawl_metadata
+        
+        artist_urls = [url for url in self.graph_service.read_adjacency_list() if not crawl_metadata.get(url)]
+        artist_urls = artist_urls[:limit]
+        artist_urls += [
+            f"https://open.spotify.com/artist/{artist_id}"
+            for artist_id in crawl_metadata.stale_artists(max_age, limit - len(artist_urls))
+        ]
+        
+        refreshed = 0
+        added = 0
+        for artist_url in artist_urls:
+            result = self.refresh_artist_network(artist_url)
+            if result.get("success"):
+                refreshed += 1
+                added += result.get("connections_added", 0)
+        
+        logger.info(f"Refresh job recrawled {refreshed} artists and added {added} connections")
+        return {"artists_refreshed": refreshed, "connections_added": added}
+    
     def get_artist_info(self, artist_name: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about an artist.
@@ -220,7 +698,7 @@ class SearchService:
             dict: Artist information or None if not found.
         """
         try:
-            artist_url = self.spotify_service.get_artist_url(artist_name)
+            artist_url = self.resolve_artist_url(artist_name)
             if not artist_url:
                 return None
             
@@ -247,15 +725,188 @@ class SearchService:
             logger.error(f"Error getting artist info for {artist_name}: {e}")
             return None
     
+    def index_ready(self) -> bool:
+        """
+        Check whether the compact graph has been built.
+        
+        Starts its first build in the background if not, so endpoints that
+        need it can answer "not ready" instead of building it themselves.
+        
+        Returns:
+            bool: True once a compact graph is available.
+        """
+        return self.graph_service.compact_graph(wait=False) is not None
+    
+    def get_separation_bounds(self, artist1_name: str, artist2_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get instant landmark bounds on the degrees of separation of two artists.
+        
+        Args:
+            artist1_name (str): Name of the first artist.
+            artist2_name (str): Name of the second artist.
+        
+        Returns:
+            dict: lower_bound, upper_bound, connected and graph_version, or
+            None if either artist is unknown or not in the indexed graph (or
+            the graph is not indexed yet, see index_ready).
+        """
+        try:
+            start_url = self.resolve_artist_url(artist1_name)
+            end_url = self.resolve_artist_url(artist2_name)
+            if not start_url or not end_url:
+                return None
+            
+            bounds = self.graph_service.separation_bounds(start_url, end_url)
+            if bounds:
+                bounds["start_artist"] = artist1_name
+                bounds["end_artist"] = artist2_name
+            return bounds
+            
+        except Exception as e:
+            logger.error(f"Error getting separation bounds for {artist1_name} and {artist2_name}: {e}")
+            return None
+    
+    def get_walk_counts(self, artist1_name: str, artist2_name: Optional[str], max_length: int,
+                        top: int = 10) -> Optional[Dict[str, Any]]:
+        """
+        Count the walks of length 1..max_length from one artist to another,
+        or to the artists with the most walks if no second artist is given.
+        
+        Args:
+            artist1_name (str): Name of the first artist.
+            artist2_name (str): Name of the second artist, or None.
+            max_length (int): Longest walk to count.
+            top (int): Artists to list without a second artist.
+        
+        Returns:
+            dict: Walk counts (see GraphService.walk_counts) with artist names,
+            or None if an artist is unknown or not in the indexed graph.
+        """
+        try:
+            start_url = self.resolve_artist_url(artist1_name)
+            end_url = self.resolve_artist_url(artist2_name) if artist2_name else None
+            if not start_url or (artist2_name and not end_url):
+                return None
+            
+            result = self.graph_service.walk_counts(start_url, max_length, end_url, top)
+            if result is None:
+                return None
+            result["start_artist"] = artist1_name
+            if artist2_name:
+                result["end_artist"] = artist2_name
+            else:
+                top_artists = result["top"]
+                for artist, name in zip(top_artists, self._render_path_names([artist["url"] for artist in top_artists])):
+                    artist["name"] = name
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error counting walks from {artist1_name}: {e}")
+            return None
+    
+    def get_bridge_artists(self, limit: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the artists that connect the most scenes (highest betweenness).
+        
+        Args:
+            limit (int): Number of artists.
+        
+        Returns:
+            dict: Ranking with artist names (see GraphService.bridge_artists),
+            or None if no betweenness job has run.
+        """
+        try:
+            bridges = self.graph_service.bridge_artists(limit)
+            if bridges is None:
+                return None
+            artists = bridges["artists"]
+            for artist, name in zip(artists, self._render_path_names([artist["url"] for artist in artists])):
+                artist["name"] = name
+            return bridges
+            
+        except Exception as e:
+            logger.error(f"Error getting bridge artists: {e}")
+            return None
+    
+    def stream_neighborhood(self, artist_url: str, hops: int, limit: int) -> Optional[Iterator[Dict[str, Any]]]:
+        """
+        Stream the artists within some degrees of an artist.
+        
+        Args:
+            artist_url (str): URL of the artist at the center.
+            hops (int): Largest distance to include.
+            limit (int): Maximum number of artists to list.
+        
+        Returns:
+            iterator: Records to stream, or None if the artist has not been
+            crawled. An "artist" record (url, name, distance) is produced per
+            artist, a "level" record (distance, count) as soon as a level is
+            complete, and a final "summary" record with the counts per level
+            and whether the node cap cut the neighborhood short.
+        """
+        snapshot = self.graph_service.snapshot()  # Pin one graph version for the whole stream
+        if artist_url not in snapshot:
+            return None
+        return self._neighborhood_records(artist_url, hops, limit, snapshot)
+    
+    def _neighborhood_records(self, artist_url: str, hops: int, limit: int,
+                              snapshot: GraphSnapshot) -> Iterator[Dict[str, Any]]:
+        name_index = self.spotify_service.name_index
+        levels: Dict[int, int] = {}
+        truncated = False
+        try:
+            # One artist past the cap tells whether the cap cut anything off
+            for url, distance in self.graph_service.neighborhood(artist_url, hops, limit + 1, snapshot):
+                if sum(levels.values()) == limit:
+                    truncated = True
+                    break
+                if distance not in levels:
+                    if levels:
+                        yield {"type": "level", "distance": distance - 1, "count": levels[distance - 1]}
+                    levels[distance] = 0
+                levels[distance] += 1
+                yield {"type": "artist", "url": url, "name": name_index.get_name(url), "distance": distance}
+            
+            if levels and not truncated:
+                last = max(levels)
+                yield {"type": "level", "distance": last, "count": levels[last]}
+        except Exception as e:
+            logger.error(f"Error listing the neighborhood of {artist_url}: {e}")
+            yield {"type": "error", "error": "Internal server error"}
+            return
+        
+        yield {
+            "type": "summary",
+            "url": artist_url,
+            "name": name_index.get_name(artist_url),
+            "hops": hops,
+            "levels": [{"distance": distance, "count": count} for distance, count in sorted(levels.items())],
+            "total": sum(levels.values()),
+            "truncated": truncated,
+            "graph_version": snapshot.version
+        }
+    
     def get_database_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the current database.
         
         Returns:
-            dict: Database statistics.
+            dict: Database statistics, including the most connected artists, the
+            landmark artists of the search index, and the sampled degrees of
+            separation and the communities once they are computed.
         """
         try:
-            return self.graph_service.get_graph_stats()
+            stats = self.graph_service.get_graph_stats()
+            landmarks = stats.get("landmarks") or []
+            separation = stats.get("separation") or {}
+            communities = stats.get("communities") or {}
+            artists = (stats.get("most_connected_artists", []) + landmarks
+                       + separation.get("central_artists", []) + separation.get("peripheral_artists", [])
+                       + communities.get("largest", []))
+            names = self._render_path_names([artist["url"] for artist in artists])
+            for artist, name in zip(artists, names):
+                artist["name"] = name
+            return stats
         except Exception as e:
             logger.error(f"Error getting database stats: {e}")
             return {"total_artists": 0, "total_connections": 0, "average_connections": 0}
\ No newline at end of file
@@ -0,0 +1,236 @@
+import os
+import json
+import time
+import random
+import logging
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .compact_graph import CompactGraph
+from .graph_workers import map_over_graph, split, worker_count
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+# Share of reachable pairs within the effective diameter
+EFFECTIVE_DIAMETER_FRACTION = 0.9
+
+def _sample_distances(offsets: array, targets: array,
+                      sources: Sequence[int]) -> Tuple[List[int], List[Tuple[int, Tuple[int, int]]]]:
+    """BFS from every source, returning pairs per distance and (source, (eccentricity, artists reached))."""
+    node_count = len(offsets) - 1
+    histogram = [0]
+    eccentricities = []
+    for source in sources:
+        visited = bytearray(node_count)
+        visited[source] = 1
+        frontier = [source]
+        depth = 0
+        reached = 0
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            depth += 1
+            if depth == len(histogram):
+                histogram.append(0)
+            histogram[depth] += len(next_frontier)
+            reached += len(next_frontier)
+            frontier = next_frontier
+        eccentricities.append((source, (depth, reached)))
+    return histogram, eccentricities
+
+class SeparationStats:
+    """
+    Degrees of separation estimated from BFS traversals of sampled artists.
+    
+    Exact all-pairs distances take one BFS per artist; a few hundred BFS
+    from random crawled artists estimate the distance distribution over
+    all reachable pairs closely, and give the exact eccentricity (longest
+    shortest path) and reach of every sampled artist. The traversals run
+    in worker processes, and the result is saved with the graph's
+    fingerprint so it is computed once per graph version, not per request.
+    """
+    
+    def __init__(self, graph: CompactGraph, histogram: List[int], eccentricities: Dict[int, Tuple[int, int]],
+                 elapsed: float = 0.0):
+        """
+        Initialize the statistics of a graph.
+        
+        Args:
+            graph (CompactGraph): The graph they describe.
+            histogram (list): Sampled reachable pairs per distance (index 0 unused).
+            eccentricities (dict): Node ID -> (eccentricity, artists reached) of
+                each sampled artist.
+            elapsed (float): Seconds the sampling took.
+        """
+        self.graph = graph
+        self.histogram = histogram
+        self.eccentricities = eccentricities
+        self.elapsed = elapsed
+    
+    @classmethod
+    def build(cls, graph: CompactGraph, sample_size: int, processes: Optional[int] = None,
+              seed: Optional[int] = None) -> "SeparationStats":
+        """
+        Sample BFS traversals of a graph in worker processes.
+        
+        Args:
+            graph (CompactGraph): Graph to analyze.
+            sample_size (int): Number of source artists.
+            processes (int): Worker processes; defaults to GRAPH_ANALYTICS_WORKERS.
+            seed (int): Sampling seed; defaults to the graph's fingerprint, so a
+                graph version always gets the same estimate.
+        
+        Returns:
+            SeparationStats: The estimate.
+        """
+        started = time.time()
+        crawled = [node for node in range(graph.node_count) if graph.offsets[node + 1] > graph.offsets[node]]
+        rng = random.Random(seed if seed is not None else graph.fingerprint())
+        sources = rng.sample(crawled, min(sample_size, len(crawled)))
+        
+        processes = worker_count(processes)
+        histogram = [0]
+        eccentricities = {}
+        for chunk_histogram, chunk_eccentricities in map_over_graph(graph, _sample_distances,
+                                                                    split(sources, processes), processes):
+            histogram.extend([0] * (len(chunk_histogram) - len(histogram)))
+            for distance, pairs in enumerate(chunk_histogram):
+                histogram[distance] += pairs
+            eccentricities.update(chunk_eccentricities)
+        
+        stats = cls(graph, histogram, eccentricities, time.time() - started)
+        logger.info(f"Separation statistics sampled from {len(sources)} artists with {processes} workers "
+                    f"in {stats.elapsed:.2f}s")
+        return stats
+    
+    @classmethod
+    def open_if_current(cls, graph: CompactGraph, path: str) -> Optional["SeparationStats"]:
+        """
+        Load saved statistics if they were computed for exactly this graph.
+        
+        Args:
+            graph (CompactGraph): The graph to describe.
+            path (str): Path of the statistics file.
+        
+        Returns:
+            SeparationStats: The saved statistics, or None if they must be recomputed.
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as file:
+                saved = json.load(file)
+            if saved.get("format") != FORMAT_VERSION or saved.get("fingerprint") != graph.fingerprint():
+                logger.info(f"Not using separation statistics in {path}: built for a different graph")
+                return None
+            eccentricities = {graph.ids[url]: tuple(sampled) for url, sampled in saved["eccentricities"].items()}
+            return cls(graph, saved["histogram"], eccentricities, saved.get("elapsed", 0.0))
+        except (ValueError, KeyError, OSError) as e:
+            logger.info(f"Not using separation statistics in {path}: {e}")
+            return None
+    
+    def save(self, path: str):
+        """
+        Write the statistics atomically, tagged with the graph's fingerprint.
+        
+        Args:
+            path (str): Path of the statistics file.
+        """
+        temp_file = f"{path}.{os.getpid()}.tmp"
+        with open(temp_file, "w") as file:
+            json.dump({
+                "format": FORMAT_VERSION,
+                "fingerprint": self.graph.fingerprint(),
+                "histogram": self.histogram,
+                "eccentricities": {self.graph.urls[node]: sampled for node, sampled in self.eccentricities.items()},
+                "elapsed": self.elapsed
+            }, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, path)
+    
+    @property
+    def pair_count(self) -> int:
+        return sum(self.histogram)
+    
+    @property
+    def average_separation(self) -> Optional[float]:
+        """Mean degrees of separation over sampled reachable pairs."""
+        pairs = self.pair_count
+        if not pairs:
+            return None
+        return sum(distance * count for distance, count in enumerate(self.histogram)) / pairs
+    
+    def effective_diameter(self, fraction: float = EFFECTIVE_DIAMETER_FRACTION) -> Optional[float]:
+        """
+        Get the distance within which a share of the reachable pairs lie.
+        
+        Args:
+            fraction (float): Share of the pairs, 0.9 by convention.
+        
+        Returns:
+            float: The distance, interpolated between whole hops, or None
+            without samples.
+        """
+        wanted = fraction * self.pair_count
+        if not wanted:
+            return None
+        covered = 0
+        for distance, count in enumerate(self.histogram):
+            if count and covered + count >= wanted:
+                return distance - 1 + (wanted - covered) / count
+            covered += count
+        return float(len(self.histogram) - 1)
+    
+    def eccentricity(self, node: int) -> Optional[int]:
+        """Get the eccentricity of a node, or None if it was not sampled."""
+        sampled = self.eccentricities.get(node)
+        return sampled[0] if sampled else None
+    
+    def describe(self, top: int = 5) -> Dict[str, Any]:
+        """
+        Summarize the statistics.
+        
+        Args:
+            top (int): Most central and most peripheral sampled artists to list.
+        
+        Returns:
+            dict: Sample size, distance distribution, average separation,
+            effective and largest observed diameter, and the sampled artists
+            with the lowest and highest eccentricity. Only artists reaching at
+            least half as many artists as the best connected one are ranked,
+            since one whose collaborators were never crawled trivially has a
+            tiny eccentricity.
+        """
+        average = self.average_separation
+        effective = self.effective_diameter()
+        most_reached = max((reached for _, reached in self.eccentricities.values()), default=0)
+        ranked = sorted(((node, sampled) for node, sampled in self.eccentricities.items()
+                         if 2 * sampled[1] >= most_reached),
+                        key=lambda item: (item[1][0], -item[1][1]))
+        
+        def artists(items):
+            return [{"url": self.graph.urls[node], "eccentricity": eccentricity, "reached": reached}
+                    for node, (eccentricity, reached) in items]
+        
+        return {
+            "sampled_artists": len(self.eccentricities),
+            "sampled_pairs": self.pair_count,
+            "distance_distribution": {str(distance): count for distance, count in enumerate(self.histogram) if count},
+            "average_separation": round(average, 3) if average is not None else None,
+            "effective_diameter": round(effective, 3) if effective is not None else None,
+            "max_observed_distance": max((eccentricity for eccentricity, _ in self.eccentricities.values()),
+                                         default=None),
+            "central_artists": artists(ranked[:top]),
+            "peripheral_artists": artists(ranked[::-1][:top]),
+            "graph_version": self.graph.version,
+            "elapsed": round(self.elapsed, 3)
+        }
\ No newline at end of file
@@ -0,0 +1,67 @@
+import requests
+import spotipy
+from spotipy.oauth2 import SpotifyClientCredentials
+from typing import Optional, List, Dict, Any, Protocol
+
+from config import Config
+
+class SpotifyClient(Protocol):
+    """
+    The subset of the Spotipy client used by SpotifyService.
+    
+    Anything implementing these methods with Spotipy's signatures and
+    response shapes can be passed to SpotifyService as its client, e.g.
+    FakeSpotifyClient for offline benchmarking and testing.
+    """
+    
+    def search(self, q: str, limit: int = 10, offset: int = 0, type: str = "track",
+               market: Optional[str] = None) -> Dict[str, Any]: ...
+    
+    def artist(self, artist_id: str) -> Dict[str, Any]: ...
+    
+    def artist_albums(self, artist_id: str, album_type: Optional[str] = None, country: Optional[str] = None,
+                      limit: int = 20, offset: int = 0) -> Dict[str, Any]: ...
+    
+    def albums(self, albums: List[str], market: Optional[str] = None) -> Dict[str, Any]: ...
+    
+    def album_tracks(self, album_id: str, limit: int = 50, offset: int = 0,
+                     market: Optional[str] = None) -> Dict[str, Any]: ...
+
+def create_spotify_client() -> SpotifyClient:
+    """
+    Create the Spotify client selected by Config.SPOTIFY_CLIENT.
+    
+    "spotify" (the default) authenticates against the Spotify Web API and
+    requires credentials; "fake" builds an in-process FakeSpotifyClient.
+    
+    Returns:
+        SpotifyClient: The client.
+    
+    Raises:
+        ValueError: If the configuration is invalid.
+    """
+    Config.validate_config()
+    
+    if Config.SPOTIFY_CLIENT == "fake":
+        from .fake_spotify import FakeSpotifyClient
+        return FakeSpotifyClient.from_config()
+    
+    # Authenticate with Spotify API
+    client_credentials_manager = SpotifyClientCredentials(
+        client_id=Config.SPOTIFY_CLIENT_ID,
+        client_secret=Config.SPOTIFY_CLIENT_SECRET
+    )
+    
+    # Keep-alive connection pool large enough for concurrent crawling
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=Config.CRAWLER_CONCURRENCY,
+        pool_maxsize=Config.CRAWLER_CONCURRENCY
+    )
+    session.mount("https://", adapter)
+    
+    return spotipy.Spotify(
+        client_credentials_manager=client_credentials_manager,
+        requests_timeout=Config.REQUEST_TIMEOUT,
+        requests_session=session
+    )
\ No newline at end of file
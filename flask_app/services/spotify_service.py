@@ -1,10 +1,17 @@
 import time
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials
+import threading
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 
 from config import Config
+from .name_index import NameIndex
+from .metadata_store import ArtistMetadataStore
+from .crawl_metadata import CrawlMetadataStore
+from .resolution_cache import ResolutionCache
+from .rate_limiter import TokenBucket
+from .concurrent_crawler import ConcurrentCrawler
+from .response_cache import ResponseCache, IMMUTABLE
+from .spotify_client import SpotifyClient, create_spotify_client
 
 logger = logging.getLogger(__name__)
 
@@ -16,28 +23,181 @@ class SpotifyService:
     including rate limiting, error handling, and retry logic.
     """
     
-    def __init__(self):
-        """Initialize Spotify service with authentication."""
-        Config.validate_config()
+    # Spotify Web API page size limits
+    ARTIST_ALBUMS_PAGE_SIZE = 50
+    ALBUM_BATCH_SIZE = 20
+    ALBUM_TRACKS_PAGE_SIZE = 50
+    
+    def __init__(self, name_index: Optional[NameIndex] = None,
+                 metadata_store: Optional[ArtistMetadataStore] = None,
+                 client: Optional[SpotifyClient] = None):
+        """
+        Initialize Spotify service with authentication.
         
-        # Authenticate with Spotify API
-        client_credentials_manager = SpotifyClientCredentials(
-            client_id=Config.SPOTIFY_CLIENT_ID,
-            client_secret=Config.SPOTIFY_CLIENT_SECRET
+        Args:
+            name_index: Local artist name index filled while crawling.
+            metadata_store: Local artist metadata store filled from artist lookups.
+            client: Spotify client to use instead of the one selected by
+                Config.SPOTIFY_CLIENT (e.g. a FakeSpotifyClient).
+        """
+        self.name_index = name_index if name_index is not None else NameIndex()
+        self.metadata_store = metadata_store if metadata_store is not None else ArtistMetadataStore()
+        self.crawl_metadata = CrawlMetadataStore()
+        self.resolution_cache = ResolutionCache(
+            max_size=Config.RESOLUTION_CACHE_SIZE,
+            ttl=Config.RESOLUTION_CACHE_TTL,
+            negative_ttl=Config.RESOLUTION_CACHE_NEGATIVE_TTL
         )
         
-        self.sp = spotipy.Spotify(
-            client_credentials_manager=client_credentials_manager,
-            requests_timeout=Config.REQUEST_TIMEOUT
+        # Global request budget shared by every thread issuing API calls
+        self.rate_limiter = TokenBucket(
+            rate=1.0 / Config.RATE_LIMIT_DELAY if Config.RATE_LIMIT_DELAY > 0 else 0,
+            capacity=Config.RATE_LIMIT_BURST
         )
         
+        # Spotipy client, or any stand-in implementing the same methods
+        self.sp = client if client is not None else create_spotify_client()
+        
+        self.crawler = ConcurrentCrawler(self, Config.CRAWLER_CONCURRENCY) if Config.CRAWLER_CONCURRENCY > 1 else None
+        
+        # On-disk cache of album and artist-album responses
+        self.response_cache = ResponseCache() if Config.RESPONSE_CACHE_ENABLED else None
+        self._album_total_probes: Dict[str, Tuple[int, float]] = {}
+        self._probe_lock = threading.Lock()
+        
+        # API requests sent (including retries), used for per-search request budgets
+        self.request_count = 0
+        self._request_count_lock = threading.Lock()
+        
         logger.info("Spotify service initialized successfully")
     
     def safe_request(self, func, *args, **kwargs):
+        """
+        Executes a Spotify API request, consulting the on-disk response cache first.
+        
+        Album payloads are immutable and served from the cache whenever
+        present (batched album requests only fetch the albums not cached yet).
+        Artist album listings older than RESPONSE_CACHE_REVALIDATE_AFTER are
+        revalidated with a one-item request comparing the album count. Other
+        requests always go to the API.
+        
+        Args:
+            func: The Spotipy function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+        
+        Returns:
+            The result of the Spotipy API call.
+        
+        Raises:
+            Exception: If all retries fail or rate-limiting persists.
+        """
+        policy = ResponseCache.policy(func) if self.response_cache else None
+        if policy is None:
+            return self._request(func, *args, **kwargs)
+        
+        if getattr(func, "__name__", "") == "albums":
+            return self._cached_albums(func, *args, **kwargs)
+        
+        key = ResponseCache.request_key(func, args, kwargs)
+        entry = self.response_cache.get(key)
+        if entry and self._is_fresh(policy, key, entry, func, args, kwargs):
+            return entry["payload"]
+        
+        result = self._request(func, *args, **kwargs)
+        self.response_cache.put(key, result)
+        return result
+    
+    def _is_fresh(self, policy: str, key: str, entry: Dict[str, Any], func, args: tuple, kwargs: Dict[str, Any]) -> bool:
+        """
+        Decide whether a cached response can be served.
+        
+        Args:
+            policy (str): Cache policy of the request.
+            key (str): Request key of the cached entry.
+            entry (dict): Cached entry.
+            func: The Spotipy function being called.
+            args (tuple): Positional arguments (artist ID first for artist albums).
+            kwargs (dict): Keyword arguments.
+        
+        Returns:
+            bool: True if the cached payload is still valid.
+        """
+        if policy == IMMUTABLE:
+            return True
+        
+        # Conditional revalidation: one album-count probe per artist answers for all of its pages
+        artist_id = args[0]
+        with self._probe_lock:
+            probe = self._album_total_probes.get(artist_id)
+        if not probe or time.time() - probe[1] >= Config.RESPONSE_CACHE_PROBE_TTL:
+            if time.time() - entry["stored_at"] < Config.RESPONSE_CACHE_REVALIDATE_AFTER:
+                return True
+            probe_kwargs = {name: value for name, value in kwargs.items() if name not in ("limit", "offset")}
+            total = self._request(func, artist_id, limit=1, **probe_kwargs)["total"]
+            probe = self._record_album_total(artist_id, total)
+        
+        if probe[0] != entry["total"]:
+            return False
+        if time.time() - entry["stored_at"] >= Config.RESPONSE_CACHE_REVALIDATE_AFTER:
+            self.response_cache.touch(key, entry)
+        return True
+    
+    def _record_album_total(self, artist_id: str, total: int) -> Tuple[int, float]:
+        """
+        Remember a freshly observed album count used to revalidate cached listings.
+        
+        Args:
+            artist_id (str): Spotify ID of the artist.
+            total (int): Album count returned by Spotify.
+        
+        Returns:
+            tuple: (total, observed_at).
+        """
+        probe = (total, time.time())
+        with self._probe_lock:
+            self._album_total_probes[artist_id] = probe
+        return probe
+    
+    def _cached_albums(self, func, album_ids: List[str], **kwargs) -> Dict[str, Any]:
+        """
+        Serve a several-albums request album by album from the cache.
+        
+        Albums are cached individually so a batch only fetches the albums
+        not seen before, however the batches are cut.
+        
+        Args:
+            func: The Spotipy several-albums function.
+            album_ids (list): Spotify album IDs.
+            **kwargs: Keyword arguments for the function.
+        
+        Returns:
+            dict: {"albums": [...]} in the requested order.
+        """
+        albums = {}
+        keys = {album_id: ResponseCache.request_key(func, ([album_id],), kwargs) for album_id in album_ids}
+        for album_id, key in keys.items():
+            entry = self.response_cache.get(key)
+            if entry:
+                albums[album_id] = entry["payload"]
+        
+        missing = [album_id for album_id in album_ids if album_id not in albums]
+        if missing:
+            result = self._request(func, missing, **kwargs)
+            for album_id, album in zip(missing, result["albums"]):
+                albums[album_id] = album
+                if album:
+                    self.response_cache.put(keys[album_id], album)
+        
+        return {"albums": [albums.get(album_id) for album_id in album_ids]}
+    
+    def _request(self, func, *args, **kwargs):
         """
         Executes a Spotify API request with retry logic, handling rate limits.
         
-        Preserves the exact functionality from the original implementation.
+        Every request takes a token from the shared rate limiter, so
+        concurrent callers together stay within the request budget. A 429
+        response with a Retry-After header holds back all callers.
         
         Args:
             func: The Spotipy function to call.
@@ -57,35 +217,77 @@ class SpotifyService:
             try:
                 # Log the request time
                 logger.debug("Sending Spotify API request...")
-                time.sleep(Config.RATE_LIMIT_DELAY)  # Rate limit: 3 requests per second
+                self.rate_limiter.acquire()  # Rate limit: 3 requests per second by default
+                with self._request_count_lock:
+                    self.request_count += 1
                 
                 # Execute the function
                 return func(*args, **kwargs)
             except Exception as e:
                 logger.warning(f"Error in Spotify API request: {e}")
                 if attempt < max_retries - 1:
-                    logger.info(f"Retrying in {delay} seconds...")
-                    time.sleep(delay)
+                    retry_after = self._retry_after(e)
+                    if retry_after is not None:
+                        self.rate_limiter.pause(retry_after)
+                        logger.info(f"Rate limited, pausing requests for {retry_after} seconds...")
+                    else:
+                        logger.info(f"Retrying in {delay} seconds...")
+                        time.sleep(delay)
                 else:
                     logger.error("Maximum retries reached. Request failed.")
                     raise
     
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """
+        Extract the Retry-After delay from a 429 Spotify error.
+        
+        Args:
+            error: Exception raised by a Spotipy call.
+        
+        Returns:
+            float: Seconds to wait, or None if the error is not a 429 with Retry-After.
+        """
+        if getattr(error, "http_status", None) != 429:
+            return None
+        headers = getattr(error, "headers", None) or {}
+        try:
+            return float(headers.get("Retry-After", headers.get("retry-after")))
+        except (TypeError, ValueError):
+            return None
+    
     def get_artist_url(self, artist_name: str) -> Optional[str]:
         """
         Gets the Spotify URL for an artist by name.
         
+        Resolutions (including misses) are cached under the normalized name,
+        so repeated lookups of popular artists skip the API entirely.
+        
         Args:
             artist_name (str): The name of the artist.
         
         Returns:
             str: Spotify URL for the artist or None if not found.
         """
+        found, cached_url = self.resolution_cache.get(artist_name)
+        if found:
+            logger.debug(f"Resolution cache hit for '{artist_name}'")
+            return cached_url
+        
         try:
             result = self.safe_request(self.sp.search, q=artist_name, type="artist", limit=1)
             if not result["artists"]["items"]:
                 logger.info(f"No artist found with name: {artist_name}")
+                self.resolution_cache.put(artist_name, None)
                 return None
-            return result["artists"]["items"][0]["external_urls"]["spotify"]
+            artist = result["artists"]["items"][0]
+            self.name_index.record_name(artist["id"], artist["name"])
+            self.metadata_store.record_artist(artist)
+            self.name_index.flush()
+            self.metadata_store.flush()
+            artist_url = artist["external_urls"]["spotify"]
+            self.resolution_cache.put(artist_name, artist_url)
+            return artist_url
         except Exception as e:
             logger.error(f"Error getting artist URL for '{artist_name}': {e}")
             return None
@@ -103,7 +305,11 @@ class SpotifyService:
         try:
             artist_id = artist_url.split("/")[-1]
             result = self.safe_request(self.sp.artist, artist_id)
-            return result["name"] if result else None
+            if not result:
+                return None
+            self.name_index.record_name(artist_id, result["name"])
+            self.metadata_store.record_artist(result)
+            return result["name"]
         except Exception as e:
             logger.error(f"Error fetching artist name for URL '{artist_url}': {e}")
             return None
@@ -124,6 +330,8 @@ class SpotifyService:
             artists = []
             
             for artist in result["artists"]["items"]:
+                self.name_index.record_name(artist["id"], artist["name"])
+                self.metadata_store.record_artist(artist)
                 artists.append({
                     "name": artist["name"],
                     "url": artist["external_urls"]["spotify"],
@@ -134,47 +342,311 @@ class SpotifyService:
                     "image": artist["images"][0]["url"] if artist["images"] else None
                 })
             
+            self.name_index.flush()
+            self.metadata_store.flush()
             return artists
         except Exception as e:
             logger.error(f"Error searching artists with query '{query}': {e}")
             return []
     
-    def find_related_artists(self, artist_url: str) -> List[str]:
+    def get_artist_albums(self, artist_id: str) -> List[Dict[str, Any]]:
+        """
+        Gets all albums and singles of an artist.
+        
+        Follows the `next` links of the artist-albums endpoint so prolific
+        artists are not truncated to the first page.
+        
+        Args:
+            artist_id (str): Spotify ID of the artist.
+        
+        Returns:
+            list: Simplified album objects in the order Spotify returns them, without duplicates.
+        """
+        albums = []
+        offset = 0
+        while True:
+            page = self.safe_request(
+                self.sp.artist_albums, 
+                artist_id, 
+                album_type="album,single", 
+                country="US",
+                limit=self.ARTIST_ALBUMS_PAGE_SIZE,
+                offset=offset
+            )
+            albums.extend(page["items"])
+            offset += self.ARTIST_ALBUMS_PAGE_SIZE
+            if not page.get("next") or not page["items"]:
+                break
+        
+        unique_albums = {}
+        for album in albums:
+            unique_albums.setdefault(album["id"], album)
+        return list(unique_albums.values())
+    
+    @staticmethod
+    def select_albums(albums: List[Dict[str, Any]], newer_than: Optional[str] = None,
+                      crawled_album_ids: Optional[List[str]] = None) -> List[str]:
+        """
+        Pick the album IDs to fetch tracks for.
+        
+        Albums released on the watermark date itself are selected unless they
+        are among the crawled ones, so a recrawl never counts the tracks of an
+        album twice but still finds a release that came out the same day.
+        
+        Args:
+            albums (list): Simplified album objects.
+            newer_than (str): Release-date watermark; only albums released
+                after it are selected. None selects every album.
+            crawled_album_ids (list): Albums released on the watermark date
+                that were already crawled. None (not recorded) selects none
+                released that day.
+        
+        Returns:
+            list: Album IDs.
+        """
+        if not newer_than:
+            return [album["id"] for album in albums]
+        crawled = set(crawled_album_ids) if crawled_album_ids is not None else None
+        selected = []
+        for album in albums:
+            release_date = album.get("release_date") or ""
+            if release_date > newer_than or (
+                    release_date == newer_than and crawled is not None and album["id"] not in crawled):
+                selected.append(album["id"])
+        return selected
+    
+    def get_albums_tracks(self, album_ids: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Yields every track of the given albums.
+        
+        Albums are fetched in batches of 20 through the several-albums
+        endpoint, which embeds the first page of tracks. Only albums with
+        more tracks than fit on that page fall back to `album_tracks`.
+        
+        Args:
+            album_ids (list): Spotify album IDs.
+        
+        Yields:
+            dict: Simplified track objects.
+        """
+        for start in range(0, len(album_ids), self.ALBUM_BATCH_SIZE):
+            batch = self.safe_request(self.sp.albums, album_ids[start:start + self.ALBUM_BATCH_SIZE])
+            for album in batch["albums"]:
+                if not album:
+                    continue
+                
+                tracks = album["tracks"]
+                yield from tracks["items"]
+                
+                # Long albums: page through the remaining tracks
+                offset = len(tracks["items"])
+                while tracks.get("next"):
+                    tracks = self.safe_request(
+                        self.sp.album_tracks, album["id"], limit=self.ALBUM_TRACKS_PAGE_SIZE, offset=offset
+                    )
+                    yield from tracks["items"]
+                    offset += len(tracks["items"])
+                    if not tracks["items"]:
+                        break
+    
+    def crawl_discography(self, artist_id: str, newer_than: Optional[str] = None,
+                          crawled_album_ids: Optional[List[str]] = None
+                          ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Crawls an artist's albums and singles.
+        
+        Uses the concurrent crawler when CRAWLER_CONCURRENCY > 1 and the
+        sequential crawl otherwise; both return the same albums and tracks in
+        the same order.
+        
+        Args:
+            artist_id (str): Spotify ID of the artist.
+            newer_than (str): Release-date watermark; only fetch tracks of
+                albums released after it. None fetches every album.
+            crawled_album_ids (list): Albums released on the watermark date
+                that were already crawled (see select_albums).
+        
+        Returns:
+            tuple: (all albums of the artist, tracks of the selected albums).
+        """
+        if self.crawler:
+            result = self.crawler.crawl_discographies([artist_id], newer_than, crawled_album_ids)[artist_id]
+            if isinstance(result, Exception):
+                raise result
+            return result
+        
+        albums = self.get_artist_albums(artist_id)
+        tracks = list(self.get_albums_tracks(self.select_albums(albums, newer_than, crawled_album_ids)))
+        return albums, tracks
+    
+    def _collect_featured_urls(self, artist_id: str, tracks: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Collects the collaborators on a list of tracks and how often they appear.
+        
+        A song released both as a single and on an album is counted once
+        (see _track_key).
+        
+        Args:
+            artist_id (str): Spotify ID of the crawled artist.
+            tracks (list): Simplified track objects.
+        
+        Returns:
+            dict: URL of every other artist appearing on the tracks -> number
+            of shared tracks, in order of first appearance.
+        """
+        shared_tracks: Dict[str, set] = {}
+        for track in tracks:
+            # Remember every name on the track so paths can be rendered offline
+            self.name_index.record_track_artists(artist_id, track)
+            
+            # Find featured artists (excluding the main artist)
+            for artist in track["artists"]:
+                if artist["id"] != artist_id:
+                    shared_tracks.setdefault(artist["external_urls"]["spotify"], set()).add(self._track_key(track))
+        
+        self.name_index.flush()
+        return {featured_url: len(keys) for featured_url, keys in shared_tracks.items()}
+    
+    @staticmethod
+    def _track_key(track: Dict[str, Any]) -> Any:
+        """
+        Identify a recording across the releases it appears on.
+        
+        The ISRC is used when the track object carries one; otherwise the
+        lowercased name and duration, so two different songs that share a
+        title (e.g. an intro on each album) are still counted separately.
+        
+        Args:
+            track (dict): Simplified or full track object.
+        
+        Returns:
+            ISRC string, or a (name, duration_ms) tuple.
+        """
+        isrc = (track.get("external_ids") or {}).get("isrc")
+        if isrc:
+            return isrc.upper()
+        return (track.get("name") or track.get("id") or "").lower(), track.get("duration_ms")
+    
+    def find_related_artists(self, artist_url: str) -> Dict[str, int]:
         """
         Finds all artists that have a feature with the given artist.
         
-        Preserves the exact functionality from the original implementation.
+        Crawls the artist's full discography (all pages of albums and
+        singles, with album tracks fetched in batches) and records the crawl
+        watermark used by later incremental recrawls.
         
         Args:
             artist_url (str): Spotify URL of the artist.
         
         Returns:
-            list: Related artist URLs.
+            dict: Related artist URL -> number of shared tracks (empty on errors).
         """
         try:
             artist_id = artist_url.split("/")[-1]
-            featured_urls = set()
             
-            # Get all albums and singles for the artist
-            albums = self.safe_request(
-                self.sp.artist_albums, 
-                artist_id, 
-                album_type="album,single", 
-                country="US"
-            )
+            albums, tracks = self.crawl_discography(artist_id)
+            featured_urls = self._collect_featured_urls(artist_id, tracks)
             
-            for album in albums["items"]:
-                # Get tracks for each album
-                tracks = self.safe_request(self.sp.album_tracks, album["id"])
-                for track in tracks["items"]:
-                    # Find featured artists (excluding the main artist)
-                    for artist in track["artists"]:
-                        if artist["id"] != artist_id:
-                            featured_urls.add(artist["external_urls"]["spotify"])
+            newest_release_date = CrawlMetadataStore.newest_release_date(albums)
+            self.crawl_metadata.record_crawl(artist_id, newest_release_date, len(albums),
+                                             CrawlMetadataStore.released_on(albums, newest_release_date))
+            self.crawl_metadata.flush()
             
             logger.info(f"Found {len(featured_urls)} related artists for {artist_url}")
-            return list(featured_urls)
+            return featured_urls
             
         except Exception as e:
             logger.error(f"Error finding related artists for '{artist_url}': {e}")
-            return []
+            return {}
+    
+    def find_related_artists_batch(self, artist_urls: List[str]) -> Dict[str, Dict[str, int]]:
+        """
+        Finds the collaborators of several artists, crawling them concurrently.
+        
+        Args:
+            artist_urls (list): Spotify URLs of the artists.
+        
+        Returns:
+            dict: Artist URL -> (related artist URL -> number of shared tracks),
+            for every artist crawled successfully (artists without features map
+            to an empty dict).
+        """
+        artist_urls_by_id = {artist_url.split("/")[-1]: artist_url for artist_url in artist_urls}
+        if self.crawler:
+            results = self.crawler.crawl_discographies(list(artist_urls_by_id))
+        else:
+            results = {}
+            for artist_id in artist_urls_by_id:
+                try:
+                    results[artist_id] = self.crawl_discography(artist_id)
+                except Exception as e:
+                    results[artist_id] = e
+        
+        related = {}
+        for artist_id, result in results.items():
+            if isinstance(result, Exception):
+                logger.error(f"Error finding related artists for '{artist_urls_by_id[artist_id]}': {result}")
+                continue
+            albums, tracks = result
+            featured_urls = self._collect_featured_urls(artist_id, tracks)
+            newest_release_date = CrawlMetadataStore.newest_release_date(albums)
+            self.crawl_metadata.record_crawl(artist_id, newest_release_date, len(albums),
+                                             CrawlMetadataStore.released_on(albums, newest_release_date))
+            related[artist_urls_by_id[artist_id]] = featured_urls
+        
+        self.crawl_metadata.flush()
+        logger.info(f"Crawled {len(related)} of {len(artist_urls)} artists")
+        return related
+    
+    def find_new_related_artists(self, artist_url: str) -> Optional[Dict[str, int]]:
+        """
+        Finds collaborators on releases newer than the artist's last crawl.
+        
+        A single one-item artist-albums request compares the album count with
+        the one recorded at the last crawl; if it is unchanged nothing else is
+        fetched. Otherwise only albums released after the watermark, or on
+        it but not crawled yet, are crawled. Artists without crawl metadata get a full crawl.
+        
+        Args:
+            artist_url (str): Spotify URL of the artist.
+        
+        Returns:
+            dict: Related artist URL -> number of tracks shared on new releases,
+            or None if the request failed.
+        """
+        try:
+            artist_id = artist_url.split("/")[-1]
+            previous = self.crawl_metadata.get(artist_id)
+            
+            if previous and previous["newest_release_date"]:
+                # Bypass the response cache: this probe is what detects new releases
+                probe = self._request(
+                    self.sp.artist_albums, artist_id, album_type="album,single", country="US", limit=1
+                )
+                self._record_album_total(artist_id, probe["total"])
+                if probe["total"] == previous["album_count"]:
+                    self.crawl_metadata.record_crawl(artist_id, previous["newest_release_date"],
+                                                     previous["album_count"], previous["watermark_album_ids"])
+                    self.crawl_metadata.flush()
+                    logger.info(f"No new releases for {artist_url}")
+                    return {}
+                newer_than = previous["newest_release_date"]
+                crawled_album_ids = previous["watermark_album_ids"]
+            else:
+                newer_than = None
+                crawled_album_ids = None
+            
+            albums, tracks = self.crawl_discography(artist_id, newer_than, crawled_album_ids)
+            featured_urls = self._collect_featured_urls(artist_id, tracks)
+            
+            newest_release_date = CrawlMetadataStore.newest_release_date(albums)
+            self.crawl_metadata.record_crawl(artist_id, newest_release_date, len(albums),
+                                             CrawlMetadataStore.released_on(albums, newest_release_date))
+            self.crawl_metadata.flush()
+            
+            logger.info(f"Found {len(featured_urls)} related artists on new releases for {artist_url}")
+            return featured_urls
+            
+        except Exception as e:
+            logger.error(f"Error refreshing related artists for '{artist_url}': {e}")
+            return None
\ No newline at end of file
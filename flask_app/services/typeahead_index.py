@@ -0,0 +1,180 @@
+import time
+import heapq
+import logging
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Tuple, Any
+
+from config import Config
+from .name_index import NameIndex, ARTIST_URL_PREFIX
+from .metadata_store import ArtistMetadataStore
+from .resolution_cache import normalize_artist_name
+
+logger = logging.getLogger(__name__)
+
+class TypeaheadIndex:
+    """
+    Local prefix index for artist autocomplete.
+    
+    Keys are normalized artist names plus every word-start suffix of them
+    ("the weeknd" is also reachable as "weeknd"), kept in one sorted list
+    and searched with bisect. Matches are ranked by popularity and then by
+    degree in the collaboration graph, as of the last build.
+    
+    Short prefixes ("a", "the") match a large share of all keys, so the
+    top TYPEAHEAD_PREFIX_TOP_K matches of every prefix of up to
+    TYPEAHEAD_SHORT_PREFIX characters are ranked once per build. Longer
+    prefixes rank their whole run of matching keys.
+    
+    The index is rebuilt in the background when the name index has grown
+    and the previous build is older than TYPEAHEAD_REBUILD_INTERVAL.
+    """
+    
+    def __init__(self, name_index: NameIndex, metadata_store: ArtistMetadataStore, graph_service):
+        """
+        Initialize the typeahead index.
+        
+        Args:
+            name_index: Local artist name index.
+            metadata_store: Local artist metadata store.
+            graph_service: Graph service providing artist degrees.
+        """
+        self.name_index = name_index
+        self.metadata_store = metadata_store
+        self.graph_service = graph_service
+        
+        # (sorted keys, artist IDs, full-name flags, names, scores, top matches per short prefix),
+        # swapped atomically on rebuild
+        self._index: Tuple[List[str], List[str], List[bool], Dict[str, str], Dict[str, Tuple[int, int]],
+                           Dict[str, List[Tuple[str, bool]]]] = ([], [], [], {}, {}, {})
+        self._built_version = None
+        self._built_at = 0.0
+        self._rebuilding = False
+        self._lock = threading.Lock()
+    
+    def _source_version(self) -> Tuple[int, int]:
+        return (self.name_index.version, self.metadata_store.version)
+    
+    def rebuild(self):
+        """Rebuild the sorted key array, scores and short-prefix rankings from the current stores."""
+        started = time.time()
+        version = self._source_version()
+        
+        degrees = Counter()
+        for artist_url, related_urls in self.graph_service.read_adjacency_list().items():
+            degrees[NameIndex.artist_id(artist_url)] += len(related_urls)
+            for related_url in related_urls:
+                degrees[NameIndex.artist_id(related_url)] += 1
+        
+        entries = []
+        names = {}
+        for artist_id, name in self.name_index.items():
+            normalized = normalize_artist_name(name)
+            if not normalized:
+                continue
+            names[artist_id] = name
+            entries.append((normalized, artist_id, True))
+            for position, char in enumerate(normalized):
+                if char == " " and position + 1 < len(normalized):
+                    entries.append((normalized[position + 1:], artist_id, False))
+        entries.sort()
+        
+        scores = {artist_id: (self.metadata_store.get_popularity(artist_id), degrees.get(artist_id, 0))
+                  for artist_id in names}
+        short_matches: Dict[str, Dict[str, bool]] = {}
+        for key, artist_id, is_full in entries:
+            for length in range(1, min(Config.TYPEAHEAD_SHORT_PREFIX, len(key)) + 1):
+                matches = short_matches.setdefault(key[:length], {})
+                matches[artist_id] = matches.get(artist_id, False) or is_full
+        top_matches = {
+            prefix: heapq.nlargest(Config.TYPEAHEAD_PREFIX_TOP_K, matches.items(), key=self._rank_key(scores))
+            for prefix, matches in short_matches.items()
+        }
+        
+        with self._lock:
+            self._index = (
+                [entry[0] for entry in entries],
+                [entry[1] for entry in entries],
+                [entry[2] for entry in entries],
+                names,
+                scores,
+                top_matches
+            )
+            self._built_version = version
+            self._built_at = time.time()
+            self._rebuilding = False
+        
+        logger.info(f"Typeahead index rebuilt with {len(names)} artists in {time.time() - started:.2f}s")
+    
+    @staticmethod
+    def _rank_key(scores: Dict[str, Tuple[int, int]]):
+        """Order (artist ID, full-name match) candidates by popularity, degree, then full-name matches first."""
+        return lambda item: scores.get(item[0], (0, 0)) + (item[1],)
+    
+    def _ensure_fresh(self):
+        """Build the index on first use and schedule background rebuilds when stale."""
+        if self._built_version is None:
+            self.rebuild()
+            return
+        
+        if self._rebuilding or self._built_version == self._source_version():
+            return
+        if time.time() - self._built_at < Config.TYPEAHEAD_REBUILD_INTERVAL:
+            return
+        
+        self._rebuilding = True
+        thread = threading.Thread(target=self._rebuild_safely)
+        thread.daemon = True
+        thread.start()
+    
+    def _rebuild_safely(self):
+        try:
+            self.rebuild()
+        except Exception as e:
+            logger.error(f"Error rebuilding typeahead index: {e}")
+            self._rebuilding = False
+    
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Find artists whose name (or a word in it) starts with the query.
+        
+        Args:
+            query (str): Prefix typed by the user.
+            limit (int): Maximum number of results to return.
+        
+        Returns:
+            list: Artist dictionaries in the same shape as SpotifyService.search_artists.
+        """
+        prefix = normalize_artist_name(query)
+        if not prefix:
+            return []
+        
+        self._ensure_fresh()
+        keys, ids, full, names, scores, top_matches = self._index
+        
+        if len(prefix) <= Config.TYPEAHEAD_SHORT_PREFIX and limit <= Config.TYPEAHEAD_PREFIX_TOP_K:
+            ranked = top_matches.get(prefix, [])[:limit]
+        else:
+            # Rank every candidate in the contiguous run of keys sharing the prefix
+            candidates = {}
+            position = bisect_left(keys, prefix)
+            while position < len(keys) and keys[position].startswith(prefix):
+                artist_id = ids[position]
+                candidates[artist_id] = candidates.get(artist_id, False) or full[position]
+                position += 1
+            ranked = heapq.nlargest(limit, candidates.items(), key=self._rank_key(scores))
+        
+        artists = []
+        for artist_id, _ in ranked:
+            metadata = self.metadata_store.get(artist_id) or {}
+            artists.append({
+                "name": names[artist_id],
+                "url": ARTIST_URL_PREFIX + artist_id,
+                "id": artist_id,
+                "popularity": metadata.get("popularity", 0),
+                "genres": metadata.get("genres", []),
+                "followers": metadata.get("followers", 0),
+                "image": metadata.get("image_url")
+            })
+        return artists
\ No newline at end of file